@@ -22,6 +22,12 @@ def a_maz_ing() -> None:
 
     print(f"\nMaze generated & saved to {gen_maze.get_maze().output_file}")
     print(f"Solution Path Length: {len(gen_maze.get_solution_path())}")
+    print(
+        f"Solver: {gen_maze.get_maze().solver} "
+        f"({gen_maze.get_expanded_nodes()} nodes expanded)"
+    )
+    if gen_maze.get_profiler().enabled:
+        print(gen_maze.get_profiler().report())
     print("-" * 30)
     print("1. Show Solution Path")
     print("2. Regenerate New Maze")
@@ -37,6 +43,12 @@ def a_maz_ing() -> None:
         if choice == '1':
             while True:
                 gen_maze.solve_maze(True)
+                print(
+                    f"Solver: {gen_maze.get_maze().solver} "
+                    f"({gen_maze.get_expanded_nodes()} nodes expanded)"
+                )
+                if gen_maze.get_profiler().enabled:
+                    print(gen_maze.get_profiler().report())
 
                 print("1. Regenerate Solution Path")
                 print("2. Regenerate New Maze")
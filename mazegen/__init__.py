@@ -1,4 +1,5 @@
 from .gen_maze import MazeGenerator
+from .grid import Grid
 from .error_class import report_error
 from .playing_mod import player_mode
 from .terminal_ctl import TerminalCtl
@@ -8,5 +9,6 @@ __all__ = [
     "TerminalCtl",
     "player_mode",
     "report_error",
-    "MazeGenerator"
+    "MazeGenerator",
+    "Grid"
 ]
@@ -0,0 +1,74 @@
+import sys
+import argparse
+from .batch import batch_main, parse_seeds
+from .mazefile import convert
+from .maze import Maze
+from .eller import stream_maze
+from .error_class import report_error
+
+
+def main() -> None:
+    """
+    Command line entry point of the mazegen package.
+
+    Usage:
+        python -m mazegen batch config.txt --seeds 1..10000 --jobs 8
+        python -m mazegen convert maze_output.txt maze_output.bin
+        python -m mazegen stream config.txt
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog="python -m mazegen")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch", help="generate many mazes from one template config"
+    )
+    batch.add_argument("config", help="template configuration file")
+    batch.add_argument(
+        "--seeds", type=parse_seeds, required=True,
+        help="seeds to generate, e.g. 1..10000 or 1,5,9..12"
+    )
+    batch.add_argument(
+        "--jobs", type=int, default=None,
+        help="worker processes (defaults to the CPU count)"
+    )
+    batch.add_argument(
+        "--output-dir", default=None,
+        help="directory for the generated files"
+    )
+
+    conv = commands.add_parser(
+        "convert", help="convert a maze file between hex text and binary"
+    )
+    conv.add_argument("source", help="maze file to convert")
+    conv.add_argument("destination", help="converted maze file")
+
+    stream = commands.add_parser(
+        "stream",
+        help="write an ELLER maze to disk row by row; the SOLUTION line "
+        "is left empty, since solving needs the whole grid"
+    )
+    stream.add_argument("config", help="configuration file")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "convert":
+            convert(args.source, args.destination)
+        elif args.command == "stream":
+            maze = Maze.from_config(
+                Maze.MazeParseConfig.parsing_conf(args.config)
+            )
+            rows = stream_maze(maze)
+            print(f"Streamed {rows} rows to {maze.output_file}")
+        else:
+            batch_main(args.config, args.seeds, args.jobs, args.output_dir)
+    except Exception as error:
+        report_error(error)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
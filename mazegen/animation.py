@@ -0,0 +1,114 @@
+import time
+from typing import Callable, Generic, Iterable, List, TypeVar
+
+
+DEFAULT_FPS = 60
+DEFAULT_BUDGET = 5.0
+
+T = TypeVar("T")
+
+
+class FrameScheduler(Generic[T]):
+    """
+    Paces an animation by frames instead of by algorithm steps.
+
+    Every step advances a virtual clock by its nominal duration and queues
+    what it changed; once a frame period of virtual time has passed, the
+    queued changes are drawn in one batch, Enter is polled once, and the
+    scheduler sleeps only for whatever is left of the frame. The nominal
+    step time is shrunk so that ``expected`` steps never take more than
+    ``budget`` seconds, so a 15x15 maze keeps its step-by-step pace while
+    a 1000x1000 one packs thousands of steps into each frame. When drawing
+    falls behind, the next frame waits for a period past the real clock,
+    and the steps in between are merged into it.
+
+    Attributes:
+        skipped (bool): Whether Enter was pressed; later steps are ignored.
+        frames (int): Number of frames drawn so far.
+    """
+
+    __slots__ = (
+        "skipped", "frames", "__draw", "__poll", "__sleep", "__period",
+        "__step_time", "__start", "__virtual", "__next_frame", "__pending"
+    )
+
+    def __init__(
+        self,
+        draw: Callable[[List[T]], None],
+        poll: Callable[[], bool],
+        sleep: Callable[[float], None],
+        fps: int = DEFAULT_FPS,
+        step_time: float = 0.001,
+        expected: int = 1,
+        budget: float = DEFAULT_BUDGET
+    ) -> None:
+        """
+        Starts the clock of a new animation.
+
+        Args:
+            draw (Callable[[List[T]], None]): Draws the changes queued
+            since the last frame.
+            poll (Callable[[], bool]): Returns True once Enter was pressed.
+            sleep (Callable[[float], None]): Waits for the given seconds.
+            fps (int): Target frames per second.
+            step_time (float): Nominal duration of one step in seconds.
+            expected (int): Estimated number of steps of the animation.
+            budget (float): Longest the whole animation may take, in
+            seconds, when ``expected`` is right.
+
+        Returns:
+            None
+        """
+        self.skipped = False
+        self.frames = 0
+        self.__draw = draw
+        self.__poll = poll
+        self.__sleep = sleep
+        self.__period = 1.0 / fps
+        self.__step_time = min(step_time, budget / max(expected, 1))
+        self.__start = time.perf_counter()
+        self.__virtual = 0.0
+        self.__next_frame = self.__period
+        self.__pending: List[T] = []
+
+    def step(self, changes: Iterable[T]) -> bool:
+        """
+        Records one algorithm step and draws a frame when one is due.
+
+        Args:
+            changes (Iterable[T]): What the step changed, e.g. its cells.
+
+        Returns:
+            bool: True once the animation has been skipped with Enter.
+        """
+        if self.skipped:
+            return True
+        self.__pending.extend(changes)
+        self.__virtual += self.__step_time
+        if self.__virtual < self.__next_frame:
+            return False
+        return self.flush()
+
+    def flush(self) -> bool:
+        """
+        Draws the queued changes now, then waits out the frame.
+
+        Returns:
+            bool: True once the animation has been skipped with Enter.
+        """
+        if self.skipped:
+            return True
+        if self.__poll():
+            self.skipped = True
+            return True
+
+        if self.__pending:
+            self.__draw(self.__pending)
+            self.__pending = []
+            self.frames += 1
+
+        elapsed = time.perf_counter() - self.__start
+        if self.__virtual > elapsed:
+            self.__sleep(self.__virtual - elapsed)
+        self.__next_frame = max(self.__virtual, elapsed) + self.__period
+        return False
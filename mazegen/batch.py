@@ -0,0 +1,154 @@
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+)
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from .maze import Maze
+from .gen_maze import MazeGenerator
+
+
+def parse_seeds(spec: str) -> List[int]:
+    """
+    Expands a seed specification into a list of seeds.
+
+    The spec is a comma separated list of single seeds or inclusive
+    ranges written ``start..end``, e.g. ``1..100,250,300..310``.
+
+    Args:
+        spec (str): The seed specification.
+
+    Returns:
+        List[int]: The seeds in the order given.
+
+    Raises:
+        ValueError: If a part is not an integer or a range is reversed.
+    """
+    seeds: List[int] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if '..' in part:
+            start, end = map(int, part.split('..', 1))
+            if end < start:
+                raise ValueError(f"invalid seed range '{part}'")
+            seeds.extend(range(start, end + 1))
+        else:
+            seeds.append(int(part))
+    return seeds
+
+
+def seed_output_path(
+    output_file: str, seed: int, output_dir: Optional[str] = None
+) -> str:
+    """
+    Derives the per-seed output path from the template OUTPUT_FILE.
+
+    Args:
+        output_file (str): OUTPUT_FILE of the template config.
+        seed (int): Seed of the maze.
+        output_dir (Optional[str]): Directory overriding the template one.
+
+    Returns:
+        str: e.g. ``maze_output_42.txt`` for ``maze_output.txt``.
+    """
+    directory, name = os.path.split(output_file)
+    stem, ext = os.path.splitext(name)
+    if output_dir is not None:
+        directory = output_dir
+    return os.path.join(directory, f"{stem}_{seed}{ext}")
+
+
+def generate_one(
+    config: Dict[str, Any], seed: int, output_path: str
+) -> Tuple[int, str, int]:
+    """
+    Generates, solves and saves one maze; runs inside a worker process.
+
+    Args:
+        config (Dict[str, Any]): The parsed template configuration.
+        seed (int): Seed overriding the template SEED.
+        output_path (str): Where ``write_output`` saves the maze.
+
+    Returns:
+        Tuple[int, str, int]: The seed, output path and solution length.
+    """
+    maze_config = dict(config, SEED=seed, OUTPUT_FILE=output_path)
+    gen = MazeGenerator.from_maze(Maze.from_config(maze_config))
+    gen.generate_maze()
+    gen.write_output()
+    return seed, output_path, len(gen.get_solution_path())
+
+
+def run_batch(
+    config_file: str,
+    seeds: List[int],
+    jobs: Optional[int] = None,
+    output_dir: Optional[str] = None
+) -> Iterator[Tuple[int, str, int]]:
+    """
+    Fans maze generation out across a process pool.
+
+    At most a few tasks per worker are in flight at any time, and each
+    result is yielded as soon as its worker finishes, so huge seed ranges
+    stream to disk without queueing every task up front.
+
+    Args:
+        config_file (str): Path to the template configuration file.
+        seeds (List[int]): Seeds to generate.
+        jobs (Optional[int]): Worker processes; CPU count when None.
+        output_dir (Optional[str]): Directory for the generated files.
+
+    Yields:
+        Tuple[int, str, int]: The seed, output path and solution length.
+    """
+    config = Maze.MazeParseConfig.parsing_conf(config_file)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        window = (jobs or os.cpu_count() or 1) * 4
+        pending: Set[Future[Tuple[int, str, int]]] = set()
+        seed_iter = iter(seeds)
+
+        for seed in seed_iter:
+            path = seed_output_path(config["OUTPUT_FILE"], seed, output_dir)
+            pending.add(pool.submit(generate_one, config, seed, path))
+            if len(pending) < window:
+                continue
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def batch_main(
+    config_file: str,
+    seeds: List[int],
+    jobs: Optional[int] = None,
+    output_dir: Optional[str] = None
+) -> None:
+    """
+    Runs a batch and prints its throughput.
+
+    Args:
+        config_file (str): Path to the template configuration file.
+        seeds (List[int]): Seeds to generate.
+        jobs (Optional[int]): Worker processes; CPU count when None.
+        output_dir (Optional[str]): Directory for the generated files.
+
+    Returns:
+        None
+    """
+    start = time.monotonic()
+    count = 0
+    for _ in run_batch(config_file, seeds, jobs, output_dir):
+        count += 1
+    elapsed = time.monotonic() - start
+
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"Generated {count} mazes in {elapsed:.2f}s ({rate:.1f} mazes/s)")
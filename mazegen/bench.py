@@ -0,0 +1,341 @@
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import importlib.util
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .batch import parse_seeds
+from .gen_maze import MazeGenerator
+from .renderer import PathIndex, Renderer
+from . import solver
+
+
+DEFAULT_SIZES = "10,100,500,1000,2000"
+DEFAULT_SEEDS = "1..3"
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_TIME = 0.005
+GENERATORS = ("DFS", "WILSON", "ELLER", "KRUSKAL", "PRIM")
+VECTORIZED = ("BINARY_TREE", "SIDEWINDER")
+
+Result = Dict[str, Any]
+
+
+def git_revision() -> str:
+    """
+    Returns the git revision of the source tree, flagged when dirty.
+
+    Returns:
+        str: The commit hash, with a ``-dirty`` suffix for local changes,
+        or "unknown" outside a git checkout.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def timed(prepare: Callable[[], Callable[[], Any]], repeat: int) -> float:
+    """
+    Times a piece of work several times and keeps the fastest run.
+
+    Noise from the scheduler or the caches only ever adds time, so the
+    best of a few runs is far more stable than a single one; as with
+    ``timeit``, the garbage collector is paused while a run is timed.
+    ``prepare`` is called before every run, outside the timing, so work
+    that changes its input, such as carving a grid, starts from a fresh
+    one each time.
+
+    Args:
+        prepare (Callable[[], Callable[[], Any]]): Returns the work to
+        time.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: The shortest elapsed wall-clock seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        func = prepare()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def make_generator(
+    size: int, seed: int, algo: str, perfect: bool, output_file: str
+) -> MazeGenerator:
+    """
+    Builds a headless square maze with the entry and exit in the corners.
+
+    Args:
+        size (int): Side of the maze in cells.
+        seed (int): Random seed.
+        algo (str): Generation algorithm name.
+        perfect (bool): Whether the maze must have no loops.
+        output_file (str): Path used by ``write_output``.
+
+    Returns:
+        MazeGenerator: A generator ready for ``generate_maze``.
+    """
+    return MazeGenerator.from_params(
+        size, size, (0, 0), (size - 1, size - 1), perfect,
+        seed=seed, algo=algo, output_file=output_file
+    )
+
+
+def run_case(
+    size: int, seed: int, workdir: str, repeat: int = DEFAULT_REPEAT
+) -> Iterator[Tuple[str, float]]:
+    """
+    Times every benchmark case for one size and seed.
+
+    Generation covers each algorithm plus an imperfect DFS maze, and
+    includes the solution BFS that ``generate_maze`` always runs. The
+    solvers, the frame renderer (to a null sink) and ``write_output`` are
+    then timed on the perfect DFS maze. Every case keeps the best of
+    ``repeat`` runs.
+
+    Args:
+        size (int): Side of the maze in cells.
+        seed (int): Random seed.
+        workdir (str): Scratch directory for written files.
+        repeat (int): Runs per case.
+
+    Yields:
+        Tuple[str, float]: The case name and its elapsed seconds.
+    """
+    output = os.path.join(workdir, "bench_output.txt")
+    algos = list(GENERATORS)
+    if importlib.util.find_spec("numpy") is not None:
+        algos.extend(VECTORIZED)
+
+
+    def fresh(algo: str, perfect: bool) -> Callable[[], None]:
+        """Returns ``generate_maze`` of a new, uncarved generator."""
+        return make_generator(size, seed, algo, perfect, output).generate_maze
+
+    for algo in algos:
+        yield f"generate/{algo}", timed(lambda: fresh(algo, True), repeat)
+
+    yield "generate/DFS-imperfect", timed(
+        lambda: fresh("DFS", False), repeat
+    )
+
+    gen = make_generator(size, seed, "DFS", True, output)
+    gen.generate_maze()
+    grid = gen.get_grid()
+    maze = gen.get_maze()
+    for method in solver.SEARCHES:
+        yield f"solve/{method}", timed(
+            lambda: lambda: solver.solve(grid, maze.entry, maze.exit, method),
+            repeat
+        )
+
+    path = PathIndex(gen.get_path_coords(maze.entry, gen.get_solution_path()))
+    renderer = Renderer(grid, maze.theme, maze.entry, maze.exit)
+    with open(os.devnull, "w") as sink:
+        yield "render", timed(
+            lambda: lambda: sink.write(renderer.render_frame(path, set())),
+            repeat
+        )
+
+    yield "write_output", timed(lambda: gen.write_output, repeat)
+
+
+def run_suite(
+    sizes: List[int], seeds: List[int], repeat: int = DEFAULT_REPEAT
+) -> Result:
+    """
+    Runs the whole size by seed matrix and aggregates it per case.
+
+    Args:
+        sizes (List[int]): Maze sides to benchmark.
+        seeds (List[int]): Seeds run for every size.
+        repeat (int): Runs per case and seed, of which the best is kept.
+
+    Returns:
+        Result: The report, with the git revision, the environment and,
+        for every case and size, the min, median and mean over the seeds
+        of the best-run seconds.
+    """
+    samples: Dict[Tuple[str, int], List[float]] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            for seed in seeds:
+                for case, elapsed in run_case(size, seed, workdir, repeat):
+                    samples.setdefault((case, size), []).append(elapsed)
+                    print(
+                        f"{case:<24} {size:>5}x{size:<5} seed={seed:<6} "
+                        f"{elapsed:.4f}s", file=sys.stderr
+                    )
+
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "seeds": seeds,
+        "repeat": repeat,
+        "results": [
+            {
+                "case": case,
+                "size": size,
+                "min": min(times),
+                "median": statistics.median(times),
+                "mean": statistics.fmean(times),
+            }
+            for (case, size), times in samples.items()
+        ],
+    }
+
+
+def compare(
+    baseline: Result,
+    current: Result,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_time: float = DEFAULT_MIN_TIME
+) -> List[str]:
+    """
+    Flags the cases whose median got slower than the baseline allows.
+
+    Cases that take less than ``min_time`` in the baseline, or that got
+    slower by less than ``min_time``, are too short for a ratio to mean
+    anything and are never flagged.
+
+    Args:
+        baseline (Result): A report saved earlier.
+        current (Result): The report to check.
+        threshold (float): Allowed relative slowdown, e.g. 0.10 for 10%.
+        min_time (float): Seconds below which timings are ignored.
+
+    Returns:
+        List[str]: One line per regression, empty when there is none.
+    """
+    before = {
+        (row["case"], row["size"]): row["median"]
+        for row in baseline["results"]
+    }
+    regressions = []
+    for row in current["results"]:
+        old = before.get((row["case"], row["size"]))
+        if old is None or old < min_time:
+            continue
+        new = row["median"]
+        if new - old < min_time:
+            continue
+        ratio = new / old
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{row['case']} {row['size']}x{row['size']}: "
+                f"{old:.4f}s -> {new:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point of the benchmark suite.
+
+    Usage:
+        python -m mazegen.bench --sizes 10,100 --seeds 1..3
+        python -m mazegen.bench --baseline benchmarks/baseline.json
+
+    Args:
+        argv (Optional[List[str]]): Arguments; ``sys.argv`` when None.
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: With status 1 when a regression is flagged, or when
+        the baseline file does not exist.
+    """
+    parser = argparse.ArgumentParser(prog="python -m mazegen.bench")
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES,
+        help=f"comma separated maze sides (default {DEFAULT_SIZES})"
+    )
+    parser.add_argument(
+        "--seeds", type=parse_seeds, default=parse_seeds(DEFAULT_SEEDS),
+        help=f"seeds run for every size (default {DEFAULT_SEEDS})"
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="JSON report path (default benchmarks/<revision>.json)"
+    )
+    parser.add_argument(
+        "--baseline", default=None,
+        help="saved report to compare against"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="allowed relative slowdown before flagging (default 0.10)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT,
+        help=f"runs per case, the best is kept (default {DEFAULT_REPEAT})"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=DEFAULT_MIN_TIME,
+        help="seconds below which cases are never flagged "
+        f"(default {DEFAULT_MIN_TIME})"
+    )
+    args = parser.parse_args(argv)
+    if args.baseline is not None and not os.path.isfile(args.baseline):
+        print(
+            f"Baseline {args.baseline} not found: save one first with "
+            f"--output {args.baseline} (make bench-baseline)"
+        )
+        sys.exit(1)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_suite(sizes, args.seeds, max(1, args.repeat))
+
+    output = args.output or os.path.join(
+        "benchmarks", f"{report['revision'][:12]}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark report saved to {output}")
+
+    if args.baseline is None:
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, report, args.threshold, args.min_time)
+    if not regressions:
+        print(f"No regressions against {baseline.get('revision', '?')}")
+        return
+
+    print(f"Regressions against {baseline.get('revision', '?')}:")
+    for line in regressions:
+        print(f"  {line}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
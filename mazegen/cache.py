@@ -0,0 +1,285 @@
+import os
+import json
+import hashlib
+import tempfile
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+from .pattern import FT_42, Pattern
+from .mazefile import MazeData, MappedMaze, write_binary
+from .error_class import MazeFileError
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_SIZE = 256
+SUFFIX = ".bin"
+LOW_WATER = 0.75
+RESCAN_FRACTION = 8
+
+IGNORED_KEYS = frozenset((
+    "OUTPUT_FILE", "FPS", "PROFILE", "PROFILE_DUMP",
+    "CACHE_DIR", "CACHE_SIZE"
+))
+DEFAULTS: Dict[str, Any] = {
+    "ALGORITHM": "DFS",
+    "SOLVER": "BFS",
+    "TILE_SIZE": 0,
+    "BRAID": None,
+    "PATTERN": FT_42,
+}
+
+
+def _encode(value: Any) -> Any:
+    """
+    Turns the non-JSON values of a parsed config into JSON ones.
+
+    Args:
+        value (Any): A value ``json`` cannot serialize.
+
+    Returns:
+        Any: The hex rows of a Pattern's mask.
+
+    Raises:
+        TypeError: If the value is of any other type.
+    """
+    if isinstance(value, Pattern):
+        return [row.hex() for row in value.mask]
+    raise TypeError(f"cannot hash config value {value!r}")
+
+
+def config_key(config: Dict[str, Any]) -> str:
+    """
+    Hashes everything in a parsed config that shapes the maze or its
+    solution.
+
+    Keys that only change where or how the result is shown (OUTPUT_FILE,
+    FPS, profiling and the cache settings) are dropped and missing
+    optional keys take their defaults, so equivalent configs share a key.
+    A PATTERN is hashed by its bitmap, not by its file name.
+
+    Args:
+        config (Dict[str, Any]): Output of ``parsing_value``.
+
+    Returns:
+        str: The hex SHA-256 digest of the normalized config.
+    """
+    normalized = dict(DEFAULTS)
+    normalized.update(
+        (key, value) for key, value in config.items()
+        if key not in IGNORED_KEYS
+    )
+    text = json.dumps(
+        normalized, sort_keys=True, separators=(",", ":"), default=_encode
+    )
+    return hashlib.sha256(f"{CACHE_VERSION}:{text}".encode()).hexdigest()
+
+
+class MazeCache:
+    """
+    Content-addressed on-disk cache of generated and solved mazes.
+
+    Every entry is one file in the compact binary format, named after the
+    ``config_key`` of its config, and written to a temporary file first
+    and renamed in place, so concurrent workers never see half an entry.
+    A hit touches the file's modification time; when the files outgrow
+    ``max_bytes``, the least recently used ones are removed first, down
+    to ``LOW_WATER`` of the limit so that the next stores do not evict
+    again. Corrupt or foreign entries count as misses and are deleted.
+
+    The folder is listed once, on the first store; after that a running
+    total of the entry sizes decides when to evict. Other processes may
+    share the folder, so it is listed again whenever this instance has
+    added more than ``1 / RESCAN_FRACTION`` of the limit since the last
+    listing. ``shared`` hands out one instance per folder and process,
+    so a batch keeps its running total across mazes.
+
+    Attributes:
+        directory (str): Folder holding the entries.
+        max_bytes (int): Total size the entries may take on disk.
+    """
+
+    __slots__ = ("directory", "max_bytes", "__total", "__added")
+    __instances: ClassVar[Dict[str, 'MazeCache']] = {}
+
+    def __init__(
+        self, directory: str, max_bytes: int = DEFAULT_CACHE_SIZE << 20
+    ) -> None:
+        """
+        Opens a cache folder; it is created on the first store.
+
+        Args:
+            directory (str): Folder holding the entries.
+            max_bytes (int): Total size the entries may take on disk.
+
+        Returns:
+            None
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.__total: Optional[int] = None
+        self.__added = 0
+
+    @classmethod
+    def shared(
+        cls, directory: str, max_bytes: int = DEFAULT_CACHE_SIZE << 20
+    ) -> 'MazeCache':
+        """
+        Returns this process's cache instance for a folder.
+
+        Args:
+            directory (str): Folder holding the entries.
+            max_bytes (int): Total size the entries may take on disk;
+            replaces the limit of an existing instance.
+
+        Returns:
+            MazeCache: The instance, created on first use.
+        """
+        key = os.path.abspath(directory)
+        cache = cls.__instances.get(key)
+        if cache is None:
+            cache = cls.__instances[key] = cls(directory, max_bytes)
+        cache.max_bytes = max_bytes
+        return cache
+
+    def path(self, key: str) -> str:
+        """
+        Returns the file of an entry.
+
+        Args:
+            key (str): A ``config_key`` digest.
+
+        Returns:
+            str: The entry path inside the cache folder.
+        """
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, key: str) -> Optional[MazeData]:
+        """
+        Reads an entry and marks it as recently used.
+
+        Like ``store``, this is best effort: an entry that cannot be read,
+        e.g. because of its permissions, is a miss, and failing to touch
+        it only makes it look older.
+
+        Args:
+            key (str): A ``config_key`` digest.
+
+        Returns:
+            Optional[MazeData]: The cached maze, None on a miss.
+        """
+        path = self.path(key)
+        try:
+            with MappedMaze(path) as mapped:
+                data = mapped.to_data()
+        except MazeFileError:
+            try:
+                self.discard(key)
+            except OSError:
+                pass
+            return None
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def store(self, key: str, data: MazeData) -> None:
+        """
+        Saves an entry, then evicts old ones if the total size of the
+        entries went over ``max_bytes``.
+
+        Args:
+            key (str): A ``config_key`` digest.
+            data (MazeData): The maze and its solution.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the cache folder cannot be written.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        os.close(fd)
+        try:
+            write_binary(tmp, data)
+            size = os.path.getsize(tmp)
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+        if self.__total is None:
+            self.evict()
+            return
+        self.__total += size - replaced
+        self.__added += size
+        if (
+            self.__total > self.max_bytes
+            or self.__added > self.max_bytes // RESCAN_FRACTION
+        ):
+            self.evict()
+
+    def discard(self, key: str) -> None:
+        """
+        Removes an entry if it exists.
+
+        Args:
+            key (str): A ``config_key`` digest.
+
+        Returns:
+            None
+        """
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Lists the folder and, when the entries take more than
+        ``max_bytes``, removes the least recently used ones until the
+        rest fits in ``LOW_WATER`` of it. Resets the running total.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        entries: List[Tuple[int, int, str]] = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append(
+                        (stat.st_mtime_ns, stat.st_size, entry.path)
+                    )
+                    total += stat.st_size
+        except FileNotFoundError:
+            entries = []
+
+        removed = 0
+        if total > self.max_bytes:
+            entries.sort()
+            target = int(self.max_bytes * LOW_WATER)
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+        self.__total = total
+        self.__added = 0
+        return removed
@@ -0,0 +1,357 @@
+import random
+from array import array
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from .grid import Grid, NORTH, EAST, SOUTH, WEST
+from .eller import eller_rows, group_rows
+from .structures import RandomSet, UnionFind
+
+
+Carve = Tuple[int, int, int]
+Carver = Callable[[Grid, Tuple[int, int], random.Random], Iterator[Carve]]
+
+DIRECTIONS = (
+    (0, -1, NORTH, SOUTH),
+    (0, 1, SOUTH, NORTH),
+    (1, 0, EAST, WEST),
+    (-1, 0, WEST, EAST)
+)
+OFFSETS: Dict[int, Tuple[int, int]] = {
+    wall: (dx, dy) for dx, dy, wall, _ in DIRECTIONS
+}
+
+
+def neighbor(x: int, y: int, wall: int) -> Tuple[int, int]:
+    """
+    Returns the cell on the other side of a wall.
+
+    Args:
+        x (int): Column of the cell.
+        y (int): Row of the cell.
+        wall (int): NORTH, EAST, SOUTH or WEST.
+
+    Returns:
+        Tuple[int, int]: The (x, y) neighbour.
+    """
+    dx, dy = OFFSETS[wall]
+    return x + dx, y + dy
+
+
+def drain(steps: Iterable[Carve]) -> None:
+    """
+    Runs a carver to the end at full speed, dropping its events.
+
+    Args:
+        steps (Iterable[Carve]): The carve events to exhaust.
+
+    Returns:
+        None
+    """
+    deque(steps, maxlen=0)
+
+
+def dfs(
+    grid: Grid, start: Tuple[int, int], rng: random.Random
+) -> Iterator[Carve]:
+    """
+    Generates a maze using the Randomized Depth-First Search algorithm.
+
+    This is an iterative recursive backtracker that creates a perfect
+    maze by carving paths until all reachable cells are visited.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        start (Tuple[int, int]): (x, y) cell the search starts from.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, after removing it.
+    """
+    sx, sy = start
+    stack: List[Tuple[int, int]] = [(sx, sy)]
+    grid.mark_visited(sx, sy)
+
+    while stack:
+        cx, cy = stack[-1]
+        neighbors = []
+        for dx, dy, wall, opp_wall in DIRECTIONS:
+            nx, ny = cx + dx, cy + dy
+
+            if grid.in_bounds(nx, ny) and not grid.is_visited(nx, ny):
+                neighbors.append((nx, ny, wall, opp_wall))
+
+        if neighbors:
+            nx, ny, wall, opp_wall = rng.choice(neighbors)
+
+            grid.carve(cx, cy, nx, ny, wall, opp_wall)
+            grid.mark_visited(nx, ny)
+            stack.append((nx, ny))
+            yield cx, cy, wall
+        else:
+            stack.pop()
+
+
+def wilson(
+    grid: Grid, start: Tuple[int, int], rng: random.Random
+) -> Iterator[Carve]:
+    """
+    Generates a maze using Wilson's algorithm.
+
+    This algorithm produces an unbiased uniform spanning tree of the
+    grid, ensuring a perfectly random distribution of mazes.
+
+    Unvisited cells live in a swap-remove array paired with a position
+    index, so sampling and removal are O(1). Loops are erased implicitly
+    by recording the last exit direction of every cell on the walk and
+    replaying those exits from the start cell.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        start (Tuple[int, int]): (x, y) root of the spanning tree.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, after removing it.
+    """
+    width, height = grid.width, grid.height
+
+    unvisited = array("l")
+    position = array("l", [-1]) * (width * height)
+    for y in range(height):
+        for x in range(width):
+            if not grid.is_pattern(x, y):
+                position[y * width + x] = len(unvisited)
+                unvisited.append(y * width + x)
+
+    def discard(index: int) -> None:
+        """
+        Removes a cell from the unvisited set in O(1).
+
+        Args:
+            index (int): Flat index of the cell.
+
+        Returns:
+            None
+        """
+        pos = position[index]
+        if pos < 0:
+            return
+        last = unvisited.pop()
+        if last != index:
+            unvisited[pos] = last
+            position[last] = pos
+        position[index] = -1
+
+    exits = bytearray(width * height)
+
+    grid.mark_visited(*start)
+    discard(grid.index(*start))
+
+    while unvisited:
+        first = unvisited[rng.randrange(len(unvisited))]
+        cx, cy = first % width, first // width
+
+        while not grid.is_visited(cx, cy):
+            direction = rng.randrange(len(DIRECTIONS))
+            dx, dy, _, _ = DIRECTIONS[direction]
+            nx, ny = cx + dx, cy + dy
+
+            if 0 <= nx < width and 0 <= ny < height:
+                if grid.is_pattern(nx, ny):
+                    continue
+                exits[cy * width + cx] = direction
+                cx, cy = nx, ny
+
+        cx, cy = first % width, first // width
+        while not grid.is_visited(cx, cy):
+            dx, dy, wall, opp_wall = DIRECTIONS[exits[cy * width + cx]]
+            nx, ny = cx + dx, cy + dy
+            grid.carve(cx, cy, nx, ny, wall, opp_wall)
+            grid.mark_visited(cx, cy)
+            discard(cy * width + cx)
+            yield cx, cy, wall
+            cx, cy = nx, ny
+
+
+def eller(
+    grid: Grid, start: Tuple[int, int], rng: random.Random
+) -> Iterator[Carve]:
+    """
+    Generates a maze row by row using Eller's algorithm.
+
+    Only the current row's sets are tracked while carving; the '42'
+    pattern cells are treated as pre-carved obstacles. Each row is
+    written in one piece, then its open east and south walls are
+    reported.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        start (Tuple[int, int]): Unused; rows always start at the top.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, row by row.
+    """
+    blocked = group_rows(grid.pattern_cells())
+
+    rows = eller_rows(grid.width, grid.height, blocked, rng)
+    for y, walls in enumerate(rows):
+        grid.set_row_walls(y, walls)
+        for x, cell in enumerate(walls):
+            if not cell & EAST:
+                yield x, y, EAST
+            if not cell & SOUTH:
+                yield x, y, SOUTH
+
+
+def kruskal(
+    grid: Grid, start: Tuple[int, int], rng: random.Random
+) -> Iterator[Carve]:
+    """
+    Generates a maze using randomized Kruskal's algorithm.
+
+    Every wall between two non-pattern cells is listed once as a flat
+    edge code (cell index * 2, plus 1 for the south wall), shuffled, and
+    removed whenever it joins two different sets of an array-backed
+    union-find. Complexity: O(W*H*a(W*H)) time and O(W*H) memory.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        start (Tuple[int, int]): Unused; every set starts at once.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, after removing it.
+    """
+    width, height = grid.width, grid.height
+
+    edges = array("l")
+    for y in range(height):
+        for x in range(width):
+            if grid.is_pattern(x, y):
+                continue
+            index = y * width + x
+            if x + 1 < width and not grid.is_pattern(x + 1, y):
+                edges.append(index * 2)
+            if y + 1 < height and not grid.is_pattern(x, y + 1):
+                edges.append(index * 2 + 1)
+    rng.shuffle(edges)
+
+    sets = UnionFind(width * height)
+    for edge in edges:
+        index, south = divmod(edge, 2)
+        cy, cx = divmod(index, width)
+        if south:
+            nx, ny, wall, opp_wall = cx, cy + 1, SOUTH, NORTH
+        else:
+            nx, ny, wall, opp_wall = cx + 1, cy, EAST, WEST
+
+        if not sets.union(index, ny * width + nx):
+            continue
+        grid.carve(cx, cy, nx, ny, wall, opp_wall)
+        yield cx, cy, wall
+
+
+def prim(
+    grid: Grid, start: Tuple[int, int], rng: random.Random
+) -> Iterator[Carve]:
+    """
+    Generates a maze using randomized Prim's algorithm.
+
+    The maze grows from the start cell; the frontier of unvisited cells
+    next to it is a swap-remove set, so picking and removing a random
+    frontier cell is O(1). Each picked cell is joined to a random visited
+    neighbour; the '42' pattern cells start out visited, so they never
+    join the frontier, and are never picked as neighbours.
+    Complexity: O(W*H) time and memory.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        start (Tuple[int, int]): (x, y) cell the maze grows from.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, after removing it.
+    """
+    width = grid.width
+    frontier = RandomSet(width * grid.height, rng)
+
+    def expand(x: int, y: int) -> None:
+        """
+        Marks a cell visited and adds its free neighbours to the frontier.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            None
+        """
+        grid.mark_visited(x, y)
+        for dx, dy, _, _ in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if grid.in_bounds(nx, ny) and not grid.is_visited(nx, ny):
+                frontier.add(ny * width + nx)
+
+    expand(*start)
+
+    while frontier:
+        cy, cx = divmod(frontier.pop_random(), width)
+        links = [
+            (cx + dx, cy + dy, wall, opp_wall)
+            for dx, dy, wall, opp_wall in DIRECTIONS
+            if grid.in_bounds(cx + dx, cy + dy)
+            and grid.is_visited(cx + dx, cy + dy)
+            and not grid.is_pattern(cx + dx, cy + dy)
+        ]
+        nx, ny, wall, opp_wall = rng.choice(links)
+        grid.carve(cx, cy, nx, ny, wall, opp_wall)
+        expand(cx, cy)
+        yield cx, cy, wall
+
+
+def make_imperfect(
+    grid: Grid, rng: random.Random, chance: float = 0.7
+) -> Iterator[Carve]:
+    """
+    Creates an imperfect maze by randomly removing walls at dead ends.
+
+    Cells are scanned in row order, so a wall removed early can keep a
+    later neighbour from counting as a dead end.
+
+    Args:
+        grid (Grid): A carved grid.
+        rng (random.Random): The braiding stream.
+        chance (float): Probability (0.0 to 1.0) of removing a wall.
+
+    Yields:
+        Carve: (x, y, wall) of every wall removed, after removing it.
+    """
+    for y in range(grid.height):
+        for x in range(grid.width):
+            if grid.is_pattern(x, y):
+                continue
+
+            walls = [
+                direction for direction in DIRECTIONS
+                if grid.has_wall(x, y, direction[2])
+            ]
+
+            if len(walls) == 3 and rng.random() < chance:
+                dx, dy, wall, opp_wall = rng.choice(walls)
+                nx, ny = x + dx, y + dy
+                if grid.in_bounds(nx, ny):
+                    if grid.is_pattern(nx, ny):
+                        continue
+
+                    grid.carve(x, y, nx, ny, wall, opp_wall)
+                    yield x, y, wall
+
+
+CARVERS: Dict[str, Carver] = {
+    "DFS": dfs,
+    "WILSON": wilson,
+    "ELLER": eller,
+    "KRUSKAL": kruskal,
+    "PRIM": prim,
+}
@@ -1,14 +1,19 @@
-import sys
 import random
+import sys
 from .maze import Maze
+from .grid import Grid, WALL_MASK, VISITED, FT_PATTERN
 from .terminal_ctl import TerminalCtl
-from typing import List, Tuple
+from .streams import MazeStreams
+from typing import Iterator, List, Optional, Tuple
 from .error_class import Y, RS
 
 
 class Cell:
     """
-    Represents a single cell in the maze with its wall and visit status.\n
+    Lightweight view of a single cell stored inside a packed Grid.\n
+
+    The cell keeps no state of its own: every attribute reads and writes
+    the matching bits of the underlying grid byte.\n
 
     Attributes:\n
         grid (int):
@@ -19,96 +24,188 @@ class Cell:
             Flag indicating if the cell is part of the '42' pattern.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: Grid, x: int, y: int) -> None:
         """
-        Initializes a cell with all walls (15) and flags for visited/pattern.\n
+        Binds the view to the cell at (x, y) of a packed grid.\n
+
+        Args:
+            store (Grid): The grid holding the cell byte.
+            x (int): Column of the cell.
+            y (int): Row of the cell.
 
         Returns:
             None
         """
-        self.grid = 15
-        self.visited = False
-        self.ft_pattern = False
+        self._store = store
+        self._index = store.index(x, y)
+
+    @property
+    def grid(self) -> int:
+        """Wall bitmask of the cell."""
+        return self._store.data[self._index] & WALL_MASK
+
+    @grid.setter
+    def grid(self, walls: int) -> None:
+        data = self._store.data
+        data[self._index] = (data[self._index] & ~WALL_MASK) | (
+            walls & WALL_MASK
+        )
+
+    @property
+    def visited(self) -> bool:
+        """Whether the cell has been visited during generation."""
+        return bool(self._store.data[self._index] & VISITED)
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        self.__set_flag(VISITED, value)
+
+    @property
+    def ft_pattern(self) -> bool:
+        """Whether the cell is part of the '42' pattern."""
+        return bool(self._store.data[self._index] & FT_PATTERN)
+
+    @ft_pattern.setter
+    def ft_pattern(self, value: bool) -> None:
+        self.__set_flag(FT_PATTERN, value)
+
+    def __set_flag(self, flag: int, value: bool) -> None:
+        """
+        Sets or clears one flag bit of the cell byte.\n
+
+        Args:
+            flag (int): The flag bit.
+            value (bool): Whether the flag should be set.
+
+        Returns:
+            None
+        """
+        if value:
+            self._store.data[self._index] |= flag
+        else:
+            self._store.data[self._index] &= ~flag
 
     @classmethod
-    def get_cells(cls, maze: Maze) -> List[List['Cell']]:
+    def get_cells(cls, maze: Maze) -> 'CellRows':
         """
-        Initializes the grid of cells and overlays the '42' pattern
+        Builds a packed grid for the maze and returns a row/column view.\n
+
+        Kept for callers that index cells as ``cells[y][x]``; the cells are
+        created lazily on access from the packed storage.\n
+
+        Args:
+            maze (Maze): The maze object containing dimensions,
+            entry, and exit.
+
+        Returns:
+            CellRows: A 2D view over the initialized grid.\n
+        """
+        return CellRows(
+            cls.get_grid(maze, MazeStreams(maze.seed).pattern)
+        )
+
+    @classmethod
+    def get_grid(cls, maze: Maze, rng: random.Random) -> Grid:
+        """
+        Initializes the packed grid and overlays the '42' pattern
         if possible or not.\n
 
-        This method creates a 2D grid of Cell objects and attempts to place
-        a visual '42' pattern in a random valid location that does not
-        overlap with the entry or exit points.\n
+        This method allocates a Grid with every wall closed and stamps the
+        pattern mask at the origin chosen by ``pattern_origin``, one slice
+        assignment per pattern row.\n
 
         Args:
             maze (Maze): The maze object containing dimensions,
             entry, and exit.
+            rng (random.Random): The pattern stream of the maze.
 
         Returns:
-            List[List[Cell]]: A 2D list containing the initialized Cells.\n
+            Grid: The initialized packed grid.\n
 
         Raises:
-            SystemExit: If the maze is too small or no valid position is found
-            and the user chooses to quit.\n
+            SystemExit: If the user chooses to quit instead of continuing
+            without the pattern.\n
         """
+        grid = Grid(maze.width, maze.height)
+        origin = cls.pattern_origin(maze, rng)
+        if origin is not None:
+            grid.stamp(*origin, maze.pattern.mask)
+        return grid
 
-        four = [
-            (0, 0), (0, 1), (0, 2),
-            (1, 2), (2, 2), (2, 3), (2, 4)
-        ]
-        two = [
-            (4, 0), (5, 0), (6, 0), (6, 1), (6, 2),
-            (5, 2), (4, 2), (4, 3), (4, 4), (5, 4), (6, 4)
-        ]
-
-        ft_pattern = four + two
+    @classmethod
+    def place_pattern(
+        cls, maze: Maze, rng: random.Random
+    ) -> List[Tuple[int, int]]:
+        """
+        Chooses where the '42' pattern goes, without allocating a grid.\n
 
-        def get_available_starts() -> List[Tuple[int, int]]:
-            """
-            Finds valid top-left positions for the '42' pattern.\n
+        Streaming generators use this directly to know which cells are
+        obstacles.\n
 
-            Scans the maze to find all possible starting coordinates where the
-            '42' pattern can be placed without blocking entry/exit.\n
+        Args:
+            maze (Maze): The maze object containing dimensions,
+            entry, and exit.
+            rng (random.Random): The pattern stream of the maze.
 
-            Returns:
-                List[Tuple[int, int]]: A list of (x, y)
-                coordinates for valid starts.\n
-            """
-            ft_width, ft_height = 7, 5
-            available_starts: List[Tuple[int, int]] = []
+        Returns:
+            List[Tuple[int, int]]: The (x, y) cells of the pattern, empty
+            when it does not fit.\n
 
-            for x in range(1, maze.width - ft_width):
-                for y in range(1, maze.height - ft_height):
+        Raises:
+            SystemExit: If the user chooses to quit instead of continuing
+            without the pattern.\n
+        """
+        origin = cls.pattern_origin(maze, rng)
+        if origin is None:
+            return []
+        return maze.pattern.cells_at(*origin)
 
-                    occupied = {(x + px, y + py) for px, py in ft_pattern}
+    @staticmethod
+    def pattern_origin(
+        maze: Maze, rng: random.Random
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Picks the top-left corner of the maze's pattern.\n
 
-                    if (
-                        maze.entry not in occupied
-                        and maze.exit not in occupied
-                    ):
-                        available_starts.append((x, y))
+        The pattern is placed in a random valid location that does not
+        overlap with the entry or exit points. The origins that would
+        cover them are computed directly, so no candidate list is built.\n
 
-            return available_starts
+        Args:
+            maze (Maze): The maze object containing dimensions,
+            entry, exit and pattern.
+            rng (random.Random): The pattern stream of the maze.
 
-        cells: List[List[Cell]] = [
-            [
-                cls() for _ in range(maze.width)
-            ] for _ in range(maze.height)
-        ]
+        Returns:
+            Optional[Tuple[int, int]]: The (x, y) origin, None when the
+            pattern does not fit.\n
 
-        ft_width, ft_height = 7, 5
+        Raises:
+            SystemExit: If the maze is too small or no valid position is found
+            and the user chooses to quit. Non-interactive mazes silently
+            skip the pattern instead of prompting.\n
+        """
+        pattern = maze.pattern
 
-        if maze.width < ft_width or maze.height < ft_height:
+        if maze.width < pattern.width or maze.height < pattern.height:
+            if not maze.interactive:
+                return None
             print(f"{Y}Warning{RS}: Maze size too small for '42' pattern.")
             print("1. Continue")
             print("2. Quit")
             replay = TerminalCtl.getch().lower()
             if replay != '1':
                 sys.exit(0)
-            return cells
+            return None
 
-        available_starts = get_available_starts()
-        if not available_starts:
+        origin = pattern.choose_origin(
+            maze.width, maze.height, (maze.entry, maze.exit), rng
+        )
+        if origin is None:
+            if not maze.interactive:
+                return None
             print(
                 f"{Y}Warning{RS}: No valid positions for '42' pattern "
                 "(entry/exit blocking)."
@@ -118,13 +215,83 @@ class Cell:
             replay = TerminalCtl.getch().lower()
             if replay != '1':
                 sys.exit(0)
-            return cells
+            return None
+
+        return origin
+
+
+class CellRow:
+    """
+    Lazy view of one grid row, indexable by column.\n
+
+    Attributes:\n
+        store (Grid): The grid holding the row.\n
+        y (int): The row number.
+    """
+
+    __slots__ = ("store", "y")
+
+    def __init__(self, store: Grid, y: int) -> None:
+        """
+        Binds the view to row ``y`` of the grid.\n
+
+        Args:
+            store (Grid): The grid holding the row.
+            y (int): The row number.
+
+        Returns:
+            None
+        """
+        self.store = store
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.store.width
+
+    def __getitem__(self, x: int) -> Cell:
+        if x < 0:
+            x += self.store.width
+        if not 0 <= x < self.store.width:
+            raise IndexError("cell index out of range")
+        return Cell(self.store, x, self.y)
+
+    def __iter__(self) -> Iterator[Cell]:
+        for x in range(self.store.width):
+            yield Cell(self.store, x, self.y)
+
+
+class CellRows:
+    """
+    Lazy ``cells[y][x]`` compatibility view over a packed Grid.\n
+
+    Attributes:\n
+        store (Grid): The grid being viewed.
+    """
+
+    __slots__ = ("store",)
+
+    def __init__(self, store: Grid) -> None:
+        """
+        Wraps a packed grid.\n
+
+        Args:
+            store (Grid): The grid being viewed.
+
+        Returns:
+            None
+        """
+        self.store = store
 
-        start_x, start_y = random.choice(available_starts)
+    def __len__(self) -> int:
+        return self.store.height
 
-        for ft_x, ft_y in ft_pattern:
-            x, y = start_x + ft_x, start_y + ft_y
-            cells[y][x].visited = True
-            cells[y][x].ft_pattern = True
+    def __getitem__(self, y: int) -> CellRow:
+        if y < 0:
+            y += self.store.height
+        if not 0 <= y < self.store.height:
+            raise IndexError("row index out of range")
+        return CellRow(self.store, y)
 
-        return cells
+    def __iter__(self) -> Iterator[CellRow]:
+        for y in range(self.store.height):
+            yield CellRow(self.store, y)
@@ -0,0 +1,337 @@
+import re
+import heapq
+from typing import Container, Dict, Iterable, List, Optional, Tuple
+from .grid import Grid, WALL_MASK, MOVES
+from . import vectorized
+
+
+_DEGREE_TABLE = bytes(4 - bin(b & WALL_MASK).count("1") for b in range(256))
+_NODE_DEGREES = re.compile(rb"[\x01\x03\x04]")
+_DEAD_ENDS = re.compile(rb"\x01")
+_OPEN_TABLE = bytes(~b & WALL_MASK for b in range(256))
+_MOVE_LISTS = tuple(
+    tuple(move for move in range(len(MOVES)) if sides >> move & 1)
+    for sides in range(16)
+)
+
+Edge = Tuple[int, int, str]
+
+
+def count_dead_ends(grid: Grid) -> int:
+    """
+    Counts the cells with exactly one open side.
+
+    Args:
+        grid (Grid): The maze grid.
+
+    Returns:
+        int: Number of dead ends.
+    """
+    return grid.data.translate(_DEGREE_TABLE).count(1)
+
+
+def dead_end_fill(
+    grid: Grid, keep: Iterable[Tuple[int, int]] = ()
+) -> Tuple[bytearray, bytearray]:
+    """
+    Fills every dead end, and the corridors that become dead ends in turn.
+
+    With NumPy, ``vectorized.dead_end_rounds`` fills whole layers of dead
+    ends at once until only a few long corridors are left, which are
+    then followed cell by cell. Without it, the open-side counts come
+    from one ``bytes.translate`` and the first dead ends from a regex
+    scan of that buffer, and every filled cell is visited in Python.
+    Kept cells are never filled, so with ``keep`` set to the entry and
+    exit a perfect maze shrinks to its solution path. Complexity: O(W*H)
+    time, one byte per cell for each buffer.
+
+    Args:
+        grid (Grid): The maze grid.
+        keep (Iterable[Tuple[int, int]]): (x, y) cells that must stay.
+
+    Returns:
+        Tuple[bytearray, bytearray]: The filled flag of every cell, and the
+        number of open sides of every cell leading to an unfilled one
+        (0 for filled cells).
+    """
+    width, height = grid.width, grid.height
+    data = grid.data
+    kept = {y * width + x for x, y in keep}
+    if vectorized.has_numpy():
+        filled, degree, stack = vectorized.dead_end_rounds(grid, kept)
+    else:
+        degree = bytearray(data.translate(_DEGREE_TABLE))
+        filled = bytearray(width * height)
+        stack = [m.start() for m in _DEAD_ENDS.finditer(degree)]
+
+    while stack:
+        current = stack.pop()
+        if filled[current] or current in kept or degree[current] != 1:
+            continue
+
+        filled[current] = 1
+        degree[current] = 0
+        cy, cx = divmod(current, width)
+        walls = data[current]
+        for dx, dy, wall, _ in MOVES:
+            nx, ny = cx + dx, cy + dy
+            if walls & wall or not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = ny * width + nx
+            if not filled[neighbor]:
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1:
+                    stack.append(neighbor)
+
+    return filled, degree
+
+
+class CorridorGraph:
+    """
+    Junction graph of a maze, with corridors collapsed into weighted edges.
+
+    Nodes are the junctions (3 or 4 open sides), the dead ends and the
+    kept cells such as the entry and exit; every run of 2-sided cells
+    between two nodes becomes one edge carrying its length and its
+    N/E/S/W moves. Perfect DFS or Wilson mazes are mostly corridors, so
+    the graph is often ten times smaller than the grid, and a path found
+    on it expands back into the move string ``get_path_coords`` expects.
+
+    Attributes:
+        grid (Grid): The maze grid the graph was built from.
+        open_sides (bytearray): Per cell, the bits of the ``MOVES`` that
+        lead to a cell kept in the graph.
+        edges (Dict[int, List[Edge]]): Flat node index to its outgoing
+        (target node, length, moves) edges.
+    """
+
+    __slots__ = ("grid", "open_sides", "edges")
+
+    def __init__(
+        self,
+        grid: Grid,
+        keep: Iterable[Tuple[int, int]] = (),
+        prune: bool = False
+    ) -> None:
+        """
+        Finds the nodes and walks every corridor once from each end.
+
+        Args:
+            grid (Grid): The maze grid.
+            keep (Iterable[Tuple[int, int]]): (x, y) cells that must be
+            nodes, e.g. the entry and exit.
+            prune (bool): Whether to drop the dead ends first with
+            ``dead_end_fill``; queries must then stay on kept cells.
+
+        Returns:
+            None
+        """
+        keep = list(keep)
+        self.grid = grid
+        self.open_sides = bytearray(grid.data.translate(_OPEN_TABLE))
+        if prune:
+            filled, degree = dead_end_fill(grid, keep)
+            for match in _DEAD_ENDS.finditer(filled):
+                self.close(match.start())
+        else:
+            degree = bytearray(grid.data.translate(_DEGREE_TABLE))
+
+        nodes = {m.start() for m in _NODE_DEGREES.finditer(degree)}
+        nodes.update(y * grid.width + x for x, y in keep)
+
+        self.edges: Dict[int, List[Edge]] = {}
+        for node in nodes:
+            self.edges[node] = [
+                self.walk(node, move, nodes)
+                for move in self.open_moves(node)
+            ]
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.edges)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of corridors, each counted once."""
+        return sum(len(edges) for edges in self.edges.values()) // 2
+
+    def close(self, index: int) -> None:
+        """
+        Removes a cell from the graph by closing every side leading to it.
+
+        Args:
+            index (int): Flat index of the cell.
+
+        Returns:
+            None
+        """
+        width = self.grid.width
+        for move in _MOVE_LISTS[self.open_sides[index]]:
+            dx, dy, _, _ = MOVES[move]
+            self.open_sides[index + dy * width + dx] &= ~(1 << (move + 2) % 4)
+        self.open_sides[index] = 0
+
+    def open_moves(self, index: int) -> Tuple[int, ...]:
+        """
+        Lists the moves out of a cell that stay inside the graph.
+
+        Args:
+            index (int): Flat index of the cell.
+
+        Returns:
+            Tuple[int, ...]: Indices into ``MOVES``.
+        """
+        return _MOVE_LISTS[self.open_sides[index]]
+
+    def walk(
+        self, index: int, move: int, stops: Container[int], target: int = -1
+    ) -> Edge:
+        """
+        Follows a corridor from a cell until it reaches a stop cell.
+
+        Args:
+            index (int): Flat index of the cell the walk leaves from.
+            move (int): Index into ``MOVES`` of the first step.
+            stops (Container[int]): Flat indices where the walk ends.
+            target (int): One more flat index to stop at, -1 for none.
+
+        Returns:
+            Edge: The stop reached, the corridor length and its moves.
+        """
+        width = self.grid.width
+        open_sides = self.open_sides
+        letters = []
+        while True:
+            dx, dy, _, letter = MOVES[move]
+            index += dy * width + dx
+            letters.append(letter)
+            if index in stops or index == target:
+                return index, len(letters), "".join(letters)
+            back = (move + 2) % 4
+            move = next(m for m in _MOVE_LISTS[open_sides[index]] if m != back)
+
+    def anchors(self, cell: Tuple[int, int], target: int = -1) -> List[Edge]:
+        """
+        Connects any open cell to the nodes at both ends of its corridor.
+
+        Args:
+            cell (Tuple[int, int]): (x, y) of the cell.
+            target (int): Flat index of another cell that also ends a
+            walk, so that two cells on one corridor meet directly.
+
+        Returns:
+            List[Edge]: (node, length, moves) from the cell, or the cell
+            itself with length 0 when it already is a node.
+        """
+        index = self.grid.index(*cell)
+        if index in self.edges:
+            return [(index, 0, "")]
+        return [
+            self.walk(index, move, self.edges, target)
+            for move in self.open_moves(index)
+        ]
+
+    def solve(self, start: Tuple[int, int], goal: Tuple[int, int]) -> str:
+        """
+        Finds the shortest path between two cells with Dijkstra's algorithm.
+
+        Args:
+            start (Tuple[int, int]): (x, y) cell the path starts from.
+            goal (Tuple[int, int]): (x, y) cell the path ends at.
+
+        Returns:
+            str: The N/E/S/W moves from ``start`` to ``goal`` expanded to
+            single cells, or an empty string if ``goal`` is unreachable.
+        """
+        goal_i = self.grid.index(*goal)
+        start_i = self.grid.index(*start)
+        if start_i == goal_i:
+            return ""
+
+        ends: Dict[int, Tuple[int, str]] = {}
+        for node, length, moves in self.anchors(goal, start_i):
+            if node not in ends or length < ends[node][0]:
+                ends[node] = (length, self.reverse(moves))
+
+        dist: Dict[int, int] = {}
+        previous: Dict[int, Tuple[int, str]] = {}
+        heap: List[Tuple[int, int]] = []
+        for node, length, moves in self.anchors(start, goal_i):
+            if length < dist.get(node, length + 1):
+                dist[node] = length
+                previous[node] = (-1, moves)
+                heapq.heappush(heap, (length, node))
+
+        best: Optional[Tuple[int, int]] = None
+        while heap:
+            length, node = heapq.heappop(heap)
+            if length > dist[node]:
+                continue
+            if best is not None and length >= best[0]:
+                break
+            if node == goal_i:
+                best = (length, node)
+                break
+            if node in ends and (
+                best is None or length + ends[node][0] < best[0]
+            ):
+                best = (length + ends[node][0], node)
+            for target, weight, moves in self.edges.get(node, ()):
+                total = length + weight
+                if total < dist.get(target, total + 1):
+                    dist[target] = total
+                    previous[target] = (node, moves)
+                    heapq.heappush(heap, (total, target))
+
+        if best is None:
+            return ""
+
+        node = best[1]
+        parts = [] if node == goal_i else [ends[node][1]]
+        while node != -1:
+            node, moves = previous[node]
+            parts.append(moves)
+        parts.reverse()
+        return "".join(parts)
+
+    def distances(self, source: Tuple[int, int]) -> Dict[int, int]:
+        """
+        Computes the corridor distance from a cell to every node.
+
+        Args:
+            source (Tuple[int, int]): (x, y) cell to measure from.
+
+        Returns:
+            Dict[int, int]: Flat node index to its distance in cells.
+        """
+        dist: Dict[int, int] = {}
+        heap: List[Tuple[int, int]] = []
+        for node, length, _ in self.anchors(source):
+            if length < dist.get(node, length + 1):
+                dist[node] = length
+                heapq.heappush(heap, (length, node))
+
+        while heap:
+            length, node = heapq.heappop(heap)
+            if length > dist[node]:
+                continue
+            for target, weight, _ in self.edges[node]:
+                total = length + weight
+                if total < dist.get(target, total + 1):
+                    dist[target] = total
+                    heapq.heappush(heap, (total, target))
+        return dist
+
+    @staticmethod
+    def reverse(moves: str) -> str:
+        """
+        Reverses a move string, walking it backwards.
+
+        Args:
+            moves (str): N/E/S/W moves.
+
+        Returns:
+            str: The moves that undo ``moves`` in reverse order.
+        """
+        return moves[::-1].translate(str.maketrans("NESW", "SWNE"))
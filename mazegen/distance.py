@@ -0,0 +1,150 @@
+from array import array
+from collections import deque
+from typing import Optional, Tuple
+from .grid import Grid, MOVES
+
+
+class DistanceField:
+    """
+    Shortest distance from every cell to one source cell, e.g. the exit.
+
+    The field is computed once with a BFS and kept as a compact typed
+    array next to the grid: ``uint16`` while every distance fits, else
+    ``uint32``. Unreachable cells, such as the '42' pattern, hold the
+    type's maximum. Afterwards "how far is the exit" and "which way is
+    it" are O(1) lookups instead of a new search per keypress.
+
+    Attributes:
+        width (int): The width of the grid in cells.
+        height (int): The height of the grid in cells.
+        source (Tuple[int, int]): (x, y) cell all distances lead to.
+        values (array): Distance of every cell, indexed ``y * width + x``.
+        unreachable (int): Value stored for cells that cannot reach source.
+    """
+
+    __slots__ = ("width", "height", "source", "values", "unreachable")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        source: Tuple[int, int],
+        values: array
+    ) -> None:
+        """
+        Wraps an already computed distance array.
+
+        Args:
+            width (int): The width of the grid in cells.
+            height (int): The height of the grid in cells.
+            source (Tuple[int, int]): (x, y) cell all distances lead to.
+            values (array): ``"H"`` or ``"I"`` array of ``width * height``
+            distances.
+
+        Returns:
+            None
+        """
+        self.width = width
+        self.height = height
+        self.source = source
+        self.values = values
+        self.unreachable = (1 << values.itemsize * 8) - 1
+
+    @staticmethod
+    def typecode(cells: int) -> str:
+        """
+        Picks the smallest unsigned array type that holds every distance.
+
+        Args:
+            cells (int): Number of cells in the grid.
+
+        Returns:
+            str: ``"H"`` (uint16) or ``"I"`` (uint32).
+        """
+        return "H" if cells < 0xFFFF else "I"
+
+    @classmethod
+    def from_grid(
+        cls, grid: Grid, source: Tuple[int, int]
+    ) -> 'DistanceField':
+        """
+        Runs one full BFS from ``source`` over the open passages.
+
+        Args:
+            grid (Grid): The maze grid.
+            source (Tuple[int, int]): (x, y) cell to measure from.
+
+        Returns:
+            DistanceField: The distances of every cell.
+        """
+        width, height = grid.width, grid.height
+        data = grid.data
+        code = cls.typecode(width * height)
+        values = array(code, [(1 << array(code).itemsize * 8) - 1])
+        values *= width * height
+        unreachable = values[0]
+
+        start = source[1] * width + source[0]
+        values[start] = 0
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            step = values[current] + 1
+            cy, cx = divmod(current, width)
+            walls = data[current]
+            for dx, dy, wall, _ in MOVES:
+                nx, ny = cx + dx, cy + dy
+                if walls & wall or not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                if values[neighbor] == unreachable:
+                    values[neighbor] = step
+                    queue.append(neighbor)
+
+        return cls(width, height, source, values)
+
+    def at(self, x: int, y: int) -> Optional[int]:
+        """
+        Returns the distance of a cell to the source.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            Optional[int]: The distance in moves, None if unreachable.
+        """
+        value = self.values[y * self.width + x]
+        return None if value == self.unreachable else value
+
+    def next_move(
+        self, grid: Grid, x: int, y: int
+    ) -> Optional[Tuple[str, int, int]]:
+        """
+        Finds the move from a cell that gets one step closer to the source.
+
+        Args:
+            grid (Grid): The maze grid the field was computed on.
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            Optional[Tuple[str, int, int]]: The N/E/S/W letter and the
+            (x, y) of the next cell, or None at the source or when the
+            source is unreachable.
+        """
+        here = self.at(x, y)
+        if not here:
+            return None
+        for dx, dy, wall, letter in MOVES:
+            nx, ny = x + dx, y + dy
+            if not grid.has_wall(x, y, wall) and self.at(nx, ny) == here - 1:
+                return letter, nx, ny
+        return None
+
+    @property
+    def max_distance(self) -> int:
+        """Largest finite distance, used to scale the heat map."""
+        return max(
+            (v for v in self.values if v != self.unreachable), default=0
+        )
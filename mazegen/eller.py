@@ -0,0 +1,195 @@
+import random
+from array import array
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from .cell import Cell
+from .maze import Maze
+from .mazefile import TextMazeWriter
+from .streams import MazeStreams
+from .grid import NORTH, EAST, SOUTH, WEST
+from .error_class import ConfigValueError, B, RS
+
+
+def group_rows(cells: Iterable[Tuple[int, int]]) -> Dict[int, Set[int]]:
+    """
+    Groups obstacle cells by row for quick per-row lookups.
+
+    Args:
+        cells (Iterable[Tuple[int, int]]): (x, y) obstacle cells.
+
+    Returns:
+        Dict[int, Set[int]]: Row number to the set of blocked columns.
+    """
+    rows: Dict[int, Set[int]] = {}
+    for x, y in cells:
+        rows.setdefault(y, set()).add(x)
+    return rows
+
+
+def eller_rows(
+    width: int,
+    height: int,
+    blocked: Dict[int, Set[int]],
+    rng: random.Random
+) -> Iterator[bytes]:
+    """
+    Generates a perfect maze one row at a time with Eller's algorithm.
+
+    Only the current row's set labels are kept (compacted to 0..width-1
+    and merged with a union-find), so memory is O(width) whatever the
+    height. Blocked cells, such as the '42' pattern, keep all four walls
+    and belong to no set. A set whose cells cannot go down because of
+    obstacles is first joined to a neighbouring set so that it is not
+    cut off. Complexity: O(W*H*a(W)) time, O(W) memory.
+
+    Args:
+        width (int): The width of the maze in cells.
+        height (int): The height of the maze in cells.
+        blocked (Dict[int, Set[int]]): Blocked columns per row.
+        rng (random.Random): The carving stream.
+
+    Yields:
+        bytes: The finished wall nibbles of each row, top to bottom.
+    """
+    labels = array("l", [-1]) * width
+    from_above = bytearray(width)
+    parent: List[int] = []
+
+    def find(label: int) -> int:
+        """
+        Returns the root of a label, halving the path on the way.
+
+        Args:
+            label (int): A set label of the current row.
+
+        Returns:
+            int: The root label.
+        """
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    for y in range(height):
+        row_blocked = blocked.get(y, set())
+        below_blocked = blocked.get(y + 1, set())
+        last = y == height - 1
+        walls = bytearray([15]) * width
+
+        remap: Dict[int, int] = {}
+        count = 0
+        for x in range(width):
+            if x in row_blocked:
+                labels[x] = -1
+            elif from_above[x]:
+                walls[x] &= ~NORTH
+                old = labels[x]
+                if old not in remap:
+                    remap[old] = count
+                    count += 1
+                labels[x] = remap[old]
+            else:
+                labels[x] = count
+                count += 1
+        parent[:] = range(count)
+
+        def join(x: int, force: bool) -> bool:
+            """
+            Joins cell x with its east neighbour if they are in
+            different sets and either ``force`` or a coin flip says so.
+
+            Args:
+                x (int): Column of the west cell.
+                force (bool): Whether to skip the coin flip.
+
+            Returns:
+                bool: True if the cells were joined.
+            """
+            a, b = labels[x], labels[x + 1]
+            if a < 0 or b < 0:
+                return False
+            ra, rb = find(a), find(b)
+            if ra == rb or not (force or rng.random() < 0.5):
+                return False
+            parent[rb] = ra
+            walls[x] &= ~EAST
+            walls[x + 1] &= ~WEST
+            return True
+
+        for x in range(width - 1):
+            join(x, last)
+
+        if last:
+            yield bytes(walls)
+            return
+
+        can_down = bytearray(count)
+        for x in range(width):
+            if labels[x] >= 0 and x not in below_blocked:
+                can_down[find(labels[x])] = 1
+
+        for x in list(range(width - 1)) + list(range(width - 2, -1, -1)):
+            a, b = labels[x], labels[x + 1]
+            if a < 0 or b < 0:
+                continue
+            da, db = can_down[find(a)], can_down[find(b)]
+            if (not da or not db) and join(x, True):
+                can_down[find(a)] = da | db
+
+        candidates: Dict[int, List[int]] = {}
+        for x in range(width):
+            if labels[x] >= 0 and x not in below_blocked:
+                candidates.setdefault(find(labels[x]), []).append(x)
+
+        from_above = bytearray(width)
+        for cells in candidates.values():
+            chosen = [x for x in cells if rng.random() < 0.5]
+            if not chosen:
+                chosen = [rng.choice(cells)]
+            for x in chosen:
+                walls[x] &= ~SOUTH
+                from_above[x] = 1
+
+        for x in range(width):
+            if labels[x] >= 0:
+                labels[x] = find(labels[x])
+
+        yield bytes(walls)
+
+
+def stream_maze(maze: Maze) -> int:
+    """
+    Writes an Eller maze straight to OUTPUT_FILE without building a grid.
+
+    The pattern and carving streams are derived from the SEED exactly as
+    ``MazeGenerator`` does, so the file matches an in-memory ELLER run of
+    the same config. No solution is recorded, since solving needs the
+    whole grid.
+
+    Args:
+        maze (Maze): A perfect maze configured with ALGORITHM=ELLER.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ConfigValueError: If the maze is not a perfect ELLER maze.
+    """
+    if maze.algo != "ELLER":
+        raise ConfigValueError(
+            f"Streaming generation requires {B}ALGORITHM=ELLER{RS}"
+        )
+    if not maze.perfection:
+        raise ConfigValueError(
+            f"Streaming generation requires {B}PERFECT=True{RS}: the "
+            "imperfect pass needs the whole grid"
+        )
+
+    streams = MazeStreams(maze.seed)
+    blocked = group_rows(Cell.place_pattern(maze, streams.pattern))
+
+    with TextMazeWriter(maze.output_file) as writer:
+        writer.write_rows(eller_rows(
+            maze.width, maze.height, blocked, streams.carving
+        ))
+        writer.finish(maze.seed, maze.entry, maze.exit, "")
+        return writer.rows
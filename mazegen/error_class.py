@@ -87,7 +87,11 @@ class ConfigKeyError(ConfigError):
         Returns:
             tuple[str, ...]: Optional configuration keys.\n
         """
-        return ("SEED", "ALGORITHM")
+        return (
+            "SEED", "ALGORITHM", "SOLVER", "TILE_SIZE",
+            "PROFILE", "PROFILE_DUMP", "FPS", "PATTERN",
+            "BRAID", "CACHE_DIR", "CACHE_SIZE"
+        )
 
 
 class ConfigValueError(ConfigError):
@@ -102,6 +106,18 @@ class ConfigValueError(ConfigError):
         super().__init__(message)
 
 
+class MazeFileError(Exception):
+    """
+    Raised when a saved maze file is truncated, corrupted or of an
+    unsupported version.\n
+
+    Args:
+        message (str): The error message. Defaults to "Invalid maze file".\n
+    """
+    def __init__(self, message: str = "Invalid maze file") -> None:
+        super().__init__(message)
+
+
 def report_error(error: Exception) -> None:
     """
     Prints a standardized diagnostic report including error type
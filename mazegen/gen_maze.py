@@ -1,37 +1,58 @@
+import os
 import sys
 import tty
 import time
-import random
 import shutil
 import termios
-from .cell import Cell
+from .cell import Cell, CellRows
+from .grid import Grid
 from .maze import Maze
 from .error_class import Y, RS
 from .terminal_ctl import TerminalCtl
-from typing import List, Tuple, Optional, Set
+from . import carvers, solver, mazefile, tiled, vectorized
+from .mazefile import MazeData
+from .corridors import count_dead_ends
+from .distance import DistanceField
+from .renderer import PathIndex, Renderer
+from .profiler import Profiler, count_passages
+from .animation import FrameScheduler
+from .streams import MazeStreams
+from .cache import MazeCache
+from typing import (
+    Any, Callable, Iterable, Iterator, List, Tuple, Optional, Set, Union
+)
 
 
-NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
-DIRECTIONS = (
-    (0, -1, NORTH, SOUTH),
-    (0, 1, SOUTH, NORTH),
-    (1, 0, EAST, WEST),
-    (-1, 0, WEST, EAST)
-)
+PathCoords = Union[List[Tuple[int, int]], PathIndex]
 
 
 class MazeGenerator:
     """
     Class responsible for generating and solving mazes.
 
-    This class handles the core logic of creating mazes (via DFS or Wilson's),
+    This class handles the core logic of creating mazes (via DFS, Wilson's,
+    Eller's, Kruskal's, Prim's, or the vectorized Binary-Tree and
+    Sidewinder),
     modifying them (making them imperfect), solving them using BFS,
+    bidirectional BFS, A* or Dijkstra on the corridor graph,
     and rendering the result to the terminal or a file.
 
+    The per-cell algorithms are step iterators from ``carvers`` that only
+    touch the grid; this class drains them headless, or batches their
+    carve events into animation frames.
+
     Attributes:
         __maze (Maze): The maze configuration and properties.
-        __cells (List[List[Cell]]): The 2D grid of maze cells.
+        __grid (Grid): The packed grid of maze cells.
         __solution (str): The solution path string.
+        __expanded (int): Cells expanded by the last solver run.
+        __distances (Optional[DistanceField]): Distances to the exit, built
+        on demand.
+        __renderer (Optional[Renderer]): Frame renderer, built on first draw.
+        __profiler (Profiler): Phase timers and counters, active when the
+        config sets PROFILE or PROFILE_DUMP.
+        __cache (Optional[MazeCache]): Result cache, set when the config
+        has a CACHE_DIR and a SEED.
     """
 
     def __init__(self, config_file: str) -> None:
@@ -41,284 +62,372 @@ class MazeGenerator:
         Args:
             config_file (str): Path to the configuration file.
         """
-        self.__maze = Maze(config_file)
-        random.seed(self.__maze.seed)
-        self.__cells: List[List[Cell]] = Cell.get_cells(self.__maze)
-        self.__solution: str = ""
+        self.__setup(Maze(config_file))
 
-    def get_maze(self) -> Maze:
+    @classmethod
+    def from_maze(cls, maze: Maze) -> 'MazeGenerator':
         """
-        Returns the current maze object.
+        Builds a generator around an already configured maze.
+
+        Args:
+            maze (Maze): The maze configuration to generate.
 
         Returns:
-            Maze: The internal maze instance.
+            MazeGenerator: A generator ready for ``generate_maze``.
         """
-        return self.__maze
-
-    def get_cells(self) -> List[List[Cell]]:
+        gen = cls.__new__(cls)
+        gen.__setup(maze)
+        return gen
+
+    @classmethod
+    def from_params(
+        cls,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+        perfect: bool,
+        seed: Optional[int] = None,
+        algo: str = "DFS",
+        output_file: str = "maze_output.txt",
+        solver: str = "BFS"
+    ) -> 'MazeGenerator':
         """
-        Returns the current cells object.
+        Builds a headless generator that never touches stdin or stdout.
 
-        Returns:
-            List[List[Cell]]: The 2D grid of Cell objects.
-        """
-        return self.__cells
+        The theme menu and the '42' pattern prompts are skipped, and
+        ``generate_maze()`` without visualization runs as pure compute, so
+        the result can be used from worker processes, cron jobs or tests.
 
-    def get_solution_path(self) -> str:
-        """
-        Returns the short solution path for the maze.
+        Args:
+            width (int): The width of the maze in cells.
+            height (int): The height of the maze in cells.
+            entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+            exit (Tuple[int, int]): (x, y) coordinates of the exit.
+            perfect (bool): Whether the maze must have no loops.
+            seed (Optional[int]): Random seed; current time when None.
+            algo (str): Generation algorithm name. Defaults to "DFS".
+            output_file (str): Path used by ``write_output``.
+            solver (str): Solver name. Defaults to "BFS".
 
         Returns:
-            str: A string representing the moves (N, S, E, W).
+            MazeGenerator: A generator ready for ``generate_maze``.
+
+        Raises:
+            ConfigValueError: If any value is invalid.
         """
-        return self.__solution
+        return cls.from_maze(
+            Maze.from_params(
+                width, height, entry, exit, perfect, seed, algo,
+                output_file, solver
+            )
+        )
 
-    def generate_maze(self, visualizing: bool = False) -> None:
+    def __setup(self, maze: Maze) -> None:
         """
-        Triggers the maze generation based on the selected algorithm.
+        Derives the RNG streams and allocates the grid for the given maze.
 
         Args:
-            visualizing (bool): Whether to show the generation process.
-            Defaults to False.
+            maze (Maze): The maze configuration.
 
         Returns:
             None
         """
-        def dfs_maze_generator(skip: bool) -> bool:
-            """
-            Generates a maze using the Randomized Depth-First Search algorithm.
+        self.__maze = maze
+        self.__streams = MazeStreams(maze.seed)
+        self.__grid: Grid = Cell.get_grid(maze, self.__streams.pattern)
+        self.__solution: str = ""
+        self.__expanded: int = 0
+        self.__distances: Optional[DistanceField] = None
+        self.__renderer: Optional[Renderer] = None
+        self.__profiler = Profiler(maze.profile, maze.profile_dump)
+        self.__cache: Optional[MazeCache] = None
+        if maze.cache_dir is not None and maze.cache_key is not None:
+            self.__cache = MazeCache.shared(
+                maze.cache_dir, maze.cache_size << 20
+            )
 
-            This is a recursive backtracker implementation
-            that creates a perfect maze by carving paths
-            until all reachable cells are visited.
+    def get_maze(self) -> Maze:
+        """
+        Returns the current maze object.
 
-            Args:
-                skip (bool): Whether to skip the visualization.
+        Returns:
+            Maze: The internal maze instance.
+        """
+        return self.__maze
 
-            Returns:
-                bool: Updated skip status.
-            """
-            sx, sy = self.__maze.entry
-            stack: List[Tuple[int, int]] = [(sx, sy)]
-            self.__cells[sy][sx].visited = True
+    def get_grid(self) -> Grid:
+        """
+        Returns the packed grid holding walls and flags of every cell.
 
-            while stack:
-                cx, cy = stack[-1]
-                neighbors = []
-                for dx, dy, wall, opp_wall in DIRECTIONS:
-                    nx, ny = cx + dx, cy + dy
+        Returns:
+            Grid: The internal grid instance.
+        """
+        return self.__grid
 
-                    if (
-                        0 <= nx < self.__maze.width
-                        and 0 <= ny < self.__maze.height
-                    ):
-                        if not self.__cells[ny][nx].visited:
-                            neighbors.append((nx, ny, wall, opp_wall))
+    def get_cells(self) -> CellRows:
+        """
+        Returns a lazy ``cells[y][x]`` view of the current grid.
 
-                if neighbors:
-                    nx, ny, wall, opp_wall = random.choice(neighbors)
+        Returns:
+            CellRows: The 2D compatibility view of Cell objects.
+        """
+        return CellRows(self.__grid)
 
-                    self.__cells[cy][cx].grid &= ~wall
-                    self.__cells[ny][nx].grid &= ~opp_wall
+    def get_solution_path(self) -> str:
+        """
+        Returns the short solution path for the maze.
 
-                    self.__cells[ny][nx].visited = True
-                    stack.append((nx, ny))
+        Returns:
+            str: A string representing the moves (N, S, E, W).
+        """
+        return self.__solution
 
-                    if (
-                        visualizing and not skip
-                        and TerminalCtl.check_for_enter()
-                    ):
-                        skip = True
+    def get_expanded_nodes(self) -> int:
+        """
+        Returns how many cells the last solver run expanded.
 
-                    if visualizing and not skip:
-                        self.display_maze(visualizing=visualizing)
-                        time.sleep(0.001)
-                        TerminalCtl.reset_cursor()
-                else:
-                    stack.pop()
+        Returns:
+            int: The node-expansion count of the configured SOLVER.
+        """
+        return self.__expanded
 
-            return skip
+    def get_profiler(self) -> Profiler:
+        """
+        Returns the phase timers and counters of this generator.
 
-        def wilson_maze_generator(skip: bool) -> bool:
-            """
-            Generates a maze using Wilson's algorithm.
+        Returns:
+            Profiler: Disabled unless the config sets PROFILE.
+        """
+        return self.__profiler
 
-            This algorithm produces an unbiased uniform
-            spanning tree of the grid, ensuring a perfectly
-            random distribution of mazes.
+    def get_cache(self) -> Optional[MazeCache]:
+        """
+        Returns the result cache of this generator.
 
-            Args:
-                skip (bool): Whether to skip the visualization.
+        Returns:
+            Optional[MazeCache]: None unless the config sets CACHE_DIR
+            and SEED.
+        """
+        return self.__cache
 
-            Returns:
-                bool: Updated skip status.
-            """
-            width, height = self.__maze.width, self.__maze.height
-            unvisited = [(x, y) for x in range(width) for y in range(height)]
+    def get_distance_field(self) -> DistanceField:
+        """
+        Returns the distance of every cell to the exit, computed once.
 
-            root = self.__maze.entry
-            self.__cells[root[1]][root[0]].visited = True
-            unvisited.remove(root)
+        Returns:
+            DistanceField: One BFS from the exit, reused by every lookup.
+        """
+        if self.__distances is None:
+            self.__distances = DistanceField.from_grid(
+                self.__grid, self.__maze.exit
+            )
+        return self.__distances
 
-            while unvisited:
-                current = None
-                while not current and unvisited:
-                    current = random.choice(unvisited)
+    def generate_maze(self, visualizing: bool = False) -> None:
+        """
+        Triggers the maze generation based on the selected algorithm.
 
-                    if self.__cells[current[1]][current[0]].ft_pattern:
-                        unvisited.remove(current)
-                        current = None
+        Without visualization the terminal is left untouched: no screen
+        clearing, no cbreak mode and no Enter polling. With a CACHE_DIR,
+        a maze already generated from the same settings is restored from
+        the cache instead, and a new one is stored there once solved.
 
-                if not current:
-                    break
+        Args:
+            visualizing (bool): Whether to show the generation process.
+            Defaults to False.
 
-                path = [current]
+        Returns:
+            None
+        """
+        skip = False
+        algo = self.__maze.algo.upper()
+        grid = self.__grid
+        old_settings: Optional[List[Any]] = None
+        profiler = self.__profiler
+        streams = self.__streams
 
-                while not self.__cells[current[1]][current[0]].visited:
-                    dx, dy, wall, opp_wall = random.choice(DIRECTIONS)
-                    nx, ny = current[0] + dx, current[1] + dy
+        if visualizing:
+            TerminalCtl.clear_screen()
+            TerminalCtl.hide_cursor()
+            if self.__renderer is not None:
+                self.__renderer.invalidate()
 
-                    if 0 <= nx < width and 0 <= ny < height:
-                        if self.__cells[ny][nx].ft_pattern:
-                            continue
-                        neighbor = (nx, ny)
+        if self.__load_cached():
+            if visualizing:
+                self.display_maze(visualizing=visualizing)
+                TerminalCtl.reset_cursor(row=self.__maze.height * 2 + 1)
+                TerminalCtl.show_cursor()
+            return
 
-                        if neighbor in path:
-                            path = path[:path.index(neighbor) + 1]
-                        else:
-                            path.append(neighbor)
-                        current = neighbor
-
-                for i in range(len(path) - 1):
-                    cx1, cy1 = path[i]
-                    cx2, cy2 = path[i + 1]
-
-                    for dx, dy, wall, opp_wall in DIRECTIONS:
-                        if (cx1 + dx == cx2) and (cy1 + dy == cy2):
-                            self.__cells[cy1][cx1].grid &= ~wall
-                            self.__cells[cy2][cx2].grid &= ~opp_wall
-                            break
-
-                    self.__cells[cy1][cx1].visited = True
-                    if (cx1, cy1) in unvisited:
-                        unvisited.remove((cx1, cy1))
-                    if (
-                        visualizing and not skip
-                        and TerminalCtl.check_for_enter()
-                    ):
+        if visualizing:
+            old_settings = termios.tcgetattr(sys.stdin)
+
+        with profiler.session():
+            try:
+                if old_settings is not None:
+                    tty.setcbreak(sys.stdin.fileno())
+                with profiler.phase("carving"):
+                    if self.__maze.tile_size:
+                        tiled.tiled_dfs(
+                            grid, self.__maze.tile_size, streams.carving
+                        )
+                        skip = True
+                    elif algo == "BINARY_TREE":
+                        vectorized.binary_tree(grid, streams.carving)
+                        skip = True
+                    elif algo == "SIDEWINDER":
+                        vectorized.sidewinder(grid, streams.carving)
                         skip = True
-                    if visualizing and not skip:
-                        self.display_maze(visualizing=visualizing)
-                        time.sleep(0.001)
-                        TerminalCtl.reset_cursor()
+                    else:
+                        carver = carvers.CARVERS.get(algo, carvers.dfs)
+                        skip = self.__replay(
+                            carver(grid, self.__maze.entry, streams.carving),
+                            not visualizing, grid.width * grid.height, 0.001
+                        )
+                if profiler.enabled:
+                    carved = count_passages(grid)
+                    profiler.count("passages carved", carved)
+                if not self.__maze.perfection:
+                    with profiler.phase("make_imperfect"):
+                        braid = self.__maze.braid
+                        if braid is not None:
+                            vectorized.braid(grid, streams.braiding, braid)
+                            skip = True
+                        else:
+                            skip = self.__replay(
+                                carvers.make_imperfect(grid, streams.braiding),
+                                skip or not visualizing,
+                                count_dead_ends(grid), 0.1
+                            )
+                    if profiler.enabled:
+                        profiler.count(
+                            "walls removed", count_passages(grid) - carved
+                        )
+            finally:
+                if old_settings is not None:
+                    termios.tcsetattr(
+                        sys.stdin, termios.TCSADRAIN, old_settings
+                    )
+
+            self.__distances = None
+            stats = solver.SearchStats()
+            with profiler.phase("solve"):
+                self.__solution = solver.solve(
+                    grid, self.__maze.entry, self.__maze.exit,
+                    self.__maze.solver, stats
+                )
+            self.__expanded = stats.expanded
+            profiler.count("nodes expanded", stats.expanded)
+            self.__store_cached()
 
-            return skip
+        if visualizing:
+            if skip:
+                TerminalCtl.reset_cursor()
+                self.display_maze(visualizing=visualizing)
+            TerminalCtl.reset_cursor(row=self.__maze.height * 2 + 1)
+            TerminalCtl.show_cursor()
 
-        def make_imperfect(skip: bool, chance: float = 0.7) -> bool:
-            """
-            Creates an imperfect maze by randomly removing walls at dead ends.
+    def restore(self, data: MazeData) -> None:
+        """
+        Replaces the walls and solution with a saved maze of the same
+        settings, e.g. a cache entry.
 
-            Args:
-                skip (bool): Whether to skip the visualization.
-                chance (float): Probability (0.0 to 1.0) of removing a wall.
+        The grid keeps its pattern flags, and the distance field is
+        rebuilt on next use. The solver is not run, so
+        the expanded node count is reset to 0.
 
-            Returns:
-                bool: Updated skip status.
-            """
-            for y in range(self.__maze.height):
-                for x in range(self.__maze.width):
-                    if self.__cells[y][x].ft_pattern is True:
-                        continue
-
-                    walls = []
-                    for i, (dx, dy, wall, opp) in enumerate(DIRECTIONS):
-                        if (self.__cells[y][x].grid & wall):
-                            walls.append(DIRECTIONS[i])
-
-                    if len(walls) == 3 and random.random() < chance:
-                        dx, dy, wall, opp_wall = random.choice(walls)
-                        nx, ny = x + dx, y + dy
-                        if (
-                            0 <= nx < self.__maze.width
-                            and 0 <= ny < self.__maze.height
-                        ):
-                            if self.__cells[ny][nx].ft_pattern:
-                                continue
-
-                            self.__cells[y][x].grid &= ~wall
-                            self.__cells[ny][nx].grid &= ~opp_wall
-
-                            if (
-                                visualizing and not skip
-                                and TerminalCtl.check_for_enter()
-                            ):
-                                skip = True
-                            if visualizing and not skip:
-                                TerminalCtl.reset_cursor()
-                                self.display_maze(visualizing=visualizing)
-                                time.sleep(0.1)
-
-            return skip
-
-        def get_solution_path() -> str:
-            """
-            Finds the shortest path from entry to exit using BFS.
+        Args:
+            data (MazeData): A maze matching this generator's config.
 
-            Returns:
-                str: A string representing the moves (N, S, E, W).
-            """
-            queue = [(self.__maze.entry, "")]
-            visited = {self.__maze.entry}
+        Returns:
+            None
+        """
+        grid = self.__grid
+        for y in range(grid.height):
+            start = y * grid.width
+            grid.set_row_walls(y, data.walls[start:start + grid.width])
+        self.__solution = data.solution
+        self.__expanded = 0
+        self.__distances = None
+
+    def __load_cached(self) -> bool:
+        """
+        Restores the maze from the cache when it holds a matching entry.
 
-            while queue:
-                (cx, cy), path = queue.pop(0)
+        Returns:
+            bool: True on a cache hit.
+        """
+        cache = self.__cache
+        maze = self.__maze
+        if cache is None or maze.cache_key is None:
+            return False
+        with self.__profiler.phase("cache_lookup"):
+            data = cache.load(maze.cache_key)
+        if data is None or (
+            data.width, data.height, data.entry, data.exit, data.seed
+        ) != (maze.width, maze.height, maze.entry, maze.exit, maze.seed):
+            self.__profiler.count("cache misses")
+            return False
+        self.restore(data)
+        self.__profiler.count("cache hits")
+        return True
+
+    def __store_cached(self) -> None:
+        """
+        Saves the solved maze into the cache, if there is one.
 
-                if (cx, cy) == self.__maze.exit:
-                    return path
+        Caching is best effort: an unwritable cache folder is ignored.
 
-                for dx, dy, wall, move in [
-                    (0, -1, NORTH, "N"), (1, 0, EAST, "E"),
-                    (0, 1, SOUTH, "S"), (-1, 0, WEST, "W")
-                ]:
-                    nx, ny = cx + dx, cy + dy
-                    if (0 <= nx < self.__maze.width and
-                            0 <= ny < self.__maze.height and
-                            not (self.__cells[cy][cx].grid & wall) and
-                            (nx, ny) not in visited):
-                        visited.add((nx, ny))
-                        queue.append(((nx, ny), path + move))
+        Returns:
+            None
+        """
+        cache = self.__cache
+        key = self.__maze.cache_key
+        if cache is None or key is None:
+            return
+        try:
+            cache.store(key, self.to_data())
+        except OSError:
+            pass
 
-            return ""
+    def __replay(
+        self,
+        steps: Iterator[carvers.Carve],
+        skip: bool,
+        expected: int,
+        step_time: float
+    ) -> bool:
+        """
+        Consumes the carve events of a generation pass.
 
-        skip = False
-        algo = self.__maze.algo.upper()
+        Events are drained at full speed when the animation is skipped or
+        off, else batched into frames; pressing Enter drains the rest.
 
-        TerminalCtl.clear_screen()
-        TerminalCtl.hide_cursor()
+        Args:
+            steps (Iterator[carvers.Carve]): The pass to run.
+            skip (bool): Whether to run it without drawing.
+            expected (int): Estimated number of events, for pacing.
+            step_time (float): Nominal duration of one event in seconds.
 
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            tty.setcbreak(sys.stdin.fileno())
-            if algo == "WILSON":
-                skip = wilson_maze_generator(skip)
-            else:
-                skip = dfs_maze_generator(skip)
-            if not self.__maze.perfection:
-                skip = make_imperfect(skip)
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        Returns:
+            bool: Updated skip status.
+        """
+        if skip:
+            carvers.drain(steps)
+            return True
 
-        if visualizing:
-            if skip:
-                TerminalCtl.reset_cursor()
-                self.display_maze(visualizing=visualizing)
-            self.__solution = get_solution_path()
-            TerminalCtl.reset_cursor(row=self.__maze.height * 2 + 1)
-            TerminalCtl.show_cursor()
+        frames = self.__frames(expected, step_time)
+        for x, y, wall in steps:
+            if frames.step(((x, y), carvers.neighbor(x, y, wall))):
+                carvers.drain(steps)
+                return True
+        return frames.flush()
 
     def solve_maze(self, visualizing: bool = False) -> None:
         """
-        Finds the shortest path from entry to exit using BFS.
+        Finds the shortest path from entry to exit with the configured
+        SOLVER, animating the cells that solver explores.
 
         Args:
             visualizing (bool): Whether to visualize the solving process.
@@ -326,6 +435,9 @@ class MazeGenerator:
         Returns:
             None
         """
+        if not visualizing:
+            return
+
         BLOCK = "\u2588"
 
         TerminalCtl.hide_cursor()
@@ -335,82 +447,176 @@ class MazeGenerator:
         skip = False
         exp_c = self.__maze.theme.theme['EXP_C']
         reset = self.__maze.theme.reset
-        queue = [(self.__maze.entry, "")]
+        grid = self.__grid
+        parents = bytearray(grid.width * grid.height)
+        search = solver.SEARCHES[self.__maze.solver]
+        stats = solver.SearchStats()
         visited: Set[Tuple[int, int]] = {self.__maze.entry}
+        profiler = self.__profiler
         old_settings = termios.tcgetattr(sys.stdin)
 
-        try:
-            tty.setcbreak(sys.stdin.fileno())
-
-            while queue:
-                (cx, cy), path = queue.pop(0)
-
-                if (cx, cy) == self.__maze.exit:
-                    coords = self.get_path_coords(self.__maze.entry, path)
-                    tmp_coords: List[Tuple[int, int]] = []
-
-                    if visualizing:
-                        for coord in coords:
-                            if (
-                                visualizing and not skip
-                                and TerminalCtl.check_for_enter()
-                            ):
-                                skip = True
-                            if skip:
-                                TerminalCtl.reset_cursor()
-                                self.display_maze(visualizing, coords, visited)
-                                return
-                            TerminalCtl.reset_cursor()
-                            tmp_coords.append(coord)
-                            self.display_maze(visualizing, tmp_coords, visited)
-                            time.sleep(0.001)
-
-                    return
-
-                for dx, dy, wall, move in [
-                    (0, -1, NORTH, "N"), (1, 0, EAST, "E"),
-                    (0, 1, SOUTH, "S"), (-1, 0, WEST, "W")
-                ]:
-                    nx, ny = cx + dx, cy + dy
+        def draw_explored(passages: List[Tuple[int, int, int, int]]) -> None:
+            """
+            Paints the passages the solver explored since the last frame.
+
+            Args:
+                passages (List[Tuple[int, int, int, int]]): (x, y, nx, ny)
+                steps of the search.
+
+            Returns:
+                None
+            """
+            with profiler.phase("display_maze"):
+                for cx, cy, nx, ny in passages:
+                    TerminalCtl.reset_cursor(
+                        col=(cx * 4 + 3) + (nx - cx) * 2,
+                        row=(cy * 2 + 2) + (ny - cy)
+                    )
+                    print(f"{exp_c}{BLOCK * 2}{reset}")
 
                     if (
-                        0 <= nx < self.__maze.width
-                        and 0 <= ny < self.__maze.height
-                        and not (self.__cells[cy][cx].grid & wall)
+                        (nx, ny) != self.__maze.exit
+                        and (nx, ny) != self.__maze.entry
                     ):
-                        if (nx, ny) not in visited:
-                            visited.add((nx, ny))
-                            queue.append(((nx, ny), path + move))
-
-                        if (
-                            visualizing and not skip
-                            and TerminalCtl.check_for_enter()
-                        ):
-                            skip = True
+                        TerminalCtl.reset_cursor(
+                            col=nx * 4 + 3, row=ny * 2 + 2
+                        )
+                        print(f"{exp_c}{BLOCK * 2}{reset}")
+                sys.stdout.flush()
+            profiler.count("frames drawn")
+
+        with profiler.session(), profiler.phase("solve"):
+            try:
+                tty.setcbreak(sys.stdin.fileno())
+
+                explore = self.__frames(
+                    grid.width * grid.height, 0.001, draw_explored
+                )
+                for cx, cy, nx, ny in search(
+                    grid, self.__maze.entry, self.__maze.exit, parents, stats
+                ):
+                    visited.add((cx, cy))
+                    visited.add((nx, ny))
+                    if not skip:
+                        skip = explore.step(((cx, cy, nx, ny),))
+                if not skip:
+                    skip = explore.flush()
+
+                if self.__renderer is not None:
+                    self.__renderer.invalidate()
+
+                self.__expanded = stats.expanded
+                profiler.count("nodes expanded", stats.expanded)
+                path = solver.rebuild_path(
+                    grid.width, parents, self.__maze.exit
+                )
+                coords = self.get_path_coords(self.__maze.entry, path)
+                tmp_coords = PathIndex()
+                trail = self.__frames(
+                    len(coords), 0.001,
+                    lambda cells: self.draw_cells(cells, tmp_coords, visited)
+                )
 
-                        if visualizing and not skip:
-                            bridge_col = (cx * 4 + 3) + (dx * 2)
-                            bridge_row = (cy * 2 + 2) + dy
+                for coord in coords:
+                    if skip:
+                        break
+                    dirty = [coord]
+                    if tmp_coords.head is not None:
+                        dirty.append(tmp_coords.head)
+                    tmp_coords.append(coord)
+                    skip = trail.step(dirty)
+                if not skip:
+                    skip = trail.flush()
+
+                if skip:
+                    TerminalCtl.reset_cursor()
+                    self.display_maze(visualizing, coords, visited)
+            finally:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                TerminalCtl.show_cursor()
+                if visualizing:
+                    TerminalCtl.reset_cursor(row=self.__maze.height * 2 + 2)
+
+    def __poll_enter(self) -> bool:
+        """
+        Checks whether Enter was hit to skip the running animation.
 
-                            TerminalCtl.reset_cursor(
-                                col=bridge_col, row=bridge_row
-                            )
-                            print(f"{exp_c}{BLOCK * 2}{reset}")
-
-                            if (
-                                (nx, ny) != self.__maze.exit
-                                and (nx, ny) != self.__maze.entry
-                            ):
-                                TerminalCtl.reset_cursor(
-                                    col=nx * 4 + 3, row=ny * 2 + 2
-                                )
-                                print(f"{exp_c}{BLOCK * 2}{reset}", flush=True)
-                            time.sleep(0.001)
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            TerminalCtl.show_cursor()
-            if visualizing:
-                TerminalCtl.reset_cursor(row=self.__maze.height * 2 + 2)
+        Returns:
+            bool: True if Enter is in the input buffer.
+        """
+        with self.__profiler.phase("check_for_enter"):
+            return TerminalCtl.check_for_enter()
+
+    def __pause(self, delay: float) -> None:
+        """
+        Waits out the rest of an animation frame.
+
+        Args:
+            delay (float): Seconds to sleep.
+
+        Returns:
+            None
+        """
+        with self.__profiler.phase("sleep"):
+            time.sleep(delay)
+
+    def __frames(
+        self,
+        expected: int,
+        step_time: float,
+        draw: Optional[Callable[[List[Any]], None]] = None
+    ) -> FrameScheduler[Any]:
+        """
+        Starts a frame scheduler for one animation at the configured FPS.
+
+        Args:
+            expected (int): Estimated number of steps of the animation.
+            step_time (float): Nominal duration of one step in seconds.
+            draw (Optional[Callable[[List[Any]], None]]): Draws the changes
+            of a frame; ``draw_cells`` when None.
+
+        Returns:
+            FrameScheduler[Any]: The scheduler, with its clock started.
+        """
+        return FrameScheduler(
+            draw or self.draw_cells, self.__poll_enter, self.__pause,
+            self.__maze.fps, step_time, expected
+        )
+
+    def draw_cells(
+        self,
+        cells: Iterable[Tuple[int, int]],
+        path_coords: Optional[PathCoords] = None,
+        visited_coords: Optional[Set[Tuple[int, int]]] = None
+    ) -> None:
+        """
+        Redraws only the given cells of the frame already on screen.
+
+        Falls back to a full ``display_maze`` from the top-left corner when
+        no frame is known to be on screen yet.
+
+        Args:
+            cells (Iterable[Tuple[int, int]]): Cells whose state changed.
+            path_coords (Optional[PathCoords]): Coordinates for the path;
+            pass a PathIndex that grows between calls to avoid reindexing.
+            visited_coords (Optional[Set[Tuple[int, int]]]):
+            Coordinates for explored nodes.
+
+        Returns:
+            None
+        """
+        if self.__renderer is None or not self.__renderer.has_frame():
+            TerminalCtl.reset_cursor()
+            self.display_maze(True, path_coords, visited_coords)
+            return
+
+        if not isinstance(path_coords, PathIndex):
+            path_coords = PathIndex(path_coords or ())
+        if visited_coords is None:
+            visited_coords = set()
+        with self.__profiler.phase("display_maze"):
+            self.__renderer.update(cells, path_coords, visited_coords)
+        self.__profiler.count("frames drawn")
 
     @staticmethod
     def get_path_coords(
@@ -441,10 +647,17 @@ class MazeGenerator:
             coords.append((x, y))
         return coords
 
-    def write_output(self) -> None:
+    def write_output(self, save_distances: bool = False) -> None:
         """
         Saves the generated maze grid and its solution details to a file.
 
+        Rows are streamed through a TextMazeWriter, hex-encoded in bulk and
+        written in large chunks.
+
+        Args:
+            save_distances (bool): Whether to also save the distance field
+            next to OUTPUT_FILE, with a ``.dist`` extension.
+
         Returns:
             None
 
@@ -452,19 +665,64 @@ class MazeGenerator:
             SystemExit: If an error occurs during file writing.
         """
         output_path = self.__maze.output_file
+        profiler = self.__profiler
 
         try:
-            with open(output_path, "w") as f:
-                for row in self.__cells:
-                    hex_row = "".join([f"{cell.grid:X}" for cell in row])
-                    f.write(hex_row + "\n")
-
-                f.write(f"\nSEED: {self.__maze.seed}\n")
-                f.write(
-                    f"ENTRY: {self.__maze.entry[0]},{self.__maze.entry[1]}\n"
-                )
-                f.write(f"EXIT: {self.__maze.exit[0]},{self.__maze.exit[1]}\n")
-                f.write(f"SOLUTION: {self.__solution}\n")
+            with profiler.session(), profiler.phase("write_output"):
+                with mazefile.TextMazeWriter(output_path) as writer:
+                    writer.write_rows(
+                        self.__grid.row_walls(y)
+                        for y in range(self.__grid.height)
+                    )
+                    writer.finish(
+                        self.__maze.seed, self.__maze.entry,
+                        self.__maze.exit, self.__solution
+                    )
+                profiler.count("bytes written", writer.bytes_written)
+                if save_distances:
+                    output_path = mazefile.distance_path(output_path)
+                    mazefile.write_distances(
+                        output_path, self.get_distance_field()
+                    )
+                    profiler.count(
+                        "bytes written", os.path.getsize(output_path)
+                    )
+        except (PermissionError, IsADirectoryError):
+            print(f"Error writing to file: {output_path}")
+            sys.exit(1)
+
+    def to_data(self) -> MazeData:
+        """
+        Snapshots the maze walls and metadata for the maze file writers.
+
+        Returns:
+            MazeData: The walls, entry, exit, seed and solution.
+        """
+        return MazeData(
+            self.__grid.width, self.__grid.height, self.__grid.wall_bytes(),
+            self.__maze.entry, self.__maze.exit,
+            self.__maze.seed, self.__solution
+        )
+
+    def write_binary(self, output_path: Optional[str] = None) -> None:
+        """
+        Saves the maze in the compact binary format.
+
+        Args:
+            output_path (Optional[str]): Destination file; OUTPUT_FILE
+            with a ``.bin`` suffix when None.
+
+        Returns:
+            None
+
+        Raises:
+            SystemExit: If an error occurs during file writing.
+        """
+        if output_path is None:
+            output_path = os.path.splitext(self.__maze.output_file)[0] + ".bin"
+
+        try:
+            mazefile.write_binary(output_path, self.to_data())
         except (PermissionError, IsADirectoryError):
             print(f"Error writing to file: {output_path}")
             sys.exit(1)
@@ -472,16 +730,19 @@ class MazeGenerator:
     def display_maze(
         self,
         visualizing: bool = False,
-        path_coords: Optional[List[Tuple[int, int]]] = None,
+        path_coords: Optional[PathCoords] = None,
         visited_coords: Optional[Set[Tuple[int, int]]] = None
     ) -> None:
         """
         Renders the maze in the terminal with colored characters.
 
+        The whole frame is built in memory by the Renderer and written to
+        stdout in a single call.
+
         Args:
             visualizing (bool): Whether visualization is enabled.
-            path_coords (Optional[List[Tuple[int, int]]]):
-            Coordinates for the path.
+            path_coords (Optional[PathCoords]): Coordinates for the path,
+            indexed once into a set unless a PathIndex is given.
             visited_coords (Optional[Set[Tuple[int, int]]]):
             Coordinates for explored nodes.
 
@@ -515,72 +776,17 @@ class MazeGenerator:
             if ch != '\n' and ch != '\r':
                 sys.exit()
 
-        if path_coords is None:
-            path_coords = []
+        if not isinstance(path_coords, PathIndex):
+            path_coords = PathIndex(path_coords or ())
 
         if visited_coords is None:
             visited_coords = set()
 
-        BLOCK = "\u2588"
-
-        theme = self.__maze.theme.theme
-        reset = self.__maze.theme.reset
-        v_wall = f"{theme['W_C']}{BLOCK * 2}{reset}"
-        corner = f"{theme['W_C']}{BLOCK * 2}{reset}"
-        body = f"{theme['P_C']}{BLOCK * 2}{reset}"
-        h_wall = f"{theme['W_C']}{BLOCK * 4}{reset}"
-
-        print(f"{corner}", end="")
-        for _ in self.__cells[0]:
-            print(h_wall, end="")
-        print(TerminalCtl.erase_line)
-
-        for y, row in enumerate(self.__cells):
-            for x, cell in enumerate(row):
-                if cell.grid & WEST:
-                    print(v_wall, end="")
-                else:
-                    if (x, y) in path_coords and (x - 1, y) in path_coords:
-                        print(f"{theme['SOL_C']}██{reset}", end="")
-                    elif (
-                        (x, y) in visited_coords
-                        and (x - 1, y) in visited_coords
-                    ):
-                        print(f"{theme['EXP_C']}██{reset}", end="")
-                    else:
-                        print(body, end="")
-
-                if path_coords and (x, y) == path_coords[-1]:
-                    print(f"{theme['PL_C']}██{reset}", end="")
-                elif (x, y) == self.__maze.entry:
-                    print(f"{theme['S_C']}██{reset}", end="")
-                elif (x, y) == self.__maze.exit:
-                    print(f"{theme['E_C']}██{reset}", end="")
-                elif (x, y) in path_coords:
-                    print(f"{theme['SOL_C']}██{reset}", end="")
-                elif (x, y) in visited_coords:
-                    print(f"{theme['EXP_C']}██{reset}", end="")
-                elif cell.grid == 15:
-                    print(f"{theme['CC_C']}██{reset}", end="")
-                else:
-                    print(body, end="")
-
-            if row[-1].grid & EAST:
-                print(v_wall, end="")
-            print(TerminalCtl.erase_line)
-
-            print(corner, end="")
-            for x, cell in enumerate(row):
-                if cell.grid & SOUTH:
-                    print(h_wall, end="")
-                else:
-                    if (x, y) in path_coords and (x, y + 1) in path_coords:
-                        print(f"{theme['SOL_C']}██{reset}{corner}", end="")
-                    elif (
-                        (x, y) in visited_coords
-                        and (x, y + 1) in visited_coords
-                    ):
-                        print(f"{theme['EXP_C']}██{reset}{corner}", end="")
-                    else:
-                        print(f"{theme['P_C']}██{reset}{corner}", end="")
-            print(TerminalCtl.erase_line)
+        if self.__renderer is None:
+            self.__renderer = Renderer(
+                self.__grid, self.__maze.theme,
+                self.__maze.entry, self.__maze.exit
+            )
+        with self.__profiler.phase("display_maze"):
+            self.__renderer.draw(path_coords, visited_coords)
+        self.__profiler.count("frames drawn")
@@ -0,0 +1,287 @@
+from typing import Final, List, Sequence, Tuple
+
+
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+
+WALL_MASK: Final[int] = 0x0F
+VISITED: Final[int] = 0x10
+FT_PATTERN: Final[int] = 0x20
+ALL_WALLS: Final[int] = 15
+
+MOVES: Final = (
+    (0, -1, NORTH, "N"),
+    (1, 0, EAST, "E"),
+    (0, 1, SOUTH, "S"),
+    (-1, 0, WEST, "W")
+)
+
+_WALLS_TABLE: Final[bytes] = bytes(b & WALL_MASK for b in range(256))
+_FLAGS_TABLE: Final[bytes] = bytes(b & ~WALL_MASK for b in range(256))
+_PATTERN_TABLE: Final[bytes] = bytes(
+    1 if b & FT_PATTERN else 0 for b in range(256)
+)
+
+
+class Grid:
+    """
+    Compact maze grid backed by a single flat bytearray.
+
+    Every cell takes exactly one byte, indexed as ``y * width + x``. The low
+    nibble holds the wall bitmask (NORTH=1, EAST=2, SOUTH=4, WEST=8) and the
+    high bits hold the visited and '42' pattern flags, so a 4000x4000 maze
+    costs 16 MB instead of 16M Python objects.
+
+    Attributes:
+        width (int): The width of the grid in cells.
+        height (int): The height of the grid in cells.
+        data (bytearray): The packed cell bytes.
+    """
+
+    __slots__ = ("width", "height", "data")
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Allocates a grid where every cell has all four walls.
+
+        Args:
+            width (int): The width of the grid in cells.
+            height (int): The height of the grid in cells.
+
+        Returns:
+            None
+        """
+        self.width = width
+        self.height = height
+        self.data = bytearray([ALL_WALLS]) * (width * height)
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Returns the flat index of the cell at (x, y).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            int: The position of the cell inside ``data``.
+        """
+        return y * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """
+        Checks whether (x, y) lies inside the grid.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            bool: True if the coordinates are valid.
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def walls(self, x: int, y: int) -> int:
+        """
+        Returns the wall bitmask of the cell at (x, y).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            int: The wall nibble (15 means all walls).
+        """
+        return self.data[y * self.width + x] & WALL_MASK
+
+    def set_walls(self, x: int, y: int, walls: int) -> None:
+        """
+        Overwrites the wall bitmask of the cell at (x, y), keeping its flags.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            walls (int): The new wall nibble.
+
+        Returns:
+            None
+        """
+        i = y * self.width + x
+        self.data[i] = (self.data[i] & ~WALL_MASK) | (walls & WALL_MASK)
+
+    def has_wall(self, x: int, y: int, wall: int) -> bool:
+        """
+        Checks whether the cell at (x, y) has the given wall.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            wall (int): The wall bit to test.
+
+        Returns:
+            bool: True if the wall is present.
+        """
+        return bool(self.data[y * self.width + x] & wall)
+
+    def remove_wall(self, x: int, y: int, wall: int) -> None:
+        """
+        Removes one wall of the cell at (x, y).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            wall (int): The wall bit to clear.
+
+        Returns:
+            None
+        """
+        self.data[y * self.width + x] &= ~wall
+
+    def carve(
+        self, x: int, y: int, nx: int, ny: int, wall: int, opp_wall: int
+    ) -> None:
+        """
+        Opens the passage between two adjacent cells.
+
+        Args:
+            x (int): Column of the first cell.
+            y (int): Row of the first cell.
+            nx (int): Column of the neighbouring cell.
+            ny (int): Row of the neighbouring cell.
+            wall (int): Wall of the first cell facing the neighbour.
+            opp_wall (int): Wall of the neighbour facing the first cell.
+
+        Returns:
+            None
+        """
+        self.data[y * self.width + x] &= ~wall
+        self.data[ny * self.width + nx] &= ~opp_wall
+
+    def is_visited(self, x: int, y: int) -> bool:
+        """
+        Checks the visited flag of the cell at (x, y).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            bool: True if the cell has been visited.
+        """
+        return bool(self.data[y * self.width + x] & VISITED)
+
+    def mark_visited(self, x: int, y: int) -> None:
+        """
+        Sets the visited flag of the cell at (x, y).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            None
+        """
+        self.data[y * self.width + x] |= VISITED
+
+    def is_pattern(self, x: int, y: int) -> bool:
+        """
+        Checks whether the cell at (x, y) belongs to the '42' pattern.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            bool: True if the cell is part of the pattern.
+        """
+        return bool(self.data[y * self.width + x] & FT_PATTERN)
+
+    def mark_pattern(self, x: int, y: int) -> None:
+        """
+        Flags the cell at (x, y) as a visited '42' pattern cell.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            None
+        """
+        self.data[y * self.width + x] |= VISITED | FT_PATTERN
+
+    def row_walls(self, y: int) -> bytes:
+        """
+        Returns the wall nibbles of a whole row with the flags stripped.
+
+        Args:
+            y (int): Row to extract.
+
+        Returns:
+            bytes: One byte per cell, each in the range 0-15.
+        """
+        start = y * self.width
+        return bytes(
+            self.data[start:start + self.width].translate(_WALLS_TABLE)
+        )
+
+    def wall_bytes(self) -> bytes:
+        """
+        Returns the wall nibbles of the whole grid with the flags stripped.
+
+        Returns:
+            bytes: One byte per cell in row-major order.
+        """
+        return bytes(self.data.translate(_WALLS_TABLE))
+
+    def set_row_walls(self, y: int, walls: bytes) -> None:
+        """
+        Overwrites the walls of a whole row, keeping every cell's flags.
+
+        Args:
+            y (int): Row to overwrite.
+            walls (bytes): One wall nibble per cell.
+
+        Returns:
+            None
+        """
+        start = y * self.width
+        flags = self.data[start:start + self.width].translate(_FLAGS_TABLE)
+        merged = int.from_bytes(flags, "big") | int.from_bytes(walls, "big")
+        self.data[start:start + self.width] = merged.to_bytes(
+            self.width, "big"
+        )
+
+    def stamp(self, x: int, y: int, mask: Sequence[bytes]) -> None:
+        """
+        ORs a block of flag bytes into the grid, one slice per row.
+
+        Args:
+            x (int): Column of the block's top-left cell.
+            y (int): Row of the block's top-left cell.
+            mask (Sequence[bytes]): Flag bytes of every row of the block;
+            the block must fit inside the grid.
+
+        Returns:
+            None
+        """
+        for dy, flags in enumerate(mask):
+            start = (y + dy) * self.width + x
+            end = start + len(flags)
+            merged = int.from_bytes(self.data[start:end], "big") | (
+                int.from_bytes(flags, "big")
+            )
+            self.data[start:end] = merged.to_bytes(len(flags), "big")
+
+    def pattern_cells(self) -> List[Tuple[int, int]]:
+        """
+        Lists the cells flagged as part of the '42' pattern.
+
+        Returns:
+            List[Tuple[int, int]]: The (x, y) pattern cells, row-major.
+        """
+        marks = self.data.translate(_PATTERN_TABLE)
+        cells: List[Tuple[int, int]] = []
+        i = marks.find(1)
+        while i >= 0:
+            cells.append((i % self.width, i // self.width))
+            i = marks.find(1, i + 1)
+        return cells
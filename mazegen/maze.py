@@ -1,6 +1,10 @@
 import time
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 from .themes import Themes
+from .animation import DEFAULT_FPS
+from .pattern import FT_42, Pattern
+from .cache import DEFAULT_CACHE_SIZE, config_key
+from .vectorized import DEFAULT_BRAID, has_numpy, require_numpy
 from .error_class import (
     ConfigSyntaxError, ConfigKeyError, ConfigValueError, B, RS
 )
@@ -22,30 +26,160 @@ class Maze:
         output_file (str): Path to the file where the maze will be saved.\n
         perfection (bool): Whether the maze is perfect (no loops) or not.\n
         seed (int): Random seed used for generation.\n
-        algo (str): The algorithm name (e.g., "DFS", "WILSON").\n
+        seeded (bool): Whether SEED was given; otherwise the seed is the
+        current time.\n
+        algo (str): The algorithm name (e.g., "DFS", "WILSON",
+        "ELLER", "KRUSKAL", "PRIM", "BINARY_TREE", "SIDEWINDER").\n
+        tile_size (int): Block side for tiled parallel generation, 0 when
+        the maze is generated in one piece.\n
+        solver (str): The solver name ("BFS", "BIDIR", "ASTAR" or
+        "CORRIDOR").\n
+        profile (bool): Whether phase timings and counters are collected.\n
+        profile_dump (Optional[str]): cProfile stats file, None when
+        cProfile is off.\n
+        fps (int): Frames per second targeted by the animations.\n
+        braid (Optional[float]): Chance that a dead end of an imperfect
+        maze is opened by the vectorized pass, DEFAULT_BRAID when BRAID
+        is unset; None for perfect mazes, or when NumPy is missing and
+        the per-cell pass runs instead.\n
+        pattern (Pattern): Obstacle bitmap stamped into the maze, the
+        '42' logo unless PATTERN names a bitmap file.\n
+        cache_dir (Optional[str]): Folder of the result cache, None when
+        caching is off.\n
+        cache_size (int): Size limit of the result cache in MiB.\n
+        cache_key (Optional[str]): Hash of every setting that shapes the
+        maze and its solution, naming its cache entry; None without a
+        SEED, since a time seed never repeats.\n
+        interactive (bool): Whether prompts on the terminal are allowed.\n
         theme (Themes): Theme object for terminal rendering.
     """
-    def __init__(self, config_file: str) -> None:
+    def __init__(self, config_file: str, interactive: bool = True) -> None:
         """
         Initializes the maze by parsing a configuration file
         and setting attributes.\n
 
         Args:
             config_file (str): Path to the configuration file to be parsed.\n
+            interactive (bool): Whether the maze may prompt on the terminal
+            (theme menu, '42' pattern warnings). Defaults to True.\n
 
         Returns:
             None\n
         """
         config = self.MazeParseConfig.parsing_conf(config_file)
+        self.__load(config, interactive)
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], interactive: bool = False
+    ) -> 'Maze':
+        """
+        Builds a maze from an already parsed configuration dictionary.\n
+
+        Args:
+            config (Dict[str, Any]):
+            Output of ``MazeParseConfig.parsing_value``.\n
+            interactive (bool): Whether the maze may prompt on the terminal.
+            Defaults to False.\n
+
+        Returns:
+            Maze: The configured maze.\n
+        """
+        maze = cls.__new__(cls)
+        maze.__load(config, interactive)
+        return maze
+
+    @classmethod
+    def from_params(
+        cls,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+        perfect: bool,
+        seed: Optional[int] = None,
+        algo: str = "DFS",
+        output_file: str = "maze_output.txt",
+        solver: str = "BFS"
+    ) -> 'Maze':
+        """
+        Builds a non-interactive maze from plain values.\n
+
+        The values go through the same validation as a configuration file,
+        so the same ConfigValueError messages are raised on bad input.\n
+
+        Args:
+            width (int): The width of the maze in cells.\n
+            height (int): The height of the maze in cells.\n
+            entry (Tuple[int, int]): (x, y) coordinates of the entrance.\n
+            exit (Tuple[int, int]): (x, y) coordinates of the exit.\n
+            perfect (bool): Whether the maze must have no loops.\n
+            seed (Optional[int]): Random seed; current time when None.\n
+            algo (str): Generation algorithm name. Defaults to "DFS".\n
+            output_file (str): Path used by ``write_output``.\n
+            solver (str): Solver name. Defaults to "BFS".\n
+
+        Returns:
+            Maze: The configured maze.\n
+
+        Raises:
+            ConfigValueError: If any value is invalid.\n
+        """
+        config: Dict[str, Any] = {
+            "WIDTH": str(width),
+            "HEIGHT": str(height),
+            "ENTRY": f"{entry[0]},{entry[1]}",
+            "EXIT": f"{exit[0]},{exit[1]}",
+            "OUTPUT_FILE": output_file,
+            "PERFECT": str(perfect),
+            "ALGORITHM": algo,
+            "SOLVER": solver,
+        }
+        if seed is not None:
+            config["SEED"] = str(seed)
+        return cls.from_config(
+            cls.MazeParseConfig.parsing_value(config), interactive=False
+        )
+
+    def __load(self, config: Dict[str, Any], interactive: bool) -> None:
+        """
+        Copies validated configuration values onto the maze.\n
+
+        Args:
+            config (Dict[str, Any]): The parsed configuration.\n
+            interactive (bool): Whether the maze may prompt on the terminal.\n
+
+        Returns:
+            None\n
+        """
         self.width: int = config["WIDTH"]
         self.height: int = config["HEIGHT"]
         self.entry: Tuple[int, int] = config["ENTRY"]
         self.exit: Tuple[int, int] = config["EXIT"]
         self.output_file: str = config["OUTPUT_FILE"]
         self.perfection: bool = config["PERFECT"]
-        self.seed: int = config["SEED"]
-        self.algo: str = config["ALGORITHM"].upper()
-        self.theme: Themes = Themes()
+        self.seeded: bool = "SEED" in config
+        self.seed: int = config["SEED"] if self.seeded else int(time.time())
+        self.algo: str = config.get("ALGORITHM", "DFS").upper()
+        self.tile_size: int = config.get("TILE_SIZE", 0)
+        self.solver: str = config.get("SOLVER", "BFS")
+        self.profile_dump: Optional[str] = config.get("PROFILE_DUMP")
+        self.profile: bool = (
+            config.get("PROFILE", False) or self.profile_dump is not None
+        )
+        self.fps: int = config.get("FPS", DEFAULT_FPS)
+        self.pattern: Pattern = config.get("PATTERN", FT_42)
+        self.braid: Optional[float] = config.get("BRAID")
+        if self.braid is None and not self.perfection and has_numpy():
+            self.braid = DEFAULT_BRAID
+        self.cache_dir: Optional[str] = config.get("CACHE_DIR")
+        self.cache_size: int = config.get("CACHE_SIZE", DEFAULT_CACHE_SIZE)
+        self.cache_key: Optional[str] = (
+            config_key({**config, "BRAID": self.braid})
+            if self.seeded else None
+        )
+        self.interactive: bool = interactive
+        self.theme: Themes = Themes(interactive)
 
     class MazeParseConfig:
         """
@@ -63,7 +197,7 @@ class Maze:
             appropriate data types.\n
 
             This method performs deep validation of coordinates, dimensions,
-            perfection flags, and algorithm names.\n
+            perfection flags, and algorithm and solver names.\n
 
             Args:
                 config (Dict[str, str]):
@@ -85,16 +219,80 @@ class Maze:
                     config["SEED"] = int.from_bytes(
                         bytes(config["SEED"], 'utf-8')
                     )
-            else:
-                config["SEED"] = int(time.time())
 
             if "ALGORITHM" in config:
                 config["ALGORITHM"] = config["ALGORITHM"].upper()
-                if config["ALGORITHM"] not in ("DFS", "WILSON"):
+                if config["ALGORITHM"] not in (
+                    "DFS", "WILSON", "ELLER", "KRUSKAL", "PRIM",
+                    "BINARY_TREE", "SIDEWINDER"
+                ):
                     raise ConfigValueError(
                         f"{B}{config['ALGORITHM']}{RS} Algorithm not found"
                     )
 
+            if "SOLVER" in config:
+                config["SOLVER"] = config["SOLVER"].upper()
+                if config["SOLVER"] not in (
+                    "BFS", "BIDIR", "ASTAR", "CORRIDOR"
+                ):
+                    raise ConfigValueError(
+                        f"{B}{config['SOLVER']}{RS} Solver not found"
+                    )
+
+            if "TILE_SIZE" in config:
+                try:
+                    config["TILE_SIZE"] = int(config["TILE_SIZE"])
+                except ValueError:
+                    raise ConfigValueError(
+                        f"{B}TILE_SIZE{RS} must be a valid integer."
+                    )
+                if config["TILE_SIZE"] < 2:
+                    raise ConfigValueError(
+                        f"{B}TILE_SIZE{RS} must be at least {B}2{RS}."
+                    )
+                if config.get("ALGORITHM", "DFS") != "DFS":
+                    raise ConfigValueError(
+                        f"{B}TILE_SIZE{RS} only works with "
+                        f"{B}ALGORITHM=DFS{RS}"
+                    )
+
+            if "PROFILE" in config:
+                profile = config["PROFILE"].strip().capitalize()
+                if profile not in ("True", "False"):
+                    raise ConfigValueError(
+                        f"Invalid value '{profile}' for {B}PROFILE{RS}. "
+                        f"Expected {B}'True'{RS} or {B}'False'{RS}."
+                    )
+                config["PROFILE"] = (profile == "True")
+
+            if "PATTERN" in config:
+                config["PATTERN"] = Pattern.load(config["PATTERN"])
+
+            if "CACHE_SIZE" in config:
+                try:
+                    config["CACHE_SIZE"] = int(config["CACHE_SIZE"])
+                except ValueError:
+                    raise ConfigValueError(
+                        f"{B}CACHE_SIZE{RS} must be a valid integer."
+                    )
+                if config["CACHE_SIZE"] < 1:
+                    raise ConfigValueError(
+                        f"{B}CACHE_SIZE{RS} must be at least {B}1{RS} MiB."
+                    )
+
+            if "FPS" in config:
+                try:
+                    config["FPS"] = int(config["FPS"])
+                except ValueError:
+                    raise ConfigValueError(
+                        f"{B}FPS{RS} must be a valid integer."
+                    )
+                if not 1 <= config["FPS"] <= 1000:
+                    raise ConfigValueError(
+                        f"{B}FPS{RS} must be between {B}1{RS} and "
+                        f"{B}1000{RS}."
+                    )
+
             try:
                 config["WIDTH"] = int(config["WIDTH"])
                 config["HEIGHT"] = int(config["HEIGHT"])
@@ -159,6 +357,25 @@ class Maze:
                 )
             config["PERFECT"] = (perf == "True")
 
+            if "BRAID" in config:
+                try:
+                    config["BRAID"] = float(config["BRAID"])
+                except ValueError:
+                    raise ConfigValueError(
+                        f"{B}BRAID{RS} must be a number between "
+                        f"{B}0.0{RS} and {B}1.0{RS}."
+                    )
+                if not 0.0 <= config["BRAID"] <= 1.0:
+                    raise ConfigValueError(
+                        f"{B}BRAID{RS} must be between {B}0.0{RS} "
+                        f"and {B}1.0{RS}."
+                    )
+                if config["PERFECT"]:
+                    raise ConfigValueError(
+                        f"{B}BRAID{RS} only works with {B}PERFECT=False{RS}"
+                    )
+                require_numpy("BRAID")
+
             return config
 
         @staticmethod
@@ -0,0 +1,680 @@
+import os
+import sys
+import mmap
+import struct
+from array import array
+from typing import Any, BinaryIO, Iterable, List, Optional, Tuple
+from .grid import Grid
+from .distance import DistanceField
+from .error_class import MazeFileError
+
+
+MAGIC = b"AMAZ"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHIIIIIIQH")
+DIST_MAGIC = b"ADST"
+DIST_HEADER = struct.Struct("<4sBBHIIII")
+MOVE_CODES = "NESW"
+CHUNK_SIZE = 1 << 20
+
+_HEX_DIGITS = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+_HIGH_NIBBLE = bytes((b << 4) & 0xF0 for b in range(256))
+_LOW_NIBBLE = bytes(b & 0x0F for b in range(256))
+_TAKE_HIGH = bytes(b >> 4 for b in range(256))
+_MOVE_TO_CODE = bytes.maketrans(b"NESW", b"\x00\x01\x02\x03")
+_CODE_TO_MOVE = bytes.maketrans(b"\x00\x01\x02\x03", b"NESW")
+_SHIFTS = (6, 4, 2, 0)
+_PACK_MOVE = [bytes((b & 3) << s for b in range(256)) for s in _SHIFTS]
+_UNPACK_MOVE = [bytes((b >> s) & 3 for b in range(256)) for s in _SHIFTS]
+
+
+class MazeData:
+    """
+    Plain in-memory description of a saved maze.
+
+    Attributes:
+        width (int): The width of the maze in cells.
+        height (int): The height of the maze in cells.
+        walls (bytes): One wall nibble per cell, row-major.
+        entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+        exit (Tuple[int, int]): (x, y) coordinates of the exit.
+        seed (int): Random seed used for generation.
+        solution (str): The N/E/S/W solution path.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        walls: bytes,
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+        seed: int,
+        solution: str
+    ) -> None:
+        """
+        Stores the maze description.
+
+        Args:
+            width (int): The width of the maze in cells.
+            height (int): The height of the maze in cells.
+            walls (bytes): One wall nibble per cell, row-major.
+            entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+            exit (Tuple[int, int]): (x, y) coordinates of the exit.
+            seed (int): Random seed used for generation.
+            solution (str): The N/E/S/W solution path.
+
+        Returns:
+            None
+        """
+        self.width = width
+        self.height = height
+        self.walls = walls
+        self.entry = entry
+        self.exit = exit
+        self.seed = seed
+        self.solution = solution
+
+    def to_grid(self) -> Grid:
+        """
+        Copies the walls into a fresh packed Grid.
+
+        Returns:
+            Grid: A grid holding the saved walls with no flags set.
+        """
+        grid = Grid(self.width, self.height)
+        grid.data[:] = self.walls
+        return grid
+
+
+def _or_bytes(parts: List[bytes]) -> bytes:
+    """
+    Bitwise ORs equally sized byte strings in bulk.
+
+    Args:
+        parts (List[bytes]): Byte strings of the same length.
+
+    Returns:
+        bytes: The OR of all parts.
+    """
+    size = len(parts[0])
+    acc = 0
+    for part in parts:
+        acc |= int.from_bytes(part, "big")
+    return acc.to_bytes(size, "big")
+
+
+def pack_walls(walls: bytes) -> bytes:
+    """
+    Packs wall nibbles two cells per byte, first cell in the high nibble.
+
+    Args:
+        walls (bytes): One wall nibble per cell.
+
+    Returns:
+        bytes: ``ceil(len(walls) / 2)`` packed bytes.
+    """
+    if len(walls) % 2:
+        walls = bytes(walls) + b"\x00"
+    if not walls:
+        return b""
+    return _or_bytes([
+        walls[0::2].translate(_HIGH_NIBBLE),
+        walls[1::2].translate(_LOW_NIBBLE)
+    ])
+
+
+def unpack_walls(packed: bytes, count: int) -> bytes:
+    """
+    Expands packed nibbles back to one wall byte per cell.
+
+    Args:
+        packed (bytes): Bytes produced by ``pack_walls``.
+        count (int): Number of cells to return.
+
+    Returns:
+        bytes: ``count`` wall nibbles.
+    """
+    out = bytearray(len(packed) * 2)
+    out[0::2] = packed.translate(_TAKE_HIGH)
+    out[1::2] = packed.translate(_LOW_NIBBLE)
+    return bytes(out[:count])
+
+
+def pack_solution(solution: str) -> bytes:
+    """
+    Encodes an N/E/S/W path with 2 bits per move, four moves per byte.
+
+    Args:
+        solution (str): The move string.
+
+    Returns:
+        bytes: ``ceil(len(solution) / 4)`` packed bytes.
+
+    Raises:
+        MazeFileError: If the path contains anything but N, E, S and W.
+    """
+    if solution.strip(MOVE_CODES):
+        raise MazeFileError(f"Invalid move in solution path '{solution}'")
+
+    codes = solution.encode("ascii").translate(_MOVE_TO_CODE)
+    codes += b"\x00" * (-len(codes) % 4)
+    if not codes:
+        return b""
+    return _or_bytes([
+        codes[k::4].translate(_PACK_MOVE[k]) for k in range(4)
+    ])
+
+
+def unpack_solution(packed: bytes, length: int) -> str:
+    """
+    Decodes a path packed by ``pack_solution``.
+
+    Args:
+        packed (bytes): The packed moves.
+        length (int): Number of moves to decode.
+
+    Returns:
+        str: The N/E/S/W move string.
+    """
+    codes = bytearray(len(packed) * 4)
+    for k in range(4):
+        codes[k::4] = packed.translate(_UNPACK_MOVE[k])
+    return codes[:length].translate(_CODE_TO_MOVE).decode("ascii")
+
+
+def encode_header(
+    width: int,
+    height: int,
+    entry: Tuple[int, int],
+    exit: Tuple[int, int],
+    seed: int,
+    moves: int
+) -> bytes:
+    """
+    Builds the fixed header followed by the variable-length seed.
+
+    Args:
+        width (int): The width of the maze in cells.
+        height (int): The height of the maze in cells.
+        entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+        exit (Tuple[int, int]): (x, y) coordinates of the exit.
+        seed (int): Random seed used for generation.
+        moves (int): Number of moves in the solution.
+
+    Returns:
+        bytes: The encoded header.
+    """
+    seed_bytes = seed.to_bytes(
+        (seed.bit_length() + 8) // 8, "big", signed=True
+    )
+    return HEADER.pack(
+        MAGIC, VERSION, 0, 0, width, height,
+        entry[0], entry[1], exit[0], exit[1], moves, len(seed_bytes)
+    ) + seed_bytes
+
+
+def write_binary(path: str, data: MazeData) -> None:
+    """
+    Saves a maze in the versioned binary format.
+
+    The file holds the header and seed, then the grid packed two cells per
+    byte, then the solution packed 2 bits per move.
+
+    Args:
+        path (str): Destination file.
+        data (MazeData): The maze to save.
+
+    Returns:
+        None
+    """
+    with open(path, "wb") as f:
+        f.write(encode_header(
+            data.width, data.height, data.entry, data.exit,
+            data.seed, len(data.solution)
+        ))
+        f.write(pack_walls(data.walls))
+        f.write(pack_solution(data.solution))
+
+
+class MappedMaze:
+    """
+    Memory-mapped view of a binary maze file.
+
+    The header is decoded on open; the grid and the solution stay in the
+    mapping and are only read on access, so even huge files open in
+    constant time and memory.
+
+    Attributes:
+        width (int): The width of the maze in cells.
+        height (int): The height of the maze in cells.
+        entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+        exit (Tuple[int, int]): (x, y) coordinates of the exit.
+        seed (int): Random seed used for generation.
+        moves (int): Number of moves in the solution.
+        packed (memoryview): The packed grid, two cells per byte.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Maps the file and validates its header.
+
+        Args:
+            path (str): The binary maze file.
+
+        Returns:
+            None
+
+        Raises:
+            MazeFileError: If the file is not a valid maze file.
+        """
+        with open(path, "rb") as f:
+            try:
+                self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise MazeFileError(f"'{path}' is empty")
+
+        view = memoryview(self.__map)
+        self.__views = [view]
+        if len(view) < HEADER.size:
+            self.close()
+            raise MazeFileError(f"'{path}' is truncated")
+
+        (
+            magic, version, _, _, self.width, self.height,
+            ex, ey, xx, xy, self.moves, seed_len
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise MazeFileError(
+                f"'{path}' is not a version {VERSION} maze file"
+            )
+
+        self.entry = (ex, ey)
+        self.exit = (xx, xy)
+        seed_end = HEADER.size + seed_len
+        self.seed = int.from_bytes(
+            view[HEADER.size:seed_end], "big", signed=True
+        )
+
+        grid_end = seed_end + (self.width * self.height + 1) // 2
+        sol_end = grid_end + (self.moves + 3) // 4
+        if len(view) < sol_end:
+            self.close()
+            raise MazeFileError(f"'{path}' is truncated")
+
+        self.packed = view[seed_end:grid_end]
+        self.__solution = view[grid_end:sol_end]
+        self.__views += [self.packed, self.__solution]
+
+    def walls(self, x: int, y: int) -> int:
+        """
+        Reads the wall nibble of one cell straight from the mapping.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+
+        Returns:
+            int: The wall bitmask.
+        """
+        i = y * self.width + x
+        byte = self.packed[i >> 1]
+        return byte & 0x0F if i & 1 else byte >> 4
+
+    @property
+    def solution(self) -> str:
+        """The decoded N/E/S/W solution path."""
+        return unpack_solution(bytes(self.__solution), self.moves)
+
+    def to_data(self) -> MazeData:
+        """
+        Copies the whole maze out of the mapping.
+
+        Returns:
+            MazeData: The decoded maze.
+        """
+        return MazeData(
+            self.width, self.height,
+            unpack_walls(bytes(self.packed), self.width * self.height),
+            self.entry, self.exit, self.seed, self.solution
+        )
+
+    def close(self) -> None:
+        """
+        Releases the views and the mapping.
+
+        Returns:
+            None
+        """
+        for view in reversed(self.__views):
+            view.release()
+        self.__views = []
+        self.__map.close()
+
+    def __enter__(self) -> 'MappedMaze':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def read_text(path: str) -> MazeData:
+    """
+    Parses a maze saved in the hex text format of ``write_output``.
+
+    Args:
+        path (str): The text maze file.
+
+    Returns:
+        MazeData: The decoded maze.
+
+    Raises:
+        MazeFileError: If the file does not follow the format.
+    """
+    rows: List[bytes] = []
+    fields = {}
+
+    with open(path, "r") as f:
+        lines = iter(f)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                break
+            try:
+                rows.append(bytes.fromhex("0" + "0".join(line)))
+            except ValueError:
+                raise MazeFileError(f"Invalid grid row '{line}'")
+        for line in lines:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                fields[key.strip()] = value.strip()
+
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        raise MazeFileError(f"'{path}' has no rectangular grid")
+
+    try:
+        entry = _parse_coords(fields["ENTRY"])
+        exit = _parse_coords(fields["EXIT"])
+        seed = int(fields["SEED"])
+    except (KeyError, ValueError):
+        raise MazeFileError(f"'{path}' is missing SEED, ENTRY or EXIT")
+
+    return MazeData(
+        len(rows[0]), len(rows), b"".join(rows),
+        entry, exit, seed, fields.get("SOLUTION", "")
+    )
+
+
+def _parse_coords(value: str) -> Tuple[int, int]:
+    """
+    Parses an ``x,y`` pair.
+
+    Args:
+        value (str): The text to parse.
+
+    Returns:
+        Tuple[int, int]: The coordinates.
+    """
+    x, y = map(int, value.split(","))
+    return x, y
+
+
+class TextMazeWriter:
+    """
+    Streams a maze to disk in the hex text format, one row at a time.
+
+    Each row of wall nibbles is hex-encoded in bulk through a translate
+    table and appended to a buffer that is written out in large chunks,
+    so memory stays proportional to one chunk rather than to the maze.
+    Rows may come from a generator that is still producing them.
+
+    Attributes:
+        path (str): Destination file.
+        chunk_size (int): Buffer size that triggers a write.
+        rows (int): Number of rows written so far.
+        bytes_written (int): Bytes flushed to the file so far.
+    """
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Opens the destination file.
+
+        Args:
+            path (str): Destination file.
+            chunk_size (int): Buffer size that triggers a write.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.bytes_written = 0
+        self.__buffer = bytearray()
+        self.__file: BinaryIO = open(path, "wb")
+
+    def write_row(self, walls: bytes) -> None:
+        """
+        Appends one row of wall nibbles (values 0-15).
+
+        Args:
+            walls (bytes): The walls of the row, one byte per cell.
+
+        Returns:
+            None
+        """
+        self.__buffer += walls.translate(_HEX_DIGITS)
+        self.__buffer += b"\n"
+        self.rows += 1
+        if len(self.__buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[bytes]) -> None:
+        """
+        Appends every row produced by an iterable or generator.
+
+        Args:
+            rows (Iterable[bytes]): Rows of wall nibbles, top to bottom.
+
+        Returns:
+            None
+        """
+        for walls in rows:
+            self.write_row(walls)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows to the file.
+
+        Returns:
+            None
+        """
+        self.__file.write(self.__buffer)
+        self.bytes_written += len(self.__buffer)
+        self.__buffer.clear()
+
+    def finish(
+        self,
+        seed: int,
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+        solution: str
+    ) -> None:
+        """
+        Writes the SEED/ENTRY/EXIT/SOLUTION trailer and closes the file.
+
+        Args:
+            seed (int): Random seed used for generation.
+            entry (Tuple[int, int]): (x, y) coordinates of the entrance.
+            exit (Tuple[int, int]): (x, y) coordinates of the exit.
+            solution (str): The N/E/S/W solution path, empty when it is
+            unknown, as for streamed mazes.
+
+        Returns:
+            None
+        """
+        self.__buffer += (
+            f"\nSEED: {seed}\n"
+            f"ENTRY: {entry[0]},{entry[1]}\n"
+            f"EXIT: {exit[0]},{exit[1]}\n"
+            f"SOLUTION: {solution}\n"
+        ).encode("ascii")
+        self.close()
+
+    def close(self) -> None:
+        """
+        Flushes what is buffered and closes the file.
+
+        Returns:
+            None
+        """
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+    def __enter__(self) -> 'TextMazeWriter':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def write_text(path: str, data: MazeData) -> None:
+    """
+    Saves a maze in the hex text format of ``write_output``.
+
+    Args:
+        path (str): Destination file.
+        data (MazeData): The maze to save.
+
+    Returns:
+        None
+    """
+    with TextMazeWriter(path) as writer:
+        writer.write_rows(
+            data.walls[y * data.width:(y + 1) * data.width]
+            for y in range(data.height)
+        )
+        writer.finish(data.seed, data.entry, data.exit, data.solution)
+
+
+def is_binary(path: str) -> bool:
+    """
+    Checks whether a file starts with the binary maze magic.
+
+    Args:
+        path (str): The file to probe.
+
+    Returns:
+        bool: True for binary maze files.
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def convert(src: str, dst: str, to_binary: Optional[bool] = None) -> None:
+    """
+    Converts a maze file between the hex text and binary formats.
+
+    Args:
+        src (str): The file to convert.
+        dst (str): The converted file.
+        to_binary (Optional[bool]): Target format; guessed from the
+        source when None (binary sources become text and vice versa).
+
+    Returns:
+        None
+    """
+    source_binary = is_binary(src)
+    if to_binary is None:
+        to_binary = not source_binary
+
+    if source_binary:
+        with MappedMaze(src) as mapped:
+            data = mapped.to_data()
+    else:
+        data = read_text(src)
+
+    if to_binary:
+        write_binary(dst, data)
+    else:
+        write_text(dst, data)
+
+
+def distance_path(output_file: str) -> str:
+    """
+    Derives the distance field file name from OUTPUT_FILE.
+
+    Args:
+        output_file (str): The maze output file.
+
+    Returns:
+        str: e.g. ``maze_output.dist`` for ``maze_output.txt``.
+    """
+    stem, _ = os.path.splitext(output_file)
+    return stem + ".dist"
+
+
+def write_distances(path: str, field: DistanceField) -> None:
+    """
+    Saves a distance field as a header followed by the raw distances.
+
+    The header holds the magic, the version, the item size (2 or 4),
+    the grid size and the source cell; distances are little-endian.
+
+    Args:
+        path (str): Destination file.
+        field (DistanceField): The distances to save.
+
+    Returns:
+        None
+    """
+    values = field.values
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    with open(path, "wb") as f:
+        f.write(DIST_HEADER.pack(
+            DIST_MAGIC, VERSION, values.itemsize, 0,
+            field.width, field.height, field.source[0], field.source[1]
+        ))
+        values.tofile(f)
+
+
+def read_distances(path: str) -> DistanceField:
+    """
+    Loads a distance field saved by ``write_distances``.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        DistanceField: The saved distances.
+
+    Raises:
+        MazeFileError: If the file is not a valid distance field.
+    """
+    with open(path, "rb") as f:
+        head = f.read(DIST_HEADER.size)
+        if len(head) < DIST_HEADER.size:
+            raise MazeFileError(f"'{path}' is truncated")
+        magic, version, itemsize, _, width, height, sx, sy = (
+            DIST_HEADER.unpack(head)
+        )
+        if magic != DIST_MAGIC or version != VERSION:
+            raise MazeFileError(
+                f"'{path}' is not a version {VERSION} distance file"
+            )
+        values = array(DistanceField.typecode(width * height))
+        if values.itemsize != itemsize:
+            raise MazeFileError(f"'{path}' has an invalid item size")
+        try:
+            values.fromfile(f, width * height)
+        except EOFError:
+            raise MazeFileError(f"'{path}' is truncated")
+
+    if sys.byteorder == "big":
+        values.byteswap()
+    return DistanceField(width, height, (sx, sy), values)
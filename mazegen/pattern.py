@@ -0,0 +1,226 @@
+from random import Random
+from typing import Iterable, List, Optional, Sequence, Tuple
+from .grid import VISITED, FT_PATTERN
+from .error_class import ConfigValueError, B, RS
+
+
+FILLED = "#1"
+EMPTY = ". 0"
+
+_MASK_TABLE = bytes.maketrans(b"\x00\x01", bytes((0, VISITED | FT_PATTERN)))
+
+
+class Pattern:
+    """
+    Bitmap of obstacle cells stamped into the maze, such as the '42' logo.
+
+    The bitmap is kept both as its list of cells and as one flag mask per
+    row, so stamping it costs one slice assignment per row of the grid.
+    Free cells that cannot reach the left, right or bottom edge of the
+    bitmap going only sideways and down, such as the middle of a ring or
+    a pocket that opens upwards, are made obstacles too: nothing could
+    carve into a ring, a generator walking towards it would never finish,
+    and Eller's row sets can never merge back out of a pocket.
+    Placing it never lists the candidate origins: the origins that would
+    cover the entry or exit are the few ``point - cell`` offsets, so they
+    are computed directly and skipped while indexing a uniform draw over
+    the whole origin rectangle.
+
+    Attributes:
+        width (int): Width of the bitmap in cells.
+        height (int): Height of the bitmap in cells.
+        cells (List[Tuple[int, int]]): (x, y) obstacle cells, row-major.
+        mask (Tuple[bytes, ...]): Per row, the flag byte of every column
+        (visited and pattern for obstacles, 0 elsewhere).
+    """
+
+    __slots__ = ("width", "height", "cells", "mask")
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        """
+        Parses a bitmap drawn with '#' or '1' for obstacles and '.', '0'
+        or spaces for free cells, and fills its rings and pockets.
+
+        Args:
+            lines (Sequence[str]): Rows of the bitmap, top to bottom.
+
+        Returns:
+            None
+
+        Raises:
+            ConfigValueError: If a character is unknown or the bitmap has
+            no obstacle cell.
+        """
+        rows = [line.rstrip("\n") for line in lines]
+        while rows and not rows[-1].strip():
+            rows.pop()
+
+        self.width = max((len(row) for row in rows), default=0)
+        self.height = len(rows)
+        blocked = [bytearray(self.width) for _ in rows]
+        for y, row in enumerate(rows):
+            for x, char in enumerate(row):
+                if char in FILLED:
+                    blocked[y][x] = 1
+                elif char not in EMPTY:
+                    raise ConfigValueError(
+                        f"Invalid character {B}'{char}'{RS} in "
+                        f"{B}PATTERN{RS} at row {y + 1}. Use '#' for "
+                        "obstacles and '.' for free cells."
+                    )
+        self.fill_pockets(blocked)
+
+        self.cells: List[Tuple[int, int]] = [
+            (x, y)
+            for y, row in enumerate(blocked)
+            for x, cell in enumerate(row) if cell
+        ]
+        self.mask = tuple(
+            bytes(row.translate(_MASK_TABLE)) for row in blocked
+        )
+
+        if not self.cells:
+            raise ConfigValueError(
+                f"{B}PATTERN{RS} must contain at least one '#' cell."
+            )
+
+    @staticmethod
+    def fill_pockets(blocked: List[bytearray]) -> None:
+        """
+        Marks as blocked every free cell that no path of free cells going
+        west, east or south links to the left, right or bottom edge of
+        the bitmap.
+
+        A placed bitmap always keeps a free border of one cell inside the
+        maze, so every free cell left has a way out that does not climb:
+        a row-by-row generator that only merges sets sideways and carries
+        them downwards reaches it from the rest of the maze.
+
+        Args:
+            blocked (List[bytearray]): Rows of the bitmap, 1 for obstacle
+            cells; updated in place.
+
+        Returns:
+            None
+        """
+        height = len(blocked)
+        width = len(blocked[0]) if blocked else 0
+        outside = [bytearray(width) for _ in blocked]
+        stack = [
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if (x in (0, width - 1) or y == height - 1)
+            and not blocked[y][x]
+        ]
+        while stack:
+            x, y = stack.pop()
+            if outside[y][x]:
+                continue
+            outside[y][x] = 1
+            for nx, ny in ((x, y - 1), (x + 1, y), (x - 1, y)):
+                if (
+                    0 <= nx < width and 0 <= ny < height
+                    and not blocked[ny][nx] and not outside[ny][nx]
+                ):
+                    stack.append((nx, ny))
+
+        for row, reached in zip(blocked, outside):
+            for x in range(width):
+                if not reached[x]:
+                    row[x] = 1
+
+    @classmethod
+    def load(cls, path: str) -> 'Pattern':
+        """
+        Reads a bitmap from a text file.
+
+        Args:
+            path (str): The bitmap file.
+
+        Returns:
+            Pattern: The parsed bitmap.
+
+        Raises:
+            ConfigValueError: If the file cannot be read or is invalid.
+        """
+        try:
+            with open(path, "r") as file:
+                return cls(file.readlines())
+        except (OSError, UnicodeDecodeError):
+            raise ConfigValueError(
+                f"{B}PATTERN{RS} file {B}'{path}'{RS} cannot be read."
+            )
+
+    def choose_origin(
+        self,
+        width: int,
+        height: int,
+        avoid: Iterable[Tuple[int, int]],
+        rng: Random
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Picks a uniform random top-left corner that covers none of
+        ``avoid`` and keeps a free border of one cell around the bitmap.
+
+        Origins are numbered column by column, so with the same RNG state
+        the result is the one ``random.choice`` would return on the full
+        list of candidates. Rings and pockets were filled when the bitmap
+        was parsed, and every origin keeps a free ring around the bitmap,
+        so an ``avoid`` cell left uncovered is always reachable.
+        Complexity: O(len(avoid) * len(cells)).
+
+        Args:
+            width (int): The width of the maze in cells.
+            height (int): The height of the maze in cells.
+            avoid (Iterable[Tuple[int, int]]): Cells that must stay free,
+            e.g. the entry and exit.
+            rng (Random): The pattern stream of the maze.
+
+        Returns:
+            Optional[Tuple[int, int]]: The (x, y) origin, or None when no
+            origin is valid.
+        """
+        cols = width - self.width - 1
+        rows = height - self.height - 1
+        if cols <= 0 or rows <= 0:
+            return None
+
+        forbidden = sorted({
+            (ax - px - 1) * rows + (ay - py - 1)
+            for ax, ay in avoid
+            for px, py in self.cells
+            if 1 <= ax - px <= cols and 1 <= ay - py <= rows
+        })
+        total = cols * rows - len(forbidden)
+        if total <= 0:
+            return None
+
+        pick = rng.randrange(total)
+        for index in forbidden:
+            if index > pick:
+                break
+            pick += 1
+        return 1 + pick // rows, 1 + pick % rows
+
+    def cells_at(self, x: int, y: int) -> List[Tuple[int, int]]:
+        """
+        Lists the obstacle cells of the bitmap placed at an origin.
+
+        Args:
+            x (int): Column of the origin.
+            y (int): Row of the origin.
+
+        Returns:
+            List[Tuple[int, int]]: The (x, y) maze cells, row-major.
+        """
+        return [(x + px, y + py) for px, py in self.cells]
+
+
+FT_42 = Pattern([
+    "#...###",
+    "#.....#",
+    "###.###",
+    "..#.#..",
+    "..#.###",
+])
@@ -2,10 +2,35 @@ import sys
 import tty
 import time
 import termios
-from typing import List, Tuple
+from typing import Optional, Tuple
 from .error_class import R, G, RS
 from .terminal_ctl import TerminalCtl
-from .gen_maze import MazeGenerator, NORTH, SOUTH, WEST, EAST
+from .renderer import PathIndex
+from .gen_maze import MazeGenerator
+from .grid import NORTH, SOUTH, WEST, EAST
+
+
+NEAR_RGB = (46, 204, 113)
+FAR_RGB = (231, 76, 60)
+
+
+def heat_color(distance: int, farthest: int) -> str:
+    """
+    Maps a distance to the exit onto a green (near) to red (far) color.
+
+    Args:
+        distance (int): Distance of the cell to the exit.
+        farthest (int): Largest distance in the maze.
+
+    Returns:
+        str: The ANSI 24-bit foreground escape code.
+    """
+    t = distance / farthest if farthest else 0.0
+    r, g, b = (
+        round(near + (far - near) * t)
+        for near, far in zip(NEAR_RGB, FAR_RGB)
+    )
+    return f"\033[38;2;{r};{g};{b}m"
 
 
 def player_mode(gen_maze: MazeGenerator) -> None:
@@ -16,6 +41,10 @@ def player_mode(gen_maze: MazeGenerator) -> None:
     reaches the target exit. It also provides an option to replay the
     player's movement path.
 
+    The distance field to the exit is computed once, so the remaining
+    distance, the next-step hint (H) and the heat-map overlay (M) are
+    plain lookups on every move.
+
     Args:
         gen_maze (MazeGenerator): The generator instance providing the maze
             structure and display methods.
@@ -29,57 +58,144 @@ def player_mode(gen_maze: MazeGenerator) -> None:
     BLOCK = "\u2588"
 
     maze = gen_maze.get_maze()
-    cells = gen_maze.get_cells()
+    grid = gen_maze.get_grid()
     theme = maze.theme.theme
     reset = maze.theme.reset
     px, py = maze.entry
     target = maze.exit
     player_path = [(px, py)]
+    field = gen_maze.get_distance_field()
+    farthest = field.max_distance
+    heat = False
+    hint: Optional[Tuple[int, int]] = None
     start_time = time.time()
 
+    def base_color(cell: Tuple[int, int]) -> str:
+        """
+        Returns the color a cell has when the player is not on it.
+
+        Args:
+            cell (Tuple[int, int]): (x, y) of the cell.
+
+        Returns:
+            str: The ANSI color of the cell.
+        """
+        if cell == maze.entry:
+            return theme['S_C']
+        if cell == target:
+            return theme['E_C']
+        distance = field.at(*cell)
+        if heat and distance is not None:
+            return heat_color(distance, farthest)
+        return theme['P_C']
+
+    def paint(cell: Tuple[int, int], color: str) -> None:
+        """
+        Redraws the body of one cell in the given color.
+
+        Args:
+            cell (Tuple[int, int]): (x, y) of the cell.
+            color (str): The ANSI color to use.
+
+        Returns:
+            None
+        """
+        TerminalCtl.reset_cursor(col=cell[0] * 4 + 3, row=cell[1] * 2 + 4)
+        print(f"{color}{2 * BLOCK}{reset}")
+
+    def draw_overlay() -> None:
+        """
+        Repaints every reachable cell, with or without the heat map.
+
+        Returns:
+            None
+        """
+        out = []
+        for y in range(maze.height):
+            for x in range(maze.width):
+                if (x, y) == (px, py) or field.at(x, y) is None:
+                    continue
+                out.append(TerminalCtl.goto(y * 2 + 4, x * 4 + 3))
+                out.append(f"{base_color((x, y))}{2 * BLOCK}{reset}")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+    def show_status(message: str = "") -> None:
+        """
+        Prints the distance remaining under the maze.
+
+        Args:
+            message (str): Extra text, such as a hint.
+
+        Returns:
+            None
+        """
+        TerminalCtl.reset_cursor(row=maze.height * 2 + 4)
+        print(
+            f"Distance to exit: {field.at(px, py)} {message}",
+            TerminalCtl.erase_line
+        )
+
     print("--- PLAY MODE ---", TerminalCtl.erase_line)
-    print("Use W, A, S, D | Press Q to Quit", TerminalCtl.erase_line)
+    print(
+        "Use W, A, S, D | H: Hint | M: Heat Map | Press Q to Quit",
+        TerminalCtl.erase_line
+    )
     gen_maze.display_maze(True, player_path)
+    show_status()
 
     while (px, py) != target:
         move = TerminalCtl.getch().lower()
 
         if move == 'q':
+            TerminalCtl.reset_cursor(row=maze.height * 2 + 5)
             print(
                 f"{R}You failed to solve the maze!{RS}", TerminalCtl.erase_line
             )
-            TerminalCtl.reset_cursor(row=maze.height * 2 + 5)
+            TerminalCtl.reset_cursor(row=maze.height * 2 + 6)
             TerminalCtl.show_cursor()
             return
 
-        if move == 'w' and not (cells[py][px].grid & NORTH):
+        if move == 'h':
+            step = field.next_move(grid, px, py)
+            if step is not None:
+                letter, hx, hy = step
+                hint = (hx, hy)
+                paint(hint, theme['SOL_C'])
+                show_status(f"| Hint: go {letter}")
+            continue
+
+        if move == 'm':
+            heat = not heat
+            draw_overlay()
+            if hint is not None:
+                paint(hint, theme['SOL_C'])
+            continue
+
+        if move == 'w' and not grid.has_wall(px, py, NORTH):
             py -= 1
-        elif move == 's' and not (cells[py][px].grid & SOUTH):
+        elif move == 's' and not grid.has_wall(px, py, SOUTH):
             py += 1
-        elif move == 'a' and not (cells[py][px].grid & WEST):
+        elif move == 'a' and not grid.has_wall(px, py, WEST):
             px -= 1
-        elif move == 'd' and not (cells[py][px].grid & EAST):
+        elif move == 'd' and not grid.has_wall(px, py, EAST):
             px += 1
         else:
             continue
 
         if (px, py) != maze.entry:
-            TerminalCtl.reset_cursor(
-                col=player_path[0][0] * 4 + 3,
-                row=player_path[0][1] * 2 + 4
-            )
-            print(f"{theme['S_C']}{2 * BLOCK}{reset}")
+            paint(player_path[0], theme['S_C'])
 
         if player_path[-1] != maze.entry:
-            TerminalCtl.reset_cursor(
-                col=player_path[-1][0] * 4 + 3,
-                row=player_path[-1][1] * 2 + 4
-            )
-            print(f"{theme['P_C']}{2 * BLOCK}{reset}")
+            paint(player_path[-1], base_color(player_path[-1]))
+
+        if hint is not None and hint != (px, py):
+            paint(hint, base_color(hint))
+        hint = None
 
-        TerminalCtl.reset_cursor(col=px * 4 + 3, row=py * 2 + 4)
-        print(f"{theme['PL_C']}{2 * BLOCK}{reset}")
+        paint((px, py), theme['PL_C'])
         player_path.append((px, py))
+        show_status()
 
     TerminalCtl.clear_screen()
     gen_maze.display_maze(True, path_coords=[(px, py)])
@@ -96,7 +212,8 @@ def player_mode(gen_maze: MazeGenerator) -> None:
 
     if replay == 'f':
         TerminalCtl.clear_screen()
-        tmp_path: List[Tuple[int, int]] = []
+        gen_maze.display_maze(True)
+        tmp_path = PathIndex()
         old_settings = termios.tcgetattr(sys.stdin)
         try:
             tty.setcbreak(sys.stdin.fileno())
@@ -105,9 +222,11 @@ def player_mode(gen_maze: MazeGenerator) -> None:
                     TerminalCtl.reset_cursor()
                     gen_maze.display_maze(True, player_path)
                     break
+                dirty = [coord]
+                if tmp_path.head is not None:
+                    dirty.append(tmp_path.head)
                 tmp_path.append(coord)
-                TerminalCtl.reset_cursor()
-                gen_maze.display_maze(True, tmp_path)
+                gen_maze.draw_cells(dirty, tmp_path)
                 time.sleep(0.01)
         finally:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
@@ -0,0 +1,164 @@
+import time
+import cProfile
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Optional
+from .grid import Grid, WALL_MASK
+
+
+_OPEN_SIDES = bytes(4 - bin(b & WALL_MASK).count("1") for b in range(256))
+_IDLE: ContextManager[None] = nullcontext()
+
+
+def count_passages(grid: Grid) -> int:
+    """
+    Counts the open walls between two cells of a grid.
+
+    Args:
+        grid (Grid): The maze grid.
+
+    Returns:
+        int: Number of passages, each shared wall counted once.
+    """
+    return sum(grid.data.translate(_OPEN_SIDES)) // 2
+
+
+class Profiler:
+    """
+    Opt-in phase timers and counters for one maze generator.
+
+    Every phase is timed with the monotonic ``time.perf_counter`` and
+    accumulates its total and its number of calls. When disabled,
+    ``phase`` hands out one shared no-op context, so the instrumented
+    code paths cost a method call and nothing else. With a dump path,
+    the instrumented sessions also run under ``cProfile`` and the
+    collected stats are saved for ``pstats`` or snakeviz.
+
+    Attributes:
+        enabled (bool): Whether timings and counters are recorded.
+        dump_path (Optional[str]): pstats file written after each session,
+        None to skip cProfile.
+        timings (Dict[str, List[float]]): Phase name to its
+        [total seconds, calls].
+        counters (Dict[str, int]): Counter name to its value.
+    """
+
+    __slots__ = ("enabled", "dump_path", "timings", "counters", "__profile")
+
+    def __init__(
+        self, enabled: bool = False, dump_path: Optional[str] = None
+    ) -> None:
+        """
+        Creates an empty profiler.
+
+        Args:
+            enabled (bool): Whether to record anything.
+            dump_path (Optional[str]): pstats output file; enables the
+            profiler too.
+
+        Returns:
+            None
+        """
+        self.enabled = enabled or dump_path is not None
+        self.dump_path = dump_path
+        self.timings: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.__profile: Optional[cProfile.Profile] = (
+            cProfile.Profile() if dump_path is not None else None
+        )
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """
+        Times the enclosed block under a phase name.
+
+        Args:
+            name (str): Phase name, e.g. "carving" or "sleep".
+
+        Returns:
+            ContextManager[None]: The timer, or a no-op when disabled.
+        """
+        if not self.enabled:
+            return _IDLE
+        return self.__timer(name)
+
+    @contextmanager
+    def __timer(self, name: str) -> Iterator[None]:
+        """
+        Adds the elapsed time of the enclosed block to a phase.
+
+        Args:
+            name (str): Phase name.
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.timings.setdefault(name, [0.0, 0])
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): Counter name, e.g. "frames drawn".
+            amount (int): Value to add.
+
+        Returns:
+            None
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        """
+        Runs the enclosed block under cProfile when a dump path is set.
+
+        The same cProfile instance is reused by every session, so each
+        dump holds everything profiled so far.
+
+        Yields:
+            None
+        """
+        if self.__profile is None or self.dump_path is None:
+            yield
+            return
+
+        self.__profile.enable()
+        try:
+            yield
+        finally:
+            self.__profile.disable()
+            self.__profile.dump_stats(self.dump_path)
+
+    def report(self) -> str:
+        """
+        Formats the timings and counters as a summary table.
+
+        Phases nest: "carving" and "solve" include the animation phases
+        ("check_for_enter", "display_maze", "sleep") run inside them.
+
+        Returns:
+            str: The table, one line per phase and per counter.
+        """
+        lines = [
+            f"{'Phase':<20}{'Calls':>10}{'Total (s)':>14}{'Mean (ms)':>14}"
+        ]
+        for name, (total, calls) in self.timings.items():
+            mean = total / calls * 1000 if calls else 0.0
+            lines.append(
+                f"{name:<20}{int(calls):>10}{total:>14.4f}{mean:>14.4f}"
+            )
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'Counter':<20}{'Value':>10}")
+            for name, value in self.counters.items():
+                lines.append(f"{name:<20}{value:>10}")
+        if self.dump_path is not None:
+            lines.append("")
+            lines.append(f"cProfile stats saved to {self.dump_path}")
+        return "\n".join(lines)
@@ -0,0 +1,350 @@
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from .grid import Grid, EAST, SOUTH, WEST
+from .themes import Themes
+from .terminal_ctl import TerminalCtl
+
+
+BLOCK = "\u2588"
+
+
+class PathIndex:
+    """
+    Ordered path with O(1) membership tests and O(1) appends.
+
+    Rendering asks "is this cell on the path?" several times per cell, so
+    a path is indexed once into a set and then grown one coordinate at a
+    time during replays instead of being rescanned as a list.
+
+    Attributes:
+        coords (List[Tuple[int, int]]): The path in walking order.
+        members (Set[Tuple[int, int]]): The same coordinates as a set.
+    """
+
+    __slots__ = ("coords", "members")
+
+    def __init__(self, coords: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Indexes an initial path.
+
+        Args:
+            coords (Iterable[Tuple[int, int]]): The path in walking order.
+
+        Returns:
+            None
+        """
+        self.coords: List[Tuple[int, int]] = list(coords)
+        self.members: Set[Tuple[int, int]] = set(self.coords)
+
+    @property
+    def head(self) -> Optional[Tuple[int, int]]:
+        """Last coordinate of the path, drawn as the player."""
+        return self.coords[-1] if self.coords else None
+
+    def append(self, coord: Tuple[int, int]) -> None:
+        """
+        Extends the path by one coordinate.
+
+        Args:
+            coord (Tuple[int, int]): The next (x, y) on the path.
+
+        Returns:
+            None
+        """
+        self.coords.append(coord)
+        self.members.add(coord)
+
+    def __contains__(self, coord: object) -> bool:
+        return coord in self.members
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.coords)
+
+
+class Renderer:
+    """
+    Builds whole maze frames in memory and writes each one in a single call.
+
+    Every colored glyph is formatted once per theme when the renderer is
+    created; drawing a frame only joins those preformatted strings and
+    hands the result to one ``sys.stdout.write``.
+
+    Attributes:
+        grid (Grid): The grid being drawn.
+        entry (Tuple[int, int]): (x, y) of the entrance cell.
+        exit (Tuple[int, int]): (x, y) of the exit cell.
+        glyphs (Dict[str, str]): Preformatted colored glyphs.
+        origin_row (int): Terminal row the frame starts on.
+        shadow (Optional[List[str]]): Glyphs currently on screen, three per
+        cell (west, body, south), or None when unknown.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        theme: Themes,
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+        origin_row: int = 1
+    ) -> None:
+        """
+        Prepares the glyph table for the given theme.
+
+        Args:
+            grid (Grid): The grid being drawn.
+            theme (Themes): The selected color theme.
+            entry (Tuple[int, int]): (x, y) of the entrance cell.
+            exit (Tuple[int, int]): (x, y) of the exit cell.
+            origin_row (int): Terminal row the frame starts on.
+
+        Returns:
+            None
+        """
+        self.grid = grid
+        self.entry = entry
+        self.exit = exit
+        self.glyphs = self.build_glyphs(theme)
+        self.origin_row = origin_row
+        self.shadow: Optional[List[str]] = None
+
+    @staticmethod
+    def build_glyphs(theme: Themes) -> Dict[str, str]:
+        """
+        Formats every colored glyph used by a frame.
+
+        Args:
+            theme (Themes): The selected color theme.
+
+        Returns:
+            Dict[str, str]: Glyph name to ANSI colored string.
+        """
+        colors = theme.theme
+        reset = theme.reset
+        cell = BLOCK * 2
+
+        glyphs = {
+            "corner": f"{colors['W_C']}{cell}{reset}",
+            "v_wall": f"{colors['W_C']}{cell}{reset}",
+            "h_wall": f"{colors['W_C']}{BLOCK * 4}{reset}",
+            "body": f"{colors['P_C']}{cell}{reset}",
+            "sol": f"{colors['SOL_C']}{cell}{reset}",
+            "exp": f"{colors['EXP_C']}{cell}{reset}",
+            "player": f"{colors['PL_C']}{cell}{reset}",
+            "start": f"{colors['S_C']}{cell}{reset}",
+            "exit": f"{colors['E_C']}{cell}{reset}",
+            "closed": f"{colors['CC_C']}{cell}{reset}",
+        }
+        glyphs["sol_down"] = glyphs["sol"] + glyphs["corner"]
+        glyphs["exp_down"] = glyphs["exp"] + glyphs["corner"]
+        glyphs["body_down"] = glyphs["body"] + glyphs["corner"]
+        return glyphs
+
+    def has_frame(self) -> bool:
+        """
+        Tells whether the shadow copy matches a frame on screen.
+
+        Returns:
+            bool: True once a full frame has been drawn and not invalidated.
+        """
+        return self.shadow is not None
+
+    def invalidate(self) -> None:
+        """
+        Forgets the shadow frame, e.g. after the screen has been cleared.
+
+        Returns:
+            None
+        """
+        self.shadow = None
+
+    def cell_glyphs(
+        self,
+        x: int,
+        y: int,
+        walls: int,
+        path_coords: PathIndex,
+        visited_coords: Set[Tuple[int, int]],
+        head: Optional[Tuple[int, int]]
+    ) -> Tuple[str, str, str]:
+        """
+        Picks the three glyphs owned by one cell.
+
+        A cell owns its west wall slot, its body and its south wall slot
+        (the south slot includes the corner that follows it).
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            walls (int): Wall bitmask of the cell.
+            path_coords (PathIndex): Coordinates for the path.
+            visited_coords (Set[Tuple[int, int]]): Coordinates for explored
+            nodes.
+            head (Optional[Tuple[int, int]]): Cell drawn as the player.
+
+        Returns:
+            Tuple[str, str, str]: The west, body and south glyphs.
+        """
+        g = self.glyphs
+        cell = (x, y)
+
+        if walls & WEST:
+            west = g["v_wall"]
+        elif cell in path_coords and (x - 1, y) in path_coords:
+            west = g["sol"]
+        elif cell in visited_coords and (x - 1, y) in visited_coords:
+            west = g["exp"]
+        else:
+            west = g["body"]
+
+        if cell == head:
+            body = g["player"]
+        elif cell == self.entry:
+            body = g["start"]
+        elif cell == self.exit:
+            body = g["exit"]
+        elif cell in path_coords:
+            body = g["sol"]
+        elif cell in visited_coords:
+            body = g["exp"]
+        elif walls == 15:
+            body = g["closed"]
+        else:
+            body = g["body"]
+
+        if walls & SOUTH:
+            south = g["h_wall"]
+        elif cell in path_coords and (x, y + 1) in path_coords:
+            south = g["sol_down"]
+        elif cell in visited_coords and (x, y + 1) in visited_coords:
+            south = g["exp_down"]
+        else:
+            south = g["body_down"]
+
+        return west, body, south
+
+    def render_frame(
+        self,
+        path_coords: PathIndex,
+        visited_coords: Set[Tuple[int, int]]
+    ) -> str:
+        """
+        Builds the full text of one maze frame and refreshes the shadow.
+
+        Args:
+            path_coords (PathIndex): Coordinates for the path; the last
+            one is drawn as the player.
+            visited_coords (Set[Tuple[int, int]]): Coordinates for explored
+            nodes.
+
+        Returns:
+            str: The frame, one terminal line per text row.
+        """
+        g = self.glyphs
+        grid = self.grid
+        head = path_coords.head
+        eol = TerminalCtl.erase_line + "\n"
+        shadow: List[str] = []
+
+        out: List[str] = [g["corner"], g["h_wall"] * grid.width, eol]
+
+        for y in range(grid.height):
+            row = grid.row_walls(y)
+            south_line = [g["corner"]]
+
+            for x, walls in enumerate(row):
+                west, body, south = self.cell_glyphs(
+                    x, y, walls, path_coords, visited_coords, head
+                )
+                out.append(west)
+                out.append(body)
+                south_line.append(south)
+                shadow.extend((west, body, south))
+
+            if row[-1] & EAST:
+                out.append(g["v_wall"])
+            out.append(eol)
+            out.extend(south_line)
+            out.append(eol)
+
+        self.shadow = shadow
+        return "".join(out)
+
+    def draw(
+        self,
+        path_coords: PathIndex,
+        visited_coords: Set[Tuple[int, int]]
+    ) -> None:
+        """
+        Renders one frame and flushes it with a single write.
+
+        Args:
+            path_coords (PathIndex): Coordinates for the path.
+            visited_coords (Set[Tuple[int, int]]): Coordinates for explored
+            nodes.
+
+        Returns:
+            None
+        """
+        sys.stdout.write(self.render_frame(path_coords, visited_coords))
+        sys.stdout.flush()
+
+    def update(
+        self,
+        dirty: Iterable[Tuple[int, int]],
+        path_coords: PathIndex,
+        visited_coords: Set[Tuple[int, int]]
+    ) -> int:
+        """
+        Redraws only the glyphs of dirty cells that differ from the shadow.
+
+        Each dirty cell also refreshes its east and north neighbours, whose
+        west and south slots depend on it. Changed glyphs are written with
+        cursor-addressed updates in one call, so a step costs O(1) instead
+        of a full O(W*H) frame. A full frame must be on screen first.
+
+        Args:
+            dirty (Iterable[Tuple[int, int]]): Cells whose state changed.
+            path_coords (PathIndex): Coordinates for the path.
+            visited_coords (Set[Tuple[int, int]]): Coordinates for explored
+            nodes.
+
+        Returns:
+            int: The number of glyphs written.
+        """
+        shadow = self.shadow
+        if shadow is None:
+            raise RuntimeError("no frame on screen to update")
+
+        grid = self.grid
+        head = path_coords.head
+        top = self.origin_row
+        out: List[str] = []
+        cells = set()
+
+        for x, y in dirty:
+            cells.update(((x, y), (x + 1, y), (x, y - 1)))
+
+        for x, y in cells:
+            if not grid.in_bounds(x, y):
+                continue
+
+            base = (y * grid.width + x) * 3
+            glyphs = self.cell_glyphs(
+                x, y, grid.walls(x, y), path_coords, visited_coords, head
+            )
+            for slot, glyph in enumerate(glyphs):
+                if shadow[base + slot] == glyph:
+                    continue
+                shadow[base + slot] = glyph
+                row = top + y * 2 + 1 + (slot == 2)
+                col = x * 4 + (1 if slot == 0 else 3)
+                out.append(TerminalCtl.goto(row, col))
+                out.append(glyph)
+
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+        return len(out) // 2
@@ -0,0 +1,385 @@
+import heapq
+from array import array
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .grid import Grid, MOVES
+from .corridors import CorridorGraph
+
+
+ROOT = len(MOVES) + 1
+
+
+class SearchStats:
+    """
+    Counters filled in by a search so solvers can be compared.
+
+    Attributes:
+        expanded (int): Number of cells taken off the open list and
+        expanded.
+    """
+
+    __slots__ = ("expanded",)
+
+    def __init__(self) -> None:
+        """
+        Starts every counter at zero.
+
+        Returns:
+            None
+        """
+        self.expanded = 0
+
+
+def bfs_search(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    parents: bytearray,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Breadth-first search from ``start`` that stops once ``goal`` is popped.
+
+    The queue holds flat cell indices in a deque, and instead of carrying
+    a path string per entry each reached cell records the move that
+    entered it in ``parents`` (move index + 1, 0 meaning unreached and
+    ROOT marking the start), so the search is O(W*H) in time and memory.
+
+    Args:
+        grid (Grid): The maze grid.
+        start (Tuple[int, int]): (x, y) cell the search starts from.
+        goal (Tuple[int, int]): (x, y) cell the search looks for.
+        parents (bytearray): Zeroed buffer of ``width * height`` bytes,
+        filled with the entering move of every reached cell.
+        stats (Optional[SearchStats]): Counters to update, if any.
+
+    Yields:
+        Tuple[int, int, int, int]: (cx, cy, nx, ny) for every open passage
+        examined, whether or not the neighbour was already reached.
+    """
+    stats = stats or SearchStats()
+    width, height = grid.width, grid.height
+    data = grid.data
+    start_i = start[1] * width + start[0]
+    goal_i = goal[1] * width + goal[0]
+
+    parents[start_i] = ROOT
+    queue = deque([start_i])
+
+    while queue:
+        current = queue.popleft()
+        stats.expanded += 1
+        if current == goal_i:
+            return
+
+        cy, cx = divmod(current, width)
+        walls = data[current]
+        for move, (dx, dy, wall, _) in enumerate(MOVES):
+            nx, ny = cx + dx, cy + dy
+            if walls & wall or not (0 <= nx < width and 0 <= ny < height):
+                continue
+
+            neighbor = ny * width + nx
+            if not parents[neighbor]:
+                parents[neighbor] = move + 1
+                queue.append(neighbor)
+            yield cx, cy, nx, ny
+
+
+def bidir_search(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    parents: bytearray,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Bidirectional BFS that grows one tree from each end until they meet.
+
+    Whole levels are expanded at a time, always on the side with the
+    smaller frontier. Once a level touches the other tree, the level is
+    finished and the shortest meeting passage is kept, so the path is as
+    short as a plain BFS one. The goal side of the path is then spliced
+    into ``parents`` so ``rebuild_path`` works unchanged.
+
+    Args:
+        grid (Grid): The maze grid.
+        start (Tuple[int, int]): (x, y) cell the search starts from.
+        goal (Tuple[int, int]): (x, y) cell the search looks for.
+        parents (bytearray): Zeroed buffer of ``width * height`` bytes,
+        filled with the entering move of the start side cells.
+        stats (Optional[SearchStats]): Counters to update, if any.
+
+    Yields:
+        Tuple[int, int, int, int]: (cx, cy, nx, ny) for every open passage
+        examined from either side.
+    """
+    stats = stats or SearchStats()
+    width, height = grid.width, grid.height
+    data = grid.data
+    size = width * height
+    start_i = start[1] * width + start[0]
+    goal_i = goal[1] * width + goal[0]
+
+    back = bytearray(size)
+    trees = (parents, back)
+    dist = (array("l", [-1]) * size, array("l", [-1]) * size)
+    parents[start_i] = back[goal_i] = ROOT
+    dist[0][start_i] = dist[1][goal_i] = 0
+    frontiers: List[List[int]] = [[start_i], [goal_i]]
+    best: Optional[Tuple[int, int, int, int]] = None
+
+    while frontiers[0] and frontiers[1] and best is None:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = dist[side], dist[1 - side]
+        tree = trees[side]
+        following: List[int] = []
+
+        for current in frontiers[side]:
+            stats.expanded += 1
+            cy, cx = divmod(current, width)
+            walls = data[current]
+            for move, (dx, dy, wall, _) in enumerate(MOVES):
+                nx, ny = cx + dx, cy + dy
+                if walls & wall or not (0 <= nx < width and 0 <= ny < height):
+                    continue
+
+                neighbor = ny * width + nx
+                if other[neighbor] >= 0:
+                    total = mine[current] + 1 + other[neighbor]
+                    if best is None or total < best[0]:
+                        if side == 0:
+                            best = (total, current, neighbor, move)
+                        else:
+                            best = (total, neighbor, current, (move + 2) % 4)
+                if mine[neighbor] < 0:
+                    mine[neighbor] = mine[current] + 1
+                    tree[neighbor] = move + 1
+                    following.append(neighbor)
+                yield cx, cy, nx, ny
+
+        frontiers[side] = following
+
+    if best is None:
+        return
+
+    _, _, node, move = best
+    parents[node] = move + 1
+    while back[node] != ROOT:
+        entered = back[node] - 1
+        dx, dy, _, _ = MOVES[entered]
+        node -= dy * width + dx
+        parents[node] = (entered + 2) % 4 + 1
+
+
+def astar_search(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    parents: bytearray,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    A* search guided by the Manhattan distance to ``goal``.
+
+    The heuristic never overestimates on a 4-connected grid and is
+    consistent, so the goal is reached along a shortest path the first
+    time it is popped. Ties on f are broken towards the deeper cell,
+    which keeps the search on long corridors instead of fanning out.
+
+    Args:
+        grid (Grid): The maze grid.
+        start (Tuple[int, int]): (x, y) cell the search starts from.
+        goal (Tuple[int, int]): (x, y) cell the search looks for.
+        parents (bytearray): Zeroed buffer of ``width * height`` bytes,
+        filled with the entering move of every reached cell.
+        stats (Optional[SearchStats]): Counters to update, if any.
+
+    Yields:
+        Tuple[int, int, int, int]: (cx, cy, nx, ny) for every open passage
+        examined from an expanded cell.
+    """
+    stats = stats or SearchStats()
+    width, height = grid.width, grid.height
+    data = grid.data
+    gx, gy = goal
+    start_i = start[1] * width + start[0]
+    goal_i = gy * width + gx
+
+    cost = array("l", [-1]) * (width * height)
+    closed = bytearray(width * height)
+    parents[start_i] = ROOT
+    cost[start_i] = 0
+    heap = [(abs(gx - start[0]) + abs(gy - start[1]), 0, start_i)]
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        stats.expanded += 1
+        if current == goal_i:
+            return
+
+        cy, cx = divmod(current, width)
+        walls = data[current]
+        step = cost[current] + 1
+        for move, (dx, dy, wall, _) in enumerate(MOVES):
+            nx, ny = cx + dx, cy + dy
+            if walls & wall or not (0 <= nx < width and 0 <= ny < height):
+                continue
+
+            neighbor = ny * width + nx
+            if not closed[neighbor] and (
+                cost[neighbor] < 0 or step < cost[neighbor]
+            ):
+                cost[neighbor] = step
+                parents[neighbor] = move + 1
+                heapq.heappush(heap, (
+                    step + abs(gx - nx) + abs(gy - ny), -step, neighbor
+                ))
+            yield cx, cy, nx, ny
+
+
+def corridor_search(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    parents: bytearray,
+    stats: Optional[SearchStats] = None
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Dijkstra's algorithm on the pruned junction graph of the maze.
+
+    The dead ends are filled first, then every corridor between two
+    junctions, the start or the goal becomes one weighted edge of a
+    ``CorridorGraph``, so only junctions are expanded: a perfect maze
+    shrinks to its solution path. The corridors of the shortest path are
+    written back into ``parents`` so ``rebuild_path`` works unchanged.
+
+    Args:
+        grid (Grid): The maze grid.
+        start (Tuple[int, int]): (x, y) cell the search starts from.
+        goal (Tuple[int, int]): (x, y) cell the search looks for.
+        parents (bytearray): Zeroed buffer of ``width * height`` bytes,
+        filled with the entering move of the path cells.
+        stats (Optional[SearchStats]): Counters to update, if any.
+
+    Yields:
+        Tuple[int, int, int, int]: (cx, cy, nx, ny) for every passage of
+        the corridors leaving an expanded junction.
+    """
+    stats = stats or SearchStats()
+    width = grid.width
+    start_i = start[1] * width + start[0]
+    goal_i = goal[1] * width + goal[0]
+    parents[start_i] = ROOT
+    if start_i == goal_i:
+        stats.expanded += 1
+        return
+
+    graph = CorridorGraph(grid, (start, goal), prune=True)
+    letters = {letter: move for move, (_, _, _, letter) in enumerate(MOVES)}
+    dist = {start_i: 0}
+    previous: Dict[int, Tuple[int, str]] = {}
+    heap = [(0, start_i)]
+
+    while heap:
+        length, node = heapq.heappop(heap)
+        if length > dist[node]:
+            continue
+        stats.expanded += 1
+        if node == goal_i:
+            break
+
+        for target, weight, moves in graph.edges[node]:
+            cy, cx = divmod(node, width)
+            for letter in moves:
+                dx, dy, _, _ = MOVES[letters[letter]]
+                yield cx, cy, cx + dx, cy + dy
+                cx, cy = cx + dx, cy + dy
+            total = length + weight
+            if total < dist.get(target, total + 1):
+                dist[target] = total
+                previous[target] = (node, moves)
+                heapq.heappush(heap, (total, target))
+
+    node = goal_i
+    while node in previous:
+        node, moves = previous[node]
+        current = node
+        for letter in moves:
+            move = letters[letter]
+            dx, dy, _, _ = MOVES[move]
+            current += dy * width + dx
+            parents[current] = move + 1
+
+
+Search = Callable[
+    [Grid, Tuple[int, int], Tuple[int, int], bytearray,
+     Optional[SearchStats]],
+    Iterator[Tuple[int, int, int, int]]
+]
+SEARCHES: Dict[str, Search] = {
+    "BFS": bfs_search,
+    "BIDIR": bidir_search,
+    "ASTAR": astar_search,
+    "CORRIDOR": corridor_search,
+}
+
+
+def rebuild_path(
+    width: int, parents: bytearray, goal: Tuple[int, int]
+) -> str:
+    """
+    Walks the parent moves back from ``goal`` and builds the move string.
+
+    Args:
+        width (int): Width of the grid the parents belong to.
+        parents (bytearray): Buffer filled by ``bfs_search``.
+        goal (Tuple[int, int]): (x, y) cell the path ends at.
+
+    Returns:
+        str: The N/E/S/W moves from the start to ``goal``, or an empty
+        string if ``goal`` was never reached.
+    """
+    current = goal[1] * width + goal[0]
+    moves = []
+
+    while 0 < parents[current] < ROOT:
+        dx, dy, _, letter = MOVES[parents[current] - 1]
+        moves.append(letter)
+        current -= dy * width + dx
+
+    if parents[current] != ROOT:
+        return ""
+    moves.reverse()
+    return "".join(moves)
+
+
+def solve(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    method: str = "BFS",
+    stats: Optional[SearchStats] = None
+) -> str:
+    """
+    Finds the shortest path between two cells.
+
+    Args:
+        grid (Grid): The maze grid.
+        start (Tuple[int, int]): (x, y) cell the path starts from.
+        goal (Tuple[int, int]): (x, y) cell the path ends at.
+        method (str): One of ``SEARCHES``: "BFS", "BIDIR", "ASTAR" or
+        "CORRIDOR".
+        stats (Optional[SearchStats]): Counters to update, if any.
+
+    Returns:
+        str: A string representing the moves (N, E, S, W), empty when
+        ``goal`` is unreachable.
+    """
+    parents = bytearray(grid.width * grid.height)
+    for _ in SEARCHES[method](grid, start, goal, parents, stats):
+        pass
+    return rebuild_path(grid.width, parents, goal)
@@ -0,0 +1,50 @@
+import random
+
+
+class MazeStreams:
+    """
+    Independent random streams of one maze, all derived from its SEED.
+
+    Each stage draws from its own ``random.Random``, seeded with the SEED
+    and the stage name through the SHA-512 string seeding of ``random``,
+    so it never touches the interpreter-wide RNG. Mazes built in threads,
+    worker processes or any order reproduce exactly, and adding draws to
+    one stage (e.g. a different BRAID) leaves the others unchanged.
+
+    Attributes:
+        seed (int): The SEED the streams derive from.
+        pattern (random.Random): Placement of the '42' pattern.
+        carving (random.Random): The generation algorithm.
+        braiding (random.Random): The imperfect (braid) pass.
+    """
+
+    __slots__ = ("seed", "pattern", "carving", "braiding")
+
+    def __init__(self, seed: int) -> None:
+        """
+        Derives every stream from the seed.
+
+        Args:
+            seed (int): The maze SEED.
+
+        Returns:
+            None
+        """
+        self.seed = seed
+        self.pattern = self.derive(seed, "pattern")
+        self.carving = self.derive(seed, "carving")
+        self.braiding = self.derive(seed, "braiding")
+
+    @staticmethod
+    def derive(seed: int, name: str) -> random.Random:
+        """
+        Builds the stream of one named stage.
+
+        Args:
+            seed (int): The maze SEED.
+            name (str): Name of the stage.
+
+        Returns:
+            random.Random: A generator that depends only on both values.
+        """
+        return random.Random(f"{seed}:{name}")
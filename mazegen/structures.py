@@ -0,0 +1,158 @@
+import random
+from array import array
+from typing import Iterator
+
+
+class UnionFind:
+    """
+    Disjoint sets over the integers ``0..size-1`` backed by flat arrays.
+
+    Parents live in a typed array and ranks in a bytearray, so a million
+    cells cost a few megabytes instead of a million Python objects.
+    ``find`` compresses paths by halving and ``union`` links by rank, so
+    any sequence of operations runs in near-constant amortized time.
+
+    Attributes:
+        parent (array): Parent index of every element.
+        rank (bytearray): Upper bound of the height of every root's tree.
+    """
+
+    __slots__ = ("parent", "rank")
+
+    def __init__(self, size: int) -> None:
+        """
+        Puts every element in its own set.
+
+        Args:
+            size (int): The number of elements.
+
+        Returns:
+            None
+        """
+        self.parent = array("l", range(size))
+        self.rank = bytearray(size)
+
+    def find(self, item: int) -> int:
+        """
+        Returns the root of an element, halving the path on the way.
+
+        Args:
+            item (int): The element to look up.
+
+        Returns:
+            int: The root of the element's set.
+        """
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merges the sets of two elements, hanging the lower rank under the
+        higher one.
+
+        Args:
+            a (int): An element of the first set.
+            b (int): An element of the second set.
+
+        Returns:
+            bool: True if the sets were merged, False if already joined.
+        """
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        return True
+
+
+class RandomSet:
+    """
+    Set of integers ``0..size-1`` with O(1) add, discard and random pop.
+
+    Members are kept in a dense swap-remove array paired with a position
+    index, so removing any member moves the last one into its slot.
+
+    Attributes:
+        items (array): The members, in no particular order.
+        position (array): Slot of every integer in ``items``, -1 if absent.
+        rng (random.Random): Random source of ``pop_random``.
+    """
+
+    __slots__ = ("items", "position", "rng")
+
+    def __init__(self, size: int, rng: random.Random) -> None:
+        """
+        Creates an empty set able to hold ``0..size-1``.
+
+        Args:
+            size (int): The number of possible members.
+            rng (random.Random): Random source of ``pop_random``.
+
+        Returns:
+            None
+        """
+        self.items = array("l")
+        self.position = array("l", [-1]) * size
+        self.rng = rng
+
+    def add(self, item: int) -> None:
+        """
+        Adds an integer if it is not already a member.
+
+        Args:
+            item (int): The integer to add.
+
+        Returns:
+            None
+        """
+        if self.position[item] < 0:
+            self.position[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: int) -> None:
+        """
+        Removes an integer if it is a member.
+
+        Args:
+            item (int): The integer to remove.
+
+        Returns:
+            None
+        """
+        pos = self.position[item]
+        if pos < 0:
+            return
+        last = self.items.pop()
+        if last != item:
+            self.items[pos] = last
+            self.position[last] = pos
+        self.position[item] = -1
+
+    def pop_random(self) -> int:
+        """
+        Removes and returns a uniformly chosen member.
+
+        Returns:
+            int: The removed member.
+
+        Raises:
+            ValueError: If the set is empty.
+        """
+        item = self.items[self.rng.randrange(len(self.items))]
+        self.discard(item)
+        return item
+
+    def __contains__(self, item: int) -> bool:
+        return self.position[item] >= 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.items)
@@ -41,7 +41,20 @@ class TerminalCtl:
         Returns:
             None
         """
-        print(f"\033[{row};{col}H", end="")
+        print(TerminalCtl.goto(row, col), end="")
+
+    @staticmethod
+    def goto(row: int = 1, col: int = 1) -> str:
+        """Builds the escape sequence that moves the cursor to a coordinate.
+
+        Args:
+            row: The target row number.
+            col: The target column number.
+
+        Returns:
+            str: The ANSI cursor position sequence.
+        """
+        return f"\033[{row};{col}H"
 
     @staticmethod
     def clean_up() -> None:
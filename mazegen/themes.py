@@ -17,13 +17,21 @@ class Themes:
     """
     reset = "\033[0m"
 
-    def __init__(self) -> None:
+    def __init__(self, interactive: bool = True) -> None:
         """
-        Initializes the Themes class and prompts the user to select a theme.\nn
+        Initializes the Themes class and prompts the user to select a theme.\n
+
+        Args:
+            interactive (bool): Whether to prompt for a theme. When False
+            the Badlands theme is used without reading stdin.\n
 
         Returns:
             None
         """
+        if not interactive:
+            self.theme = self.get_badlands_theme()
+            return
+
         # Use Callable to be explicit about dictionary values
         theme_options: Dict[str, Callable[[], Dict[str, str]]] = {
             '1': self.get_badlands_theme,
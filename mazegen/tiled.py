@@ -0,0 +1,199 @@
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterator, List, Optional, Tuple
+from .grid import Grid, NORTH, EAST, SOUTH, WEST, VISITED
+from .structures import UnionFind
+
+
+Tile = Tuple[int, int, int, int]
+
+
+def split_tiles(width: int, height: int, size: int) -> List[Tile]:
+    """
+    Cuts the grid into square blocks, row by row.
+
+    Args:
+        width (int): The width of the grid in cells.
+        height (int): The height of the grid in cells.
+        size (int): Side of a block; blocks on the east and south edges
+        may be smaller.
+
+    Returns:
+        List[Tile]: (x0, y0, x1, y1) bounds of every block, end exclusive.
+    """
+    return [
+        (x0, y0, min(x0 + size, width), min(y0 + size, height))
+        for y0 in range(0, height, size)
+        for x0 in range(0, width, size)
+    ]
+
+
+def carve_tile(
+    name: str, width: int, tile: Tile, seed: int
+) -> Tuple[int, bytes, bytes]:
+    """
+    Carves one block with a DFS backtracker; runs inside a worker process.
+
+    The worker attaches to the shared wall buffer and only touches the
+    cells of its own block, so blocks never race. The '42' pattern can
+    split a block, hence every free cell left unvisited starts a new
+    tree and the block becomes a forest of local components.
+
+    Args:
+        name (str): Name of the shared memory block holding the grid.
+        width (int): The width of the whole grid in cells.
+        tile (Tile): (x0, y0, x1, y1) bounds of the block.
+        seed (int): Seed derived for this block.
+
+    Returns:
+        Tuple[int, bytes, bytes]: The number of components, then the flat
+        indices of the block's border cells and their component labels,
+        both as packed ``array("l")`` bytes.
+    """
+    x0, y0, x1, y1 = tile
+    rng = random.Random(seed)
+    shm = SharedMemory(name=name)
+    data = shm.buf
+    labels = array("l", [-1]) * ((x1 - x0) * (y1 - y0))
+    tile_w = x1 - x0
+    steps = ((0, -1, NORTH, SOUTH), (0, 1, SOUTH, NORTH),
+             (1, 0, EAST, WEST), (-1, 0, WEST, EAST))
+    count = 0
+
+    try:
+        for sy in range(y0, y1):
+            for sx in range(x0, x1):
+                if data[sy * width + sx] & VISITED:
+                    continue
+
+                data[sy * width + sx] |= VISITED
+                labels[(sy - y0) * tile_w + sx - x0] = count
+                stack = [(sx, sy)]
+                while stack:
+                    cx, cy = stack[-1]
+                    free = [
+                        (cx + dx, cy + dy, wall, opp_wall)
+                        for dx, dy, wall, opp_wall in steps
+                        if x0 <= cx + dx < x1 and y0 <= cy + dy < y1
+                        and not data[(cy + dy) * width + cx + dx] & VISITED
+                    ]
+                    if not free:
+                        stack.pop()
+                        continue
+
+                    nx, ny, wall, opp_wall = rng.choice(free)
+                    data[cy * width + cx] &= ~wall & 0xFF
+                    data[ny * width + nx] = (
+                        data[ny * width + nx] & ~opp_wall | VISITED
+                    ) & 0xFF
+                    labels[(ny - y0) * tile_w + nx - x0] = count
+                    stack.append((nx, ny))
+                count += 1
+    finally:
+        del data
+        shm.close()
+
+    indices, border = array("l"), array("l")
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            if x in (x0, x1 - 1) or y in (y0, y1 - 1):
+                label = labels[(y - y0) * tile_w + x - x0]
+                if label >= 0:
+                    indices.append(y * width + x)
+                    border.append(label)
+    return count, indices.tobytes(), border.tobytes()
+
+
+def seam_edges(
+    grid: Grid, size: int
+) -> Iterator[Tuple[int, int, int, int, int, int]]:
+    """
+    Lists the walls that cross block boundaries between two free cells.
+
+    Args:
+        grid (Grid): The grid with its pattern cells marked.
+        size (int): Side of a block.
+
+    Yields:
+        Tuple[int, int, int, int, int, int]: (x, y, nx, ny, wall, opp_wall)
+        for every seam wall, ready for ``Grid.carve``.
+    """
+    for y in range(grid.height):
+        for x in range(size, grid.width, size):
+            if not (grid.is_pattern(x - 1, y) or grid.is_pattern(x, y)):
+                yield x - 1, y, x, y, EAST, WEST
+    for y in range(size, grid.height, size):
+        for x in range(grid.width):
+            if not (grid.is_pattern(x, y - 1) or grid.is_pattern(x, y)):
+                yield x, y - 1, x, y, SOUTH, NORTH
+
+
+def tiled_dfs(
+    grid: Grid,
+    size: int,
+    rng: random.Random,
+    jobs: Optional[int] = None
+) -> None:
+    """
+    Generates a perfect maze block by block across worker processes.
+
+    The grid is copied once into a shared memory buffer; every block gets
+    a seed drawn from the carving stream, so the result depends on the
+    seed and TILE_SIZE only, never on the number of workers. Blocks are
+    then stitched with Kruskal's algorithm over their components: seam
+    walls are shuffled and opened only when they join two components
+    that are still apart, which yields a spanning tree of the tile graph.
+    The '42' pattern is placed before the split and never carved, so it
+    holds across seams. Complexity: O(W*H / jobs) for the blocks, plus
+    O(W*H / size) seam walls stitched in the main process.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        size (int): Side of a block in cells.
+        rng (random.Random): The carving stream.
+        jobs (Optional[int]): Worker processes; CPU count when None.
+
+    Returns:
+        None
+    """
+    tiles = split_tiles(grid.width, grid.height, size)
+    seeds = [rng.getrandbits(64) for _ in tiles]
+
+    shm = SharedMemory(create=True, size=len(grid.data))
+    try:
+        shm.buf[:len(grid.data)] = grid.data
+        workers = min(jobs or os.cpu_count() or 1, len(tiles))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                carve_tile,
+                [shm.name] * len(tiles),
+                [grid.width] * len(tiles),
+                tiles,
+                seeds
+            ))
+        grid.data[:] = shm.buf[:len(grid.data)]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    component: Dict[int, int] = {}
+    offset = 0
+    for count, index_bytes, label_bytes in results:
+        indices, labels = array("l"), array("l")
+        indices.frombytes(index_bytes)
+        labels.frombytes(label_bytes)
+        for index, label in zip(indices, labels):
+            component[index] = offset + label
+        offset += count
+
+    seams = list(seam_edges(grid, size))
+    rng.shuffle(seams)
+    sets = UnionFind(offset)
+    for x, y, nx, ny, wall, opp_wall in seams:
+        a = component[y * grid.width + x]
+        b = component[ny * grid.width + nx]
+        if sets.union(a, b):
+            grid.carve(x, y, nx, ny, wall, opp_wall)
@@ -0,0 +1,382 @@
+import random
+import importlib
+import importlib.util
+from collections import deque
+from typing import Any, Iterable, List, Set, Tuple
+from .grid import Grid, NORTH, EAST, SOUTH, WEST, WALL_MASK, FT_PATTERN
+from .error_class import ConfigValueError, B, RS
+
+
+ALGORITHMS = ("BINARY_TREE", "SIDEWINDER")
+DEFAULT_BRAID = 0.7
+STEPS = ((0, -1, NORTH, SOUTH), (1, 0, EAST, WEST),
+         (0, 1, SOUTH, NORTH), (-1, 0, WEST, EAST))
+_ALL = slice(None)
+SHIFTS = (
+    ((slice(1, None), _ALL), (slice(None, -1), _ALL)),
+    ((_ALL, slice(None, -1)), (_ALL, slice(1, None))),
+    ((slice(None, -1), _ALL), (slice(1, None), _ALL)),
+    ((_ALL, slice(1, None)), (_ALL, slice(None, -1))),
+)
+BULK_FRACTION = 128
+
+
+def require_numpy(feature: str) -> Any:
+    """
+    Imports NumPy on demand for the vectorized generators.
+
+    NumPy is an optional dependency (``pip install mazegen[fast]``), so
+    the rest of the package keeps working without it.
+
+    Args:
+        feature (str): The config setting asking for NumPy, e.g.
+        ``ALGORITHM=SIDEWINDER`` or ``BRAID``, used in the error.
+
+    Returns:
+        Any: The ``numpy`` module.
+
+    Raises:
+        ConfigValueError: If NumPy is not installed.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        raise ConfigValueError(
+            f"{B}{feature}{RS} requires NumPy, "
+            f"install it with {B}pip install numpy{RS}"
+        ) from None
+
+
+def has_numpy() -> bool:
+    """
+    Tells whether NumPy can be imported, without importing it.
+
+    Returns:
+        bool: True if the optional ``fast`` dependency is installed.
+    """
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _cells(np: Any, grid: Grid) -> Any:
+    """
+    Returns a writable (height, width) uint8 view over the packed grid.
+
+    Args:
+        np (Any): The ``numpy`` module.
+        grid (Grid): The grid to view.
+
+    Returns:
+        Any: The zero-copy array view of ``grid.data``.
+    """
+    return np.frombuffer(grid.data, dtype=np.uint8).reshape(
+        grid.height, grid.width
+    )
+
+
+def _open_moves(np: Any, open_: Any) -> Tuple[Any, Any]:
+    """
+    Finds the cells that may carve north and east.
+
+    A carve needs both the cell and its neighbour inside the maze and
+    outside the '42' pattern.
+
+    Args:
+        np (Any): The ``numpy`` module.
+        open_ (Any): Boolean (height, width) mask of non-pattern cells.
+
+    Returns:
+        Tuple[Any, Any]: The ``can_north`` and ``can_east`` masks.
+    """
+    can_north = np.zeros_like(open_)
+    can_north[1:] = open_[1:] & open_[:-1]
+    can_east = np.zeros_like(open_)
+    can_east[:, :-1] = open_[:, :-1] & open_[:, 1:]
+    return can_north, can_east
+
+
+def _carve(np: Any, walls: Any, north: Any, east: Any) -> None:
+    """
+    Removes the north and east walls of the masked cells in bulk, along
+    with the matching south and west walls of their neighbours.
+
+    Args:
+        np (Any): The ``numpy`` module.
+        walls (Any): (height, width) uint8 wall nibbles, edited in place.
+        north (Any): Boolean mask of cells opening north.
+        east (Any): Boolean mask of cells opening east.
+
+    Returns:
+        None
+    """
+    walls[north] &= np.uint8(~NORTH & WALL_MASK)
+    walls[:-1][north[1:]] &= np.uint8(~SOUTH & WALL_MASK)
+    walls[east] &= np.uint8(~EAST & WALL_MASK)
+    walls[:, 1:][east[:, :-1]] &= np.uint8(~WEST & WALL_MASK)
+
+
+def binary_tree(grid: Grid, stream: random.Random) -> None:
+    """
+    Carves a perfect maze with the Binary-Tree algorithm using NumPy.
+
+    One random bit per cell picks north or east; cells on the top row or
+    the east column, or facing the '42' pattern, take the other move. The
+    whole wall array is built from boolean masks, so there is no per-cell
+    Python loop. Complexity: O(W*H) time and memory, vectorized.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        stream (random.Random): Stream seeding the NumPy generator.
+
+    Returns:
+        None
+
+    Raises:
+        ConfigValueError: If NumPy is not installed.
+    """
+    np = require_numpy("ALGORITHM=BINARY_TREE")
+    rng = np.random.default_rng(stream.getrandbits(64))
+    cells = _cells(np, grid)
+    open_ = (cells & FT_PATTERN) == 0
+
+    can_north, can_east = _open_moves(np, open_)
+    coin = rng.random(cells.shape) < 0.5
+    north = can_north & (coin | ~can_east)
+    east = can_east & ~north
+
+    walls = np.full(cells.shape, WALL_MASK, dtype=np.uint8)
+    _carve(np, walls, north, east)
+    cells[:] = (cells & ~np.uint8(WALL_MASK)) | walls
+
+    sinks = open_ & ~north & ~east
+    sinks[0, -1] = False
+    ys, xs = np.nonzero(sinks)
+    join_components(grid, zip(xs.tolist(), ys.tolist()))
+
+
+def sidewinder(grid: Grid, stream: random.Random) -> None:
+    """
+    Carves a perfect maze with the Sidewinder algorithm using NumPy.
+
+    A random bit matrix decides where each horizontal run ends; runs are
+    numbered with a cumulative sum, and every run below the top row opens
+    north from one uniformly chosen cell, found with a second cumulative
+    count instead of a per-run loop. The top row is a single corridor.
+    Complexity: O(W*H) time and memory, vectorized.
+
+    Args:
+        grid (Grid): Grid with its pattern cells marked, walls all closed.
+        stream (random.Random): Stream seeding the NumPy generator.
+
+    Returns:
+        None
+
+    Raises:
+        ConfigValueError: If NumPy is not installed.
+    """
+    np = require_numpy("ALGORITHM=SIDEWINDER")
+    rng = np.random.default_rng(stream.getrandbits(64))
+    cells = _cells(np, grid)
+    open_ = (cells & FT_PATTERN) == 0
+    height, width = cells.shape
+
+    can_north, can_east = _open_moves(np, open_)
+    closed = (rng.random(cells.shape) < 0.5) | ~can_east
+    closed[0] = ~can_east[0]
+    east = ~closed
+
+    starts = np.zeros(cells.shape, dtype=bool)
+    starts[:, 0] = True
+    starts[:, 1:] = closed[:, :-1]
+    flat_starts = np.flatnonzero(starts)
+    run_rows = flat_starts // width
+
+    counts = np.cumsum(can_north.ravel(), dtype=np.int64)
+    before = np.concatenate(([0], counts))[flat_starts]
+    ends = np.concatenate((flat_starts[1:], [height * width]))
+    choices = counts[ends - 1] - before
+
+    linked = (choices > 0) & (run_rows > 0)
+    pick = (rng.random(len(flat_starts)) * choices).astype(np.int64)
+    targets = before[linked] + pick[linked] + 1
+    north = np.zeros(height * width, dtype=bool)
+    north[np.searchsorted(counts, targets)] = True
+    north = north.reshape(cells.shape)
+
+    walls = np.full(cells.shape, WALL_MASK, dtype=np.uint8)
+    _carve(np, walls, north, east)
+    cells[:] = (cells & ~np.uint8(WALL_MASK)) | walls
+
+    orphans = flat_starts[
+        ~linked & (run_rows > 0) & open_.ravel()[flat_starts]
+    ]
+    join_components(
+        grid, ((int(i) % width, int(i) // width) for i in orphans)
+    )
+
+
+def braid(grid: Grid, stream: random.Random, chance: float) -> None:
+    """
+    Opens loops by knocking one wall out of random dead ends, in bulk.
+
+    Dead ends are the open cells whose wall nibble has a popcount of 3,
+    found with one table lookup over the whole array. One batched draw
+    selects each dead end with probability ``chance`` and a second one
+    picks uniformly among its walls that lead to a free cell, so every
+    selected dead end becomes a loop. The chosen south and west walls
+    are shifted onto their neighbours as north and east openings, and
+    both sides of every wall are cleared with array operations.
+    Complexity: O(W*H) time and memory, vectorized.
+
+    Args:
+        grid (Grid): A carved grid.
+        stream (random.Random): Stream seeding the NumPy generator.
+        chance (float): Probability, 0.0 to 1.0, that a dead end opens.
+
+    Returns:
+        None
+
+    Raises:
+        ConfigValueError: If NumPy is not installed.
+    """
+    np = require_numpy("BRAID")
+    rng = np.random.default_rng(stream.getrandbits(64))
+    cells = _cells(np, grid)
+    walls = cells & np.uint8(WALL_MASK)
+    open_ = (cells & FT_PATTERN) == 0
+    popcount = np.array(
+        [bin(b).count("1") for b in range(16)], dtype=np.uint8
+    )
+
+    chosen = open_ & (popcount[walls] == 3)
+    chosen &= rng.random(cells.shape) < chance
+
+    height, width = cells.shape
+    padded = np.pad(open_, 1)
+    valid = []
+    for dx, dy, wall, _ in STEPS:
+        target = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        valid.append(chosen & target & ((walls & np.uint8(wall)) != 0))
+
+    counts = sum(v.astype(np.int64) for v in valid)
+    pick = (rng.random(cells.shape) * counts).astype(np.int64)
+    before = np.zeros_like(pick)
+    opened = []
+    for mask in valid:
+        opened.append(mask & (before == pick))
+        before += mask
+
+    north, east, south, west = opened
+    north[1:] |= south[:-1]
+    east[:, :-1] |= west[:, 1:]
+    _carve(np, walls, north, east)
+    cells[:] = (cells & ~np.uint8(WALL_MASK)) | walls
+
+
+def dead_end_rounds(
+    grid: Grid, kept: Iterable[int]
+) -> Tuple[bytearray, bytearray, List[int]]:
+    """
+    Fills dead ends a whole layer at a time with array operations.
+
+    Each round finds every cell with one open side leading to an unfilled
+    cell, fills them all at once and closes the matching side of their
+    neighbours, shifted in bulk per direction. Of two dead ends facing
+    each other, only the north or west one is filled, so a tree with no
+    kept cell still shrinks to one cell as with a sequential fill. A
+    round costs O(W*H) however few dead ends are left, so once fewer than
+    ``1 / BULK_FRACTION`` of the cells are dead ends the rest is handed
+    back for a per-cell fill along the remaining corridors.
+
+    Args:
+        grid (Grid): The maze grid.
+        kept (Iterable[int]): Flat indices of cells never filled.
+
+    Returns:
+        Tuple[bytearray, bytearray, List[int]]: The filled flag and the
+        open-side count of every cell so far, and the flat indices of the
+        dead ends left to fill.
+
+    Raises:
+        ConfigValueError: If NumPy is not installed.
+    """
+    np = require_numpy("dead_end_fill")
+    cells = _cells(np, grid)
+    height, width = cells.shape
+    popcount = np.array(
+        [bin(b).count("1") for b in range(16)], dtype=np.uint8
+    )
+    sides = ~cells & np.uint8(WALL_MASK)
+    degree = popcount[sides]
+    filled = np.zeros(cells.shape, dtype=bool)
+    keep = np.zeros(height * width, dtype=bool)
+    keep[np.fromiter(kept, dtype=np.intp)] = True
+    keep = keep.reshape(cells.shape)
+
+    while True:
+        dead = (degree == 1) & ~keep
+        count = int(np.count_nonzero(dead))
+        if count < max(1, height * width // BULK_FRACTION):
+            return (
+                bytearray(filled.astype(np.uint8).tobytes()),
+                bytearray(degree.tobytes()),
+                np.flatnonzero(dead).tolist(),
+            )
+
+        facing = np.zeros_like(dead)
+        facing[1:] = dead[1:] & dead[:-1] & (sides[1:] == NORTH)
+        facing[:, 1:] |= dead[:, 1:] & dead[:, :-1] & (sides[:, 1:] == WEST)
+        dead &= ~facing
+
+        for (_, _, wall, opposite), (src, dst) in zip(STEPS, SHIFTS):
+            leaving = dead[src] & ((sides[src] & np.uint8(wall)) != 0)
+            degree[dst] -= leaving
+            sides[dst][leaving] &= np.uint8(~opposite & WALL_MASK)
+        degree[dead] = 0
+        sides[dead] = 0
+        filled |= dead
+
+
+def join_components(grid: Grid, roots: Iterable[Tuple[int, int]]) -> None:
+    """
+    Reconnects the trees cut off by the '42' pattern.
+
+    Both vectorized algorithms leave a forest where every tree has one
+    root, the cell (or run) that could not carve towards the north-east,
+    and the top row always belongs to the main tree. Each cut-off root's
+    tree is flooded through its open passages, then one wall from it to
+    a cell of another tree is removed, merging the two without a loop.
+    A flood that reaches the top row was already joined by an earlier
+    merge and is left alone. Only the few trees around the pattern are
+    visited.
+
+    Args:
+        grid (Grid): The carved grid.
+        roots (Iterable[Tuple[int, int]]): One cell of each cut-off tree.
+
+    Returns:
+        None
+    """
+    for root in roots:
+        tree: Set[Tuple[int, int]] = {root}
+        queue = deque([root])
+        while queue:
+            cx, cy = queue.popleft()
+            if cy == 0:
+                break
+            for dx, dy, wall, _ in STEPS:
+                nx, ny = cx + dx, cy + dy
+                if not grid.has_wall(cx, cy, wall) and (nx, ny) not in tree:
+                    tree.add((nx, ny))
+                    queue.append((nx, ny))
+        else:
+            for cx, cy in tree:
+                bridge = next((
+                    (cx, cy, cx + dx, cy + dy, wall, opp_wall)
+                    for dx, dy, wall, opp_wall in STEPS
+                    if grid.in_bounds(cx + dx, cy + dy)
+                    and (cx + dx, cy + dy) not in tree
+                    and not grid.is_pattern(cx + dx, cy + dy)
+                ), None)
+                if bridge is not None:
+                    grid.carve(*bridge)
+                    break
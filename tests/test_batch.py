@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from mazegen import MazeGenerator
+from mazegen.batch import run_batch, seed_output_path
+from mazegen.maze import Maze
+from mazegen.mazefile import read_text
+
+
+CONFIG = """WIDTH=12
+HEIGHT=9
+ENTRY=0,0
+EXIT=11,8
+OUTPUT_FILE={output}
+PERFECT=True
+ALGORITHM=KRUSKAL
+"""
+
+
+class BatchTest(unittest.TestCase):
+    """A batch writes one file per seed, equal to a single run."""
+
+    def test_files_match_single_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_file = os.path.join(tmp, "config.txt")
+            template = os.path.join(tmp, "maze.txt")
+            with open(config_file, "w") as file:
+                file.write(CONFIG.format(output=template))
+
+            out_dir = os.path.join(tmp, "out")
+            results = sorted(run_batch(config_file, [1, 2, 3], 2, out_dir))
+            self.assertEqual([seed for seed, _, _ in results], [1, 2, 3])
+
+            config = Maze.MazeParseConfig.parsing_conf(config_file)
+            for seed, path, length in results:
+                with self.subTest(seed=seed):
+                    self.assertEqual(
+                        path, seed_output_path(template, seed, out_dir)
+                    )
+                    data = read_text(path)
+                    gen = MazeGenerator.from_maze(
+                        Maze.from_config(dict(config, SEED=seed))
+                    )
+                    gen.generate_maze()
+                    self.assertEqual(data.seed, seed)
+                    self.assertEqual(data.walls, gen.get_grid().wall_bytes())
+                    self.assertEqual(data.solution, gen.get_solution_path())
+                    self.assertEqual(len(data.solution), length)
+
+    def test_seed_output_path(self) -> None:
+        self.assertEqual(
+            seed_output_path(os.path.join("a", "maze.txt"), 7),
+            os.path.join("a", "maze_7.txt")
+        )
+        self.assertEqual(
+            seed_output_path("maze.txt", 7, "out"),
+            os.path.join("out", "maze_7.txt")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from mazegen import MazeGenerator
+from mazegen.cache import MazeCache, config_key
+from mazegen.maze import Maze
+from mazegen.mazefile import MazeData
+
+
+def generator(cache_dir: str, seed: str = "5") -> MazeGenerator:
+    """Builds a 16x12 generator caching into ``cache_dir``."""
+    config = {
+        "WIDTH": "16", "HEIGHT": "12", "ENTRY": "0,0", "EXIT": "15,11",
+        "OUTPUT_FILE": "unused.txt", "PERFECT": "True",
+        "ALGORITHM": "PRIM", "CACHE_DIR": cache_dir,
+    }
+    if seed:
+        config["SEED"] = seed
+    return MazeGenerator.from_maze(
+        Maze.from_config(Maze.MazeParseConfig.parsing_value(config))
+    )
+
+
+def entry(seed: int) -> MazeData:
+    """Builds a small cache entry."""
+    return MazeData(4, 2, bytes(8), (0, 0), (3, 1), seed, "EEES")
+
+
+class CacheTest(unittest.TestCase):
+    """Cached mazes must come back unchanged, and old ones go first."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_miss_then_hit(self) -> None:
+        cache = MazeCache(self.dir)
+        self.assertIsNone(cache.load("missing"))
+        cache.store("key", entry(3))
+        data = cache.load("key")
+        self.assertIsNotNone(data)
+        assert data is not None
+        self.assertEqual((data.seed, data.solution), (3, "EEES"))
+
+    def test_generator_restores_hit(self) -> None:
+        first = generator(self.dir)
+        first.generate_maze()
+        self.assertGreater(first.get_expanded_nodes(), 0)
+
+        second = generator(self.dir)
+        second.generate_maze()
+        self.assertEqual(second.get_expanded_nodes(), 0)
+        self.assertEqual(
+            first.get_grid().wall_bytes(), second.get_grid().wall_bytes()
+        )
+        self.assertEqual(
+            first.get_solution_path(), second.get_solution_path()
+        )
+
+    def test_unseeded_maze_is_not_cached(self) -> None:
+        gen = generator(self.dir, seed="")
+        gen.generate_maze()
+        self.assertIsNone(gen.get_cache())
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_key_ignores_output_settings(self) -> None:
+        base = {
+            "WIDTH": "9", "HEIGHT": "9", "ENTRY": "0,0", "EXIT": "8,8",
+            "OUTPUT_FILE": "a.txt", "PERFECT": "True", "SEED": "1",
+        }
+        first, same, other = (
+            config_key(Maze.MazeParseConfig.parsing_value(config))
+            for config in (
+                dict(base),
+                dict(base, OUTPUT_FILE="b.txt", ALGORITHM="DFS"),
+                dict(base, SEED="2"),
+            )
+        )
+        self.assertEqual(first, same)
+        self.assertNotEqual(first, other)
+
+    def test_corrupt_entry_is_a_miss(self) -> None:
+        cache = MazeCache(self.dir)
+        with open(cache.path("bad"), "wb") as file:
+            file.write(b"not a maze")
+        self.assertIsNone(cache.load("bad"))
+        self.assertFalse(os.path.exists(cache.path("bad")))
+
+    def test_unreadable_entry_is_a_miss(self) -> None:
+        cache = MazeCache(self.dir)
+        os.mkdir(cache.path("folder"))
+        self.assertIsNone(cache.load("folder"))
+
+        cache.store("key", entry(3))
+        with mock.patch(
+            "mazegen.cache.MappedMaze", side_effect=PermissionError
+        ):
+            self.assertIsNone(cache.load("key"))
+        with mock.patch("mazegen.cache.os.utime", side_effect=PermissionError):
+            self.assertIsNotNone(cache.load("key"))
+
+    def test_generator_survives_unreadable_cache(self) -> None:
+        generator(self.dir).generate_maze()
+        with mock.patch(
+            "mazegen.cache.MappedMaze", side_effect=PermissionError
+        ):
+            gen = generator(self.dir)
+            gen.generate_maze()
+        self.assertGreater(gen.get_expanded_nodes(), 0)
+        self.assertTrue(gen.get_solution_path())
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = MazeCache(self.dir)
+        cache.store("a", entry(1))
+        size = os.path.getsize(cache.path("a"))
+        cache.max_bytes = size * 3
+        for age, key in enumerate(("b", "c")):
+            cache.store(key, entry(age))
+        for age, key in enumerate(("a", "b", "c")):
+            os.utime(cache.path(key), ns=(age, age))
+
+        cache.load("a")
+        cache.store("d", entry(4))
+        # Four entries overflow the limit; trimming to LOW_WATER of it
+        # drops the two least recently used, b then c.
+        self.assertEqual(
+            sorted(os.listdir(self.dir)),
+            [os.path.basename(cache.path(key)) for key in ("a", "d")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
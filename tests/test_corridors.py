@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+from mazegen import MazeGenerator, vectorized
+from mazegen.corridors import CorridorGraph, dead_end_fill
+from mazegen.distance import DistanceField
+from mazegen.solver import SearchStats, solve
+
+
+def generate(algo: str, perfect: bool, seed: int) -> MazeGenerator:
+    """Generates a 24x18 maze from the entry corner to the far corner."""
+    gen = MazeGenerator.from_params(
+        24, 18, (0, 0), (23, 17), perfect, seed, algo, "unused.txt"
+    )
+    gen.generate_maze()
+    return gen
+
+
+class CorridorSolverTest(unittest.TestCase):
+    """SOLVER=CORRIDOR must find paths as short as BFS ones."""
+
+    def test_same_length_as_bfs(self) -> None:
+        for algo in ("DFS", "WILSON", "KRUSKAL"):
+            for perfect in (True, False):
+                for seed in range(3):
+                    with self.subTest(algo=algo, perfect=perfect, seed=seed):
+                        gen = generate(algo, perfect, seed)
+                        grid, maze = gen.get_grid(), gen.get_maze()
+                        path = solve(grid, maze.entry, maze.exit, "CORRIDOR")
+                        self.assertEqual(
+                            len(path),
+                            len(solve(grid, maze.entry, maze.exit, "BFS"))
+                        )
+                        self.assertEqual(
+                            gen.get_path_coords(maze.entry, path)[-1],
+                            maze.exit
+                        )
+
+    def test_expands_only_junctions(self) -> None:
+        gen = generate("DFS", True, 1)
+        grid, maze = gen.get_grid(), gen.get_maze()
+        stats = SearchStats()
+        solve(grid, maze.entry, maze.exit, "CORRIDOR", stats)
+        self.assertEqual(stats.expanded, 2)
+
+    def test_generator_uses_configured_solver(self) -> None:
+        gen = MazeGenerator.from_params(
+            24, 18, (0, 0), (23, 17), False, 4, "DFS", "unused.txt",
+            "CORRIDOR"
+        )
+        gen.generate_maze()
+        bfs = generate("DFS", False, 4)
+        self.assertEqual(
+            len(gen.get_solution_path()), len(bfs.get_solution_path())
+        )
+        self.assertLess(gen.get_expanded_nodes(), bfs.get_expanded_nodes())
+
+
+class CorridorGraphTest(unittest.TestCase):
+    """Queries on the junction graph must match the cell grid."""
+
+    def test_solve_between_any_cells(self) -> None:
+        gen = generate("WILSON", False, 2)
+        grid = gen.get_grid()
+        graph = CorridorGraph(grid)
+        self.assertLess(graph.node_count, grid.width * grid.height)
+        for start, goal in (((3, 4), (20, 11)), ((5, 5), (6, 5))):
+            with self.subTest(start=start, goal=goal):
+                self.assertEqual(
+                    len(graph.solve(start, goal)),
+                    len(solve(grid, start, goal))
+                )
+
+    def test_distances_match_distance_field(self) -> None:
+        gen = generate("KRUSKAL", False, 3)
+        grid = gen.get_grid()
+        field = DistanceField.from_grid(grid, (7, 9))
+        for node, length in CorridorGraph(grid).distances((7, 9)).items():
+            y, x = divmod(node, grid.width)
+            self.assertEqual(length, field.at(x, y))
+
+
+class DeadEndFillTest(unittest.TestCase):
+    """Filling dead ends leaves a perfect maze's solution path."""
+
+    def test_perfect_maze_shrinks_to_its_path(self) -> None:
+        gen = generate("DFS", True, 5)
+        grid, maze = gen.get_grid(), gen.get_maze()
+        filled, _ = dead_end_fill(grid, (maze.entry, maze.exit))
+        free = grid.width * grid.height - len(grid.pattern_cells())
+        self.assertEqual(
+            free - filled.count(1), len(gen.get_solution_path()) + 1
+        )
+
+    @unittest.skipUnless(vectorized.has_numpy(), "NumPy is not installed")
+    def test_bulk_rounds_match_cell_loop(self) -> None:
+        for algo in ("DFS", "KRUSKAL"):
+            for perfect in (True, False):
+                with self.subTest(algo=algo, perfect=perfect):
+                    gen = generate(algo, perfect, 6)
+                    grid, maze = gen.get_grid(), gen.get_maze()
+                    keep = (maze.entry, maze.exit)
+                    with mock.patch.object(
+                        vectorized, "BULK_FRACTION", 1 << 20
+                    ):
+                        bulk = dead_end_fill(grid, keep)
+                    with mock.patch.object(
+                        vectorized, "has_numpy", return_value=False
+                    ):
+                        self.assertEqual(bulk, dead_end_fill(grid, keep))
+
+
+if __name__ == "__main__":
+    unittest.main()
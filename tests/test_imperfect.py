@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+from mazegen import MazeGenerator
+from mazegen.maze import Maze
+from mazegen.vectorized import DEFAULT_BRAID, has_numpy
+
+
+def imperfect(extra: dict) -> MazeGenerator:
+    """Generates a seeded 30x20 imperfect DFS maze."""
+    config = {
+        "WIDTH": "30", "HEIGHT": "20", "ENTRY": "0,0", "EXIT": "29,19",
+        "OUTPUT_FILE": "unused.txt", "PERFECT": "False", "SEED": "9",
+    }
+    config.update(extra)
+    gen = MazeGenerator.from_maze(
+        Maze.from_config(Maze.MazeParseConfig.parsing_value(config))
+    )
+    gen.generate_maze()
+    return gen
+
+
+class ImperfectPassTest(unittest.TestCase):
+    """PERFECT=False runs the vectorized braid unless NumPy is missing."""
+
+    @unittest.skipUnless(has_numpy(), "NumPy is not installed")
+    def test_default_is_vectorized_braid(self) -> None:
+        default = imperfect({})
+        self.assertEqual(default.get_maze().braid, DEFAULT_BRAID)
+        explicit = imperfect({"BRAID": str(DEFAULT_BRAID)})
+        self.assertEqual(
+            default.get_grid().wall_bytes(), explicit.get_grid().wall_bytes()
+        )
+        self.assertEqual(
+            default.get_maze().cache_key, explicit.get_maze().cache_key
+        )
+
+    def test_falls_back_without_numpy(self) -> None:
+        with mock.patch("mazegen.maze.has_numpy", return_value=False):
+            gen = imperfect({})
+        self.assertIsNone(gen.get_maze().braid)
+        self.assertTrue(gen.get_solution_path())
+
+    def test_perfect_maze_has_no_braid(self) -> None:
+        self.assertIsNone(imperfect({"PERFECT": "True"}).get_maze().braid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from mazegen import MazeGenerator
+from mazegen.error_class import MazeFileError
+from mazegen.mazefile import (
+    HEADER, MazeData, MappedMaze, convert, read_text, write_binary,
+    write_text
+)
+
+
+def sample() -> MazeData:
+    """Snapshots a solved 13x7 maze; odd sizes exercise nibble padding."""
+    gen = MazeGenerator.from_params(
+        13, 7, (0, 0), (12, 6), False, -42, "DFS", "unused.txt"
+    )
+    gen.generate_maze()
+    return gen.to_data()
+
+
+class MazeFileTest(unittest.TestCase):
+    """Binary and text files must give back the maze they were given."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = sample()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def path(self, name: str) -> str:
+        """Returns a file path inside the scratch folder."""
+        return os.path.join(self.tmp.name, name)
+
+    def assertSameMaze(self, data: MazeData) -> None:
+        """Compares every field of ``data`` with the sample maze."""
+        expected = self.data
+        self.assertEqual(
+            (data.width, data.height, data.walls, data.entry, data.exit,
+             data.seed, data.solution),
+            (expected.width, expected.height, expected.walls,
+             expected.entry, expected.exit, expected.seed,
+             expected.solution)
+        )
+
+    def test_binary_round_trip(self) -> None:
+        write_binary(self.path("maze.bin"), self.data)
+        with MappedMaze(self.path("maze.bin")) as mapped:
+            self.assertEqual(mapped.walls(12, 6), self.data.walls[-1])
+            self.assertSameMaze(mapped.to_data())
+
+    def test_text_round_trip(self) -> None:
+        write_text(self.path("maze.txt"), self.data)
+        self.assertSameMaze(read_text(self.path("maze.txt")))
+
+    def test_convert_both_ways(self) -> None:
+        write_text(self.path("maze.txt"), self.data)
+        convert(self.path("maze.txt"), self.path("maze.bin"))
+        convert(self.path("maze.bin"), self.path("back.txt"))
+        with open(self.path("maze.txt"), "rb") as first:
+            with open(self.path("back.txt"), "rb") as second:
+                self.assertEqual(first.read(), second.read())
+
+    def test_truncated_files_are_rejected(self) -> None:
+        write_binary(self.path("maze.bin"), self.data)
+        with open(self.path("maze.bin"), "rb") as file:
+            content = file.read()
+        for size in (0, HEADER.size - 1, len(content) - 1):
+            with self.subTest(size=size):
+                with open(self.path("cut.bin"), "wb") as file:
+                    file.write(content[:size])
+                with self.assertRaises(MazeFileError):
+                    MappedMaze(self.path("cut.bin"))
+
+    def test_foreign_file_is_rejected(self) -> None:
+        with open(self.path("other.bin"), "wb") as file:
+            file.write(b"\0" * (HEADER.size + 16))
+        with self.assertRaises(MazeFileError):
+            MappedMaze(self.path("other.bin"))
+
+
+if __name__ == "__main__":
+    unittest.main()
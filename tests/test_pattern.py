@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+from collections import deque
+from mazegen import MazeGenerator
+from mazegen.maze import Maze
+from mazegen.grid import NORTH, EAST, SOUTH, WEST
+from mazegen.pattern import Pattern
+
+
+RING = ["###", "#.#", "###"]
+POCKETS = (
+    ["#.#", "###"],
+    ["#..#", "####"],
+    ["#.#.#", "#####"],
+    ["#.#", "#.#", "###"],
+)
+ALGORITHMS = ("WILSON", "DFS", "KRUSKAL", "PRIM", "ELLER")
+
+
+def reachable(gen: MazeGenerator) -> int:
+    """Counts the cells reachable from the entry through open walls."""
+    grid = gen.get_grid()
+    steps = ((0, -1, NORTH), (1, 0, EAST), (0, 1, SOUTH), (-1, 0, WEST))
+    start = gen.get_maze().entry
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy, wall in steps:
+            cell = (x + dx, y + dy)
+            if not grid.has_wall(x, y, wall) and cell not in seen:
+                seen.add(cell)
+                queue.append(cell)
+    return len(seen)
+
+
+def generate(path: str, algo: str, seed: int) -> MazeGenerator:
+    """Generates an 8x8 maze around the bitmap saved at ``path``."""
+    maze = Maze.from_config(
+        Maze.MazeParseConfig.parsing_value({
+            "WIDTH": "8", "HEIGHT": "8",
+            "ENTRY": "0,0", "EXIT": "7,7",
+            "OUTPUT_FILE": os.path.join(os.path.dirname(path), "out.txt"),
+            "PERFECT": "True", "SEED": str(seed),
+            "ALGORITHM": algo, "PATTERN": path,
+        })
+    )
+    gen = MazeGenerator.from_maze(maze)
+    gen.generate_maze()
+    return gen
+
+
+class RingPatternTest(unittest.TestCase):
+    """A bitmap enclosing a free cell must not cut the maze in two."""
+
+    def test_enclosed_cell_is_filled(self) -> None:
+        pattern = Pattern(RING)
+        self.assertIn((1, 1), pattern.cells)
+        self.assertEqual(len(pattern.cells), 9)
+
+    def test_every_algorithm_reaches_every_free_cell(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ring.txt")
+            with open(path, "w") as file:
+                file.write("\n".join(RING))
+
+            for algo in ALGORITHMS:
+                with self.subTest(algo=algo):
+                    gen = generate(path, algo, 1)
+                    self.assertEqual(reachable(gen), 8 * 8 - 9)
+                    self.assertTrue(gen.get_solution_path())
+
+
+class PocketPatternTest(unittest.TestCase):
+    """A pocket that only opens upwards must not cut the maze in two."""
+
+    def test_pockets_are_filled(self) -> None:
+        for lines in POCKETS:
+            with self.subTest(pattern="/".join(lines)):
+                pattern = Pattern(lines)
+                self.assertEqual(
+                    len(pattern.cells), pattern.width * pattern.height
+                )
+
+    def test_open_sides_are_kept(self) -> None:
+        pattern = Pattern(["#.#", "#.."])
+        self.assertEqual(len(pattern.cells), 3)
+
+    def test_every_algorithm_reaches_every_free_cell(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pocket.txt")
+            for lines in POCKETS:
+                with open(path, "w") as file:
+                    file.write("\n".join(lines))
+                free = 8 * 8 - len(Pattern(lines).cells)
+
+                for algo in ALGORITHMS:
+                    for seed in range(10):
+                        with self.subTest(
+                            pattern="/".join(lines), algo=algo, seed=seed
+                        ):
+                            gen = generate(path, algo, seed)
+                            self.assertEqual(reachable(gen), free)
+
+
+if __name__ == "__main__":
+    unittest.main()
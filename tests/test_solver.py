@@ -0,0 +1,80 @@
+import unittest
+from typing import Tuple
+from mazegen import MazeGenerator
+from mazegen.distance import DistanceField
+from mazegen.grid import Grid, MOVES
+from mazegen.solver import SEARCHES, solve
+
+
+def generate(algo: str, perfect: bool, seed: int) -> MazeGenerator:
+    """Generates a 20x16 maze from the entry corner to the far corner."""
+    gen = MazeGenerator.from_params(
+        20, 16, (0, 0), (19, 15), perfect, seed, algo, "unused.txt"
+    )
+    gen.generate_maze()
+    return gen
+
+
+def walk(grid: Grid, start: Tuple[int, int], path: str) -> Tuple[int, int]:
+    """Follows a move string, failing on a wall; returns the last cell."""
+    steps = {letter: (dx, dy, wall) for dx, dy, wall, letter in MOVES}
+    x, y = start
+    for letter in path:
+        dx, dy, wall = steps[letter]
+        if grid.has_wall(x, y, wall):
+            raise AssertionError(f"move {letter} from {(x, y)} hits a wall")
+        x, y = x + dx, y + dy
+    return x, y
+
+
+class BfsTest(unittest.TestCase):
+    """BFS returns a shortest path rebuilt from parent pointers."""
+
+    def test_shortest_path(self) -> None:
+        for perfect in (True, False):
+            with self.subTest(perfect=perfect):
+                gen = generate("DFS", perfect, 8)
+                grid, maze = gen.get_grid(), gen.get_maze()
+                path = solve(grid, maze.entry, maze.exit, "BFS")
+                field = DistanceField.from_grid(grid, maze.exit)
+                self.assertEqual(len(path), field.at(*maze.entry))
+                self.assertEqual(
+                    gen.get_path_coords(maze.entry, path)[-1], maze.exit
+                )
+
+    def test_unreachable_goal(self) -> None:
+        self.assertEqual(solve(Grid(3, 1), (0, 0), (2, 0), "BFS"), "")
+
+    def test_start_is_goal(self) -> None:
+        self.assertEqual(solve(Grid(3, 1), (1, 0), (1, 0), "BFS"), "")
+
+
+class SolverAgreementTest(unittest.TestCase):
+    """Every SOLVER must return a valid path as short as the BFS one."""
+
+    def test_same_length_as_bfs(self) -> None:
+        for algo in ("DFS", "WILSON", "PRIM"):
+            for perfect in (True, False):
+                gen = generate(algo, perfect, 2)
+                grid, maze = gen.get_grid(), gen.get_maze()
+                expected = len(solve(grid, maze.entry, maze.exit, "BFS"))
+                for method in SEARCHES:
+                    with self.subTest(
+                        algo=algo, perfect=perfect, method=method
+                    ):
+                        path = solve(grid, maze.entry, maze.exit, method)
+                        self.assertEqual(len(path), expected)
+                        self.assertEqual(
+                            walk(grid, maze.entry, path), maze.exit
+                        )
+
+    def test_every_solver_reports_unreachable(self) -> None:
+        for method in SEARCHES:
+            with self.subTest(method=method):
+                self.assertEqual(
+                    solve(Grid(3, 1), (0, 0), (2, 0), method), ""
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
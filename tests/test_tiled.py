@@ -0,0 +1,41 @@
+import random
+import unittest
+from mazegen.distance import DistanceField
+from mazegen.grid import Grid, EAST, SOUTH
+from mazegen.tiled import tiled_dfs
+
+
+def carve(jobs: int) -> Grid:
+    """Carves a 37x29 grid, with a blocked square, in 8x8 tiles."""
+    grid = Grid(37, 29)
+    for y in range(12, 15):
+        for x in range(15, 19):
+            grid.mark_pattern(x, y)
+            grid.mark_visited(x, y)
+    tiled_dfs(grid, 8, random.Random("tiled"), jobs)
+    return grid
+
+
+class TiledDfsTest(unittest.TestCase):
+    """Stitched tiles must form one perfect maze whatever the workers."""
+
+    def test_perfect_maze(self) -> None:
+        grid = carve(2)
+        free = grid.width * grid.height - len(grid.pattern_cells())
+        field = DistanceField.from_grid(grid, (0, 0))
+        reached = sum(1 for v in field.values if v != field.unreachable)
+        passages = sum(
+            (not walls & EAST) + (not walls & SOUTH)
+            for walls in grid.wall_bytes()
+        )
+        self.assertEqual(reached, free)
+        self.assertEqual(passages, free - 1)
+        for x, y in grid.pattern_cells():
+            self.assertEqual(grid.walls(x, y), 15)
+
+    def test_independent_of_worker_count(self) -> None:
+        self.assertEqual(carve(1).wall_bytes(), carve(3).wall_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from mazegen import MazeGenerator
+from mazegen.distance import DistanceField
+
+
+def wilson(seed: int) -> MazeGenerator:
+    """Generates a 25x15 perfect Wilson maze."""
+    gen = MazeGenerator.from_params(
+        25, 15, (0, 0), (24, 14), True, seed, "WILSON", "unused.txt"
+    )
+    gen.generate_maze()
+    return gen
+
+
+class WilsonTest(unittest.TestCase):
+    """Wilson's algorithm must be a pure function of the seed."""
+
+    def test_same_seed_same_maze(self) -> None:
+        first, second = wilson(11), wilson(11)
+        self.assertEqual(
+            first.get_grid().wall_bytes(), second.get_grid().wall_bytes()
+        )
+        self.assertEqual(
+            first.get_solution_path(), second.get_solution_path()
+        )
+
+    def test_other_seed_other_maze(self) -> None:
+        self.assertNotEqual(
+            wilson(11).get_grid().wall_bytes(),
+            wilson(12).get_grid().wall_bytes()
+        )
+
+    def test_spanning_tree(self) -> None:
+        grid = wilson(3).get_grid()
+        free = grid.width * grid.height - len(grid.pattern_cells())
+        field = DistanceField.from_grid(grid, (0, 0))
+        reached = sum(1 for v in field.values if v != field.unreachable)
+        passages = sum(
+            bin(~walls & 0x6).count("1")
+            for walls in grid.wall_bytes()
+        )
+        self.assertEqual(reached, free)
+        self.assertEqual(passages, free - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()